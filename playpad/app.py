@@ -0,0 +1,230 @@
+import logging
+import sys
+import time
+
+import pygame
+
+from playpad.core import (WIDTH, Colors, GameStates, DrawList, HighScoreManager, IdleMonitor,
+                          InputLatency, QualityGovernor, Starfield, asset_cache, display, screen, warm_assets)
+from playpad.audio import audio
+from playpad.recorder import Recorder
+from playpad.registry import discover_games
+from playpad.scenes import Scene, MenuScene, SettingsScene, ExitConfirmScene
+from playpad.telemetry import telemetry
+from playpad.tuning import tuning
+
+logger = logging.getLogger("playpad")
+
+# Game scenes are not listed: they come from the registry and are imported on first use
+SCENES = {
+    GameStates.MENU: MenuScene,
+    GameStates.EXIT_CONFIRM: ExitConfirmScene,
+    GameStates.SETTINGS: SettingsScene,
+}
+
+# Owns the loop and the state shared between scenes
+class App:
+    def __init__(self):
+        display.open()
+        self.clock = pygame.time.Clock()
+        self.games = discover_games()
+        self.high_scores = HighScoreManager([entry.score_key for entry in self.games.values()])
+        self.scenes = {}
+        self.current_state = GameStates.MENU
+        self.difficulty = 1
+        self.running = True
+        self.fps = 60
+        self.frame_count = 0
+        # Set by the command line: stop after this many frames, never block
+        # waiting for input, record or replay the input
+        self.max_frames = None
+        self.idle_wait = True
+        self.journal = None
+        self.replay = None
+        # A SimulationThread when game ticks are pipelined with rendering
+        self.pipeline = None
+        self.animation_timer = 0
+        self.transition_alpha = 0
+        self.transition_state = None
+        self.warming = None
+        self.stars = Starfield()
+        self.enable_animations = True
+        self.arcade_mode = False
+        self.governor = QualityGovernor()
+        self.idle_monitor = IdleMonitor()
+        self.input_latency = InputLatency()
+        self.recorder = Recorder()
+        self.started = time.perf_counter()
+        tuning.reload()
+        telemetry.start()
+        audio.start()
+        telemetry.emit("app_start", games=len(self.games))
+        self.mouse_pos = (0, 0)
+        self.quality = self.governor.settings
+        self.animate_background = True
+        self.pulse_titles = True
+
+        # HUD surfaces
+        self.hud_surface = pygame.Surface((150, 80), pygame.SRCALPHA)
+        pygame.draw.rect(self.hud_surface, (*Colors.DARK_GRAY[:3], 200), (0, 0, 150, 80), border_radius=10)
+        pygame.draw.rect(self.hud_surface, Colors.NEON_BLUE, (0, 0, 150, 80), 2, border_radius=10)
+
+        self.draw_list = DrawList(screen)
+
+        # Map in the sprites recent runs used, building any the disk cache lacks
+        started = time.perf_counter()
+        warm_assets()
+        logger.info("Assets ready in %.0f ms (%d mapped, %d built)", (time.perf_counter() - started) * 1000,
+                    asset_cache.loaded, asset_cache.stored)
+
+    def scene(self, state) -> Scene:
+        scene = self.scenes.get(state)
+        if scene is None:
+            if state in SCENES:
+                scene = SCENES[state](self)
+            else:
+                entry = self.games[state]
+                scene = entry.load_scene()(self, entry)
+            self.scenes[state] = scene
+        return scene
+
+    def switch(self, state):
+        self.current_state = state
+
+    def fade_to(self, state):
+        if self.transition_state != state:
+            self.transition_state = state
+            self.warming = self.scene(state).warm()
+
+    def start_game(self, state: str):
+        self.scene(state).enter()
+        self.fade_to(state)
+
+    def launch(self, state: str):
+        # Straight into a game, without the menu or a fade
+        self.scene(state).enter()
+        self.switch(state)
+
+    def advance_transition(self):
+        if self.transition_state is not None:
+            self.transition_alpha += 20
+            if self.warming is not None:
+                try:
+                    next(self.warming)
+                except StopIteration:
+                    self.warming = None
+            if self.transition_alpha >= 255:
+                if self.warming is not None:
+                    for _ in self.warming:
+                        pass
+                    self.warming = None
+                self.current_state = self.transition_state
+                self.transition_state = None
+                self.transition_alpha = 255
+        elif self.transition_alpha > 0:
+            self.transition_alpha -= 20
+
+    def toggle_recording(self):
+        if self.recorder.recording:
+            self.recorder.stop()
+        else:
+            self.recorder.start(screen)
+
+    def run(self):
+        while self.running:
+            self.frame()
+            self.clock.tick(self.fps)
+
+            # Nothing on a static screen changes until input arrives
+            scene = self.scene(self.current_state)
+            static = (self.running and self.idle_wait and self.transition_state is None
+                      and self.transition_alpha <= 0 and not self.pipelined(scene) and scene.is_static())
+            if static:
+                self.idle_monitor.wait(scene.hover_rects())
+            self.idle_monitor.account(static)
+        self.shutdown()
+
+    def pipelined(self, scene: Scene) -> bool:
+        return self.pipeline is not None and getattr(scene, "pipelined", False)
+
+    def frame(self):
+        draw_list = self.draw_list
+        if self.pipeline is not None:
+            # The last tick has to land before input can reach the game
+            ticked = self.pipeline.finish()
+            if ticked is not None:
+                self.input_latency.applied(ticked.front.inputs)
+        self.governor.begin_frame()
+        tuning.poll()
+        self.quality = self.governor.settings
+        self.animate_background = self.enable_animations and self.quality["background"]
+        self.pulse_titles = self.enable_animations and self.quality["title_pulse"]
+
+        screen.fill(Colors.BLACK)
+        self.mouse_pos = display.mouse_pos()
+        self.animation_timer += 1
+
+        # Stars, unless the screen paints its own background over them
+        stars = self.quality["stars"]
+        if self.enable_animations and stars and not self.scene(self.current_state).draws_background():
+            self.stars.update(stars)
+            self.stars.draw(draw_list, stars)
+
+        self.advance_transition()
+
+        if self.replay is not None:
+            self.replay.feed(self.frame_count)
+        events = self.input_latency.poll()
+        if self.journal is not None:
+            self.journal.record(self.frame_count, events)
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.switch(GameStates.EXIT_CONFIRM)
+            elif event.type == pygame.VIDEORESIZE:
+                display.resize(event.size)
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                self.toggle_recording()
+                continue
+            self.scene(self.current_state).handle_event(event)
+
+        scene = self.scene(self.current_state)
+        if self.pipelined(scene):
+            self.pipeline.begin(scene)
+        else:
+            scene.update()
+        scene.render(draw_list)
+
+        # Draw transition overlay
+        if self.transition_alpha > 0:
+            draw_list.darken(self.transition_alpha)
+
+        draw_list.end_frame()
+        if self.recorder.recording:
+            self.recorder.capture(screen)
+            # Drawn after the capture so it stays out of the clip
+            pygame.draw.circle(screen, Colors.RED, (WIDTH - 20, 20), 8)
+        display.present()
+        self.input_latency.presented()
+        self.governor.end_frame()
+        self.frame_count += 1
+        if self.frame_count == self.max_frames or (self.replay is not None and self.frame_count >= self.replay.end):
+            self.running = False
+
+    def shutdown(self):
+        if self.pipeline is not None:
+            self.pipeline.stop()
+        self.idle_monitor.report()
+        self.input_latency.report()
+        self.recorder.stop(wait=True)
+        if self.journal is not None:
+            self.journal.close(self.frame_count)
+        asset_cache.save_manifest()
+        telemetry.emit("app_exit", seconds=round(time.perf_counter() - self.started, 1))
+        telemetry.stop()
+        audio.stop()
+        pygame.quit()
+        sys.exit()
+
+# Main game
+def main():
+    App().run()
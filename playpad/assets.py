@@ -0,0 +1,158 @@
+import ast
+import glob
+import hashlib
+import logging
+import mmap
+import multiprocessing
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import pygame
+
+logger = logging.getLogger("playpad")
+
+# On-disk asset cache. Procedural sprites, backgrounds and titles are pure
+# functions of their key (the builder's kind and arguments), so their pixels
+# are stored raw under a hash of the key and everything else that changes the
+# output: ASSET_VERSION, the pygame version, the font file. Files hold the
+# surface's own byte order, so loading is an mmap handed to
+# pygame.image.frombuffer with no decode or conversion; blitting from it is
+# as fast as from a surface drawn in memory.
+#
+# manifest.txt lists the keys recent runs asked for. At startup warm() builds
+# the ones without a file in a process pool, so a cold cache is generated in
+# parallel and a warm one is only mapped. PLAYPAD_ASSET_CACHE=0 turns the
+# cache off and every asset is built in memory as before.
+ASSET_VERSION = 1  # bump whenever a builder draws something different
+MAGIC = b"PPAS"
+HEADER = struct.Struct("<4sHH")
+CACHE_DIR = os.path.join("cache", "assets")
+MANIFEST = "manifest.txt"
+MANIFEST_LIMIT = 4096
+# A spawned worker takes about half a second to import pygame and the fonts,
+# longer than a few hundred builds, so small gaps are filled in this process
+MIN_PARALLEL = 256
+
+def native_format() -> str:
+    # The layout pygame gives SRCALPHA surfaces, as a frombuffer format name
+    shifts = pygame.Surface((1, 1), pygame.SRCALPHA).get_shifts()
+    return {(16, 8, 0, 24): "BGRA", (0, 8, 16, 24): "RGBA",
+            (8, 16, 24, 0): "ARGB"}.get(tuple(shifts), "RGBA")
+
+def build_assets(root: str, salt: tuple, keys: list) -> int:
+    # Runs in a pool worker; the builders need pygame and the fonts, which
+    # importing core sets up without a window
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    from playpad.core import ASSET_BUILDERS
+    cache = AssetCache(root, salt)
+    for key in keys:
+        cache.store(key, ASSET_BUILDERS[key[0]](*key[1:]))
+    return len(keys)
+
+class AssetCache:
+    def __init__(self, root: str = CACHE_DIR, salt=()):
+        self.root = root
+        self.salt = salt
+        self.format = native_format()
+        self.enabled = os.environ.get("PLAYPAD_ASSET_CACHE", "1") != "0"
+        self.used = {}  # keys asked for this run, in order
+        self.loaded = 0
+        self.stored = 0
+
+    def path(self, key) -> str:
+        if callable(self.salt):
+            # Worked out on first use; it may need the font list
+            self.salt = self.salt()
+        text = repr((ASSET_VERSION, self.format, self.salt, key))
+        name = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.root, name[:2], name + ".raw")
+
+    def load(self, key) -> Optional[pygame.Surface]:
+        if not self.enabled:
+            return None
+        self.used[key] = None
+        try:
+            with open(self.path(key), "rb") as f:
+                # Copy-on-write: nothing drawn on the surface reaches the file
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            return None
+        magic, width, height = HEADER.unpack_from(mapped) if len(mapped) >= HEADER.size else (None, 0, 0)
+        if magic != MAGIC or len(mapped) != HEADER.size + width * height * 4:
+            mapped.close()
+            return None
+        self.loaded += 1
+        # The surface keeps the mapping alive
+        return pygame.image.frombuffer(memoryview(mapped)[HEADER.size:], (width, height), self.format)
+
+    def store(self, key, surface: pygame.Surface):
+        if not self.enabled:
+            return
+        self.used[key] = None
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp, "wb") as f:
+                f.write(HEADER.pack(MAGIC, *surface.get_size()))
+                f.write(pygame.image.tobytes(surface, self.format))
+            os.replace(temp, path)
+            self.stored += 1
+        except OSError as e:
+            logger.warning("Could not cache asset %r: %s", key, e)
+
+    def manifest(self) -> list:
+        keys = []
+        try:
+            with open(os.path.join(self.root, MANIFEST), encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        keys.append(ast.literal_eval(line))
+                    except (ValueError, SyntaxError):
+                        pass
+        except OSError:
+            pass
+        return keys
+
+    def save_manifest(self):
+        if not self.enabled or not self.used:
+            return
+        # This run's keys go last, so the oldest fall off past the limit
+        keys = dict.fromkeys(key for key in self.manifest() if key not in self.used)
+        keys.update(self.used)
+        keys = list(keys)[-MANIFEST_LIMIT:]
+        path = os.path.join(self.root, MANIFEST)
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                f.write("".join(repr(key) + "\n" for key in keys))
+            os.replace(path + ".tmp", path)
+            # Files no listed key refers to (one-off captions, old versions) go
+            keep = {os.path.basename(self.path(key)) for key in keys}
+            for name in glob.glob(os.path.join(self.root, "*", "*.raw")):
+                if os.path.basename(name) not in keep:
+                    os.remove(name)
+        except OSError as e:
+            logger.warning("Could not save the asset manifest: %s", e)
+
+    def warm(self, builders: dict, workers: int = None) -> list:
+        # Builds what the manifest lists but the disk lacks; returns the
+        # manifest keys so the caller can map them in
+        if not self.enabled:
+            return []
+        keys = [key for key in self.manifest() if isinstance(key, tuple) and key and key[0] in builders]
+        missing = [key for key in keys if not os.path.exists(self.path(key))]
+        workers = min(workers or os.cpu_count() or 1, len(missing) // MIN_PARALLEL)
+        if workers > 1:
+            chunks = [missing[i::workers] for i in range(workers)]
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(workers, mp_context=context) as pool:
+                built = sum(pool.map(build_assets, [self.root] * workers, [self.salt] * workers, chunks))
+            logger.info("Asset cache: built %d assets in %d processes", built, workers)
+        else:
+            for key in missing:
+                self.store(key, builders[key[0]](*key[1:]))
+        return keys
@@ -0,0 +1,152 @@
+import logging
+import math
+import os
+import threading
+import time
+
+import numpy as np
+import pygame
+
+logger = logging.getLogger("playpad")
+
+# Sound effects. PlayPad ships no sound files: each clip is a few notes
+# synthesized with NumPy in the mixer's own sample format, built once when a
+# scene that uses it is entered and kept by name, so play() never decodes or
+# allocates. Playback goes to a fixed pool of mixer channels. A clip that
+# finds them all busy takes over the voice with the lowest priority, oldest
+# first, if that is no higher than its own; otherwise it is dropped. Each clip
+# also has a minimum interval, so a burst of brick breaks plays a few times
+# rather than once per brick.
+#
+# Works with SDL's dummy audio driver; with no audio device at all, or
+# PLAYPAD_AUDIO=0, every call is a no-op.
+CHANNELS = 8
+SAMPLE_RATE = 44100
+ATTACK_MS = 4
+# wave: sine, square or saw; notes: (Hz, ms); interval: ms before the clip plays again
+CLIPS = {
+    "paddle": {"wave": "square", "notes": [(330, 45)], "volume": 0.3, "priority": 1, "interval": 50},
+    "brick": {"wave": "square", "notes": [(880, 30), (1320, 40)], "volume": 0.25, "priority": 1, "interval": 35},
+    "fruit": {"wave": "sine", "notes": [(660, 50), (990, 70)], "volume": 0.5, "priority": 2, "interval": 50},
+    "match": {"wave": "sine", "notes": [(523, 60), (659, 60), (784, 110)], "volume": 0.5, "priority": 2,
+              "interval": 100},
+    "wrong": {"wave": "saw", "notes": [(196, 120), (147, 200)], "volume": 0.35, "priority": 2, "interval": 150},
+    "level_complete": {"wave": "square", "notes": [(523, 90), (659, 90), (784, 90), (1047, 260)], "volume": 0.3,
+                       "priority": 3, "interval": 1000},
+}
+
+def synthesize(clip: dict, rate: int) -> np.ndarray:
+    # Mono samples in [-1, 1]; every note starts with a short ramp and decays
+    notes = []
+    for frequency, ms in clip["notes"]:
+        t = np.arange(int(rate * ms / 1000)) / rate
+        phase = (t * frequency) % 1.0
+        if clip["wave"] == "square":
+            wave = np.where(phase < 0.5, 1.0, -1.0)
+        elif clip["wave"] == "saw":
+            wave = 2.0 * phase - 1.0
+        else:
+            wave = np.sin(2 * math.pi * phase)
+        envelope = np.exp(-4.0 * t / t[-1]) * np.minimum(1.0, t * 1000 / ATTACK_MS)
+        notes.append(wave * envelope)
+    return np.concatenate(notes) * clip["volume"]
+
+def to_samples(wave: np.ndarray, size: int, channels: int) -> bytes:
+    # In the format pygame.mixer.get_init() reports: size is bits, negative for signed
+    bits = abs(size)
+    if bits == 32:
+        samples = wave.astype(np.float32)
+    else:
+        peak = (1 << (bits - 1)) - 1
+        samples = np.round(wave * peak)
+        if size > 0:
+            samples += peak + 1
+        samples = samples.astype(f"{'<i' if size < 0 else '<u'}{bits // 8}")
+    return np.repeat(samples, channels).tobytes()
+
+class AudioManager:
+    def __init__(self, channels: int = CHANNELS):
+        self.channel_count = channels
+        self.enabled = False
+        self.muted = False
+        self.format = None
+        self.sounds = {}
+        self.channels = []
+        # (priority, started) of the clip last put on each channel
+        self.voices = []
+        self.last_played = {}
+        self.lock = threading.Lock()
+        self.played = self.stolen = self.limited = self.dropped = 0
+
+    def start(self):
+        if self.enabled or os.environ.get("PLAYPAD_AUDIO", "1") == "0":
+            return
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init(SAMPLE_RATE, -16, 2, 512)
+        except pygame.error as e:
+            logger.info("No sound: %s", e)
+            return
+        self.format = pygame.mixer.get_init()
+        pygame.mixer.set_num_channels(self.channel_count)
+        self.channels = [pygame.mixer.Channel(i) for i in range(self.channel_count)]
+        self.voices = [(0, 0.0)] * self.channel_count
+        self.enabled = True
+
+    def preload(self, names):
+        if not self.enabled:
+            return
+        started = time.perf_counter()
+        rate, size, channels = self.format
+        built = 0
+        for name in names:
+            if name not in self.sounds:
+                self.sounds[name] = pygame.mixer.Sound(buffer=to_samples(synthesize(CLIPS[name], rate), size, channels))
+                built += 1
+        if built:
+            logger.info("Audio: %d clips ready in %.1f ms", built, (time.perf_counter() - started) * 1000)
+
+    def voice(self, priority: int):
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return i
+        victim = min(range(len(self.voices)), key=self.voices.__getitem__)
+        if self.voices[victim][0] > priority:
+            return None
+        self.channels[victim].stop()
+        self.stolen += 1
+        return victim
+
+    def play(self, name: str):
+        if not self.enabled or self.muted:
+            return
+        clip = CLIPS[name]
+        now = time.perf_counter()
+        # The pipelined simulation thread plays sounds too
+        with self.lock:
+            if now - self.last_played.get(name, -math.inf) < clip["interval"] / 1000:
+                self.limited += 1
+                return
+            sound = self.sounds.get(name)
+            if sound is None:
+                logger.warning("Audio: %r was not preloaded", name)
+                self.preload((name,))
+                sound = self.sounds[name]
+            i = self.voice(clip["priority"])
+            if i is None:
+                self.dropped += 1
+                return
+            self.channels[i].play(sound)
+            self.voices[i] = (clip["priority"], now)
+            self.last_played[name] = now
+            self.played += 1
+
+    def stop(self):
+        if not self.enabled:
+            return
+        logger.info("Audio: %d played, %d stolen, %d rate-limited, %d dropped", self.played, self.stolen,
+                    self.limited, self.dropped)
+        pygame.mixer.stop()
+        self.enabled = False
+
+audio = AudioManager()
@@ -0,0 +1,192 @@
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+logger = logging.getLogger("playpad")
+
+# Command line. Arguments are parsed before pygame is imported, and each mode
+# imports only what it uses: --headless swaps SDL to its dummy drivers before
+# anything opens a window, the env benchmarks never build the app, and fonts
+# and assets are only loaded by the code that draws them.
+#
+#   python game.py --game snake --difficulty 3
+#   python game.py --headless --game memory --replay session.jsonl
+#   python game.py --bench block_buster --frames 1200 --profile
+#   python game.py --bench multiball --quality high
+#   python game.py --bench snake-env
+#   python game.py --bench snake --pipelined
+ENV_BENCHMARKS = {
+    "snake-env": "playpad.games.snake.env:SnakeVecEnv",
+    "block-buster-env": "playpad.games.block_buster.env:BlockBusterVecEnv",
+}
+
+# QUALITY_TIERS names, kept here so parsing the arguments does not load pygame
+QUALITY_NAMES = ("high", "medium", "low", "minimal")
+
+def multiball(app):
+    # Arcade Block Buster held at its 500-ball cap, with bricks always left to hit
+    from playpad.core import WIDTH
+
+    game = app.scene("block_buster").game
+    while game.balls.add(random.uniform(100, WIDTH - 100), random.uniform(250, 450), random.choice((-5, 5)), -5,
+                         game.ball_radius):
+        pass
+    if len(game.blocks) == 0:
+        game.level_complete = False
+        game.create_blocks()
+
+# Frame benchmarks that hold a game in a heavy state: name -> (game, arcade mode, run before every frame)
+FRAME_BENCHMARKS = {
+    "multiball": ("block_buster", True, multiball),
+}
+
+def percentile(values, q: float):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+def bench_env(target: str, steps: int, num_envs: int = 1024) -> str:
+    import numpy as np
+    from playpad.registry import load_object
+
+    env = load_object(target)(num_envs, seed=0)
+    actions = np.random.default_rng(0).integers(0, env.num_actions, (steps, num_envs))
+    env.reset()
+    started = time.perf_counter()
+    for step_actions in actions:
+        env.step(step_actions)
+    elapsed = time.perf_counter() - started
+    return f"{steps} steps of {num_envs} envs in {elapsed:.2f} s, {steps * num_envs / elapsed:,.0f} env steps/s"
+
+def bench_frames(app, scenario: str, frames: int) -> str:
+    import pygame
+    from playpad.soak import INPUTS
+
+    state, app.arcade_mode, prepare = FRAME_BENCHMARKS.get(scenario, (scenario, False, None))
+    if state != "menu":
+        app.launch(state)
+    inputs = INPUTS.get(state)
+    times = []
+    for _ in range(frames):
+        if prepare is not None:
+            prepare(app)
+        if inputs is not None and app.current_state == state:
+            for event in inputs():
+                pygame.event.post(event)
+        started = time.perf_counter()
+        app.frame()
+        times.append((time.perf_counter() - started) * 1000)
+    mean = sum(times) / len(times)
+    return (f"{frames} frames, mean {mean:.2f} ms, p50 {percentile(times, 0.5):.2f} ms, "
+            f"p99 {percentile(times, 0.99):.2f} ms, max {max(times):.2f} ms ({1000 / mean:.0f} fps unthrottled)")
+
+def run(args, started: float):
+    if args.bench in ENV_BENCHMARKS:
+        result = bench_env(ENV_BENCHMARKS[args.bench], args.frames or 300)
+        print(f"{args.bench}: {result}; first step {time.perf_counter() - started:.2f} s after launch")
+        return
+
+    from playpad.app import App
+    from playpad.replay import InputRecorder, InputReplayer
+
+    replay = InputReplayer(args.replay) if args.replay else None
+    if replay is not None:
+        header = replay.header
+        args.game = args.game or header.get("game")
+        args.difficulty = args.difficulty or header.get("difficulty")
+        args.seed = header.get("seed") if args.seed is None else args.seed
+        args.fps = header.get("fps") if args.fps is None else args.fps
+    if args.record and args.seed is None:
+        # A replay needs the seed even when none was asked for
+        args.seed = random.randrange(1 << 32)
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    app = App()
+    app.difficulty = args.difficulty or 1
+    if args.pipelined:
+        from playpad.pipeline import SimulationThread
+        app.pipeline = SimulationThread()
+    if args.fps is not None:
+        app.fps = args.fps
+    if args.quality != "auto":
+        # A fixed tier, so benchmarks compare the same work from frame to frame
+        app.governor.auto = False
+        app.governor.set_tier(QUALITY_NAMES.index(args.quality), "--quality")
+    # Nothing outside the process can wake a headless or scripted run
+    app.idle_wait = not (args.headless or args.bench or replay)
+
+    if args.bench is not None:
+        app.frame()
+        first_tick = time.perf_counter() - started
+        result = bench_frames(app, args.bench, args.frames or 600)
+        print(f"{args.bench}: {result} at {app.governor.label()}; first tick {first_tick:.2f} s after launch")
+        app.running = False
+        return
+
+    if args.game is not None:
+        app.launch(args.game)
+    app.max_frames = args.frames
+    app.replay = replay
+    if args.record:
+        app.journal = InputRecorder(args.record, seed=args.seed, game=args.game, difficulty=app.difficulty,
+                                    fps=app.fps)
+    app.run()
+
+def main(argv=None):
+    started = time.perf_counter()
+    parser = argparse.ArgumentParser(prog="game.py", description="PlayPad game station")
+    parser.add_argument("--game", help="start in this game instead of the menu")
+    parser.add_argument("--difficulty", type=int, choices=(1, 2, 3))
+    parser.add_argument("--fps", type=int, help="frame cap, 0 for none (default 60)")
+    parser.add_argument("--headless", action="store_true", help="no window and no audio device")
+    parser.add_argument("--frames", type=int, help="stop after this many frames (benchmarks: frames or steps to time)")
+    parser.add_argument("--seed", type=int, help="seed the game RNG")
+    parser.add_argument("--quality", choices=("auto", *QUALITY_NAMES), default="auto",
+                        help="pin the quality tier instead of adapting it (default auto)")
+    parser.add_argument("--pipelined", action="store_true",
+                        help="run game ticks on their own thread, one frame ahead of rendering")
+    parser.add_argument("--record", metavar="PATH", help="write the session's input to PATH")
+    parser.add_argument("--replay", metavar="PATH", help="play back input recorded with --record")
+    parser.add_argument("--bench", metavar="SCENARIO",
+                        help=f"time a scenario: menu, a game key or one of "
+                             f"{', '.join([*FRAME_BENCHMARKS, *ENV_BENCHMARKS])}")
+    parser.add_argument("--profile", nargs="?", const="playpad.prof", metavar="PATH",
+                        help="run under cProfile and save the stats (default playpad.prof)")
+    args = parser.parse_args(argv)
+    if args.record and args.replay:
+        parser.error("--record and --replay cannot be combined")
+    # The registry only reads game metadata, so this is checked before pygame loads
+    from playpad.registry import discover_games
+    games = discover_games()
+    if args.game is not None and args.game not in games:
+        parser.error(f"unknown game {args.game!r}; choose from {', '.join(sorted(games))}")
+    scenarios = ["menu", *sorted(games), *FRAME_BENCHMARKS, *ENV_BENCHMARKS]
+    if args.bench is not None and args.bench not in scenarios:
+        parser.error(f"unknown benchmark {args.bench!r}; choose from {', '.join(scenarios)}")
+    if args.bench in FRAME_BENCHMARKS and args.pipelined:
+        # The setup touches the game between frames, while a pipelined tick may be running
+        parser.error(f"--bench {args.bench} cannot be pipelined")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    if args.headless or args.bench:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    if args.bench:
+        # Benchmarks leave no telemetry behind
+        os.environ["PLAYPAD_TELEMETRY"] = "0"
+
+    if args.profile is None:
+        return run(args, started)
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(run, args, started)
+    finally:
+        profiler.dump_stats(args.profile)
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(25)
+        logger.info("Profile saved to %s", args.profile)
@@ -0,0 +1,780 @@
+import numpy as np
+import pygame
+import random
+import time
+import json
+import math
+import logging
+from collections import deque
+from functools import lru_cache
+from typing import List, Dict, NamedTuple, Tuple
+
+from playpad.assets import AssetCache
+
+# Initialize pygame
+pygame.init()
+
+# Screen dimensions
+WIDTH, HEIGHT = 800, 600
+
+logger = logging.getLogger("playpad")
+
+# Layout and physics use a fixed logical WIDTH x HEIGHT frame. Display renders it
+# off-screen and presents it to a window of any size: "gpu" leaves the upscale to
+# SDL's renderer through pygame.SCALED, "fast" and "smooth" letterbox it with
+# transform.scale / transform.smoothscale once per frame. The window opens when
+# the App starts, so code that only imports core (the environments, the
+# server, asset builders) never calls set_mode.
+class Display:
+    SCALE_MODES = ("gpu", "fast", "smooth")
+
+    def __init__(self, scale_mode: str = "gpu", window_size: Tuple[int, int] = (WIDTH, HEIGHT), fullscreen: bool = False):
+        self.surface = pygame.Surface((WIDTH, HEIGHT))
+        self.scale_mode = scale_mode
+        self.window_size = window_size
+        self.fullscreen = fullscreen
+        self.window = None
+        self.viewport = pygame.Rect(0, 0, WIDTH, HEIGHT)
+        self.target = None
+
+    def open(self):
+        if self.window is None:
+            self.configure()
+            pygame.display.set_caption("4-in-1 Game Station")
+
+    def configure(self, scale_mode: str = None, window_size: Tuple[int, int] = None, fullscreen: bool = None):
+        if scale_mode is not None:
+            self.scale_mode = scale_mode
+        if window_size is not None:
+            self.window_size = window_size
+        if fullscreen is not None:
+            self.fullscreen = fullscreen
+        if self.scale_mode not in self.SCALE_MODES:
+            raise ValueError(f"Unknown scale mode: {self.scale_mode}")
+
+        if self.scale_mode == "gpu":
+            flags = pygame.SCALED | (pygame.FULLSCREEN if self.fullscreen else 0)
+            try:
+                self.window = pygame.display.set_mode((WIDTH, HEIGHT), flags)
+            except pygame.error as error:
+                logger.warning("Hardware scaling unavailable (%s), falling back to software", error)
+                self.scale_mode = "fast"
+        if self.scale_mode != "gpu":
+            if self.fullscreen:
+                self.window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            else:
+                self.window = pygame.display.set_mode(self.window_size, pygame.RESIZABLE)
+        window_width, window_height = self.window.get_size()
+        scale = min(window_width / WIDTH, window_height / HEIGHT)
+        self.viewport = pygame.Rect(0, 0, int(WIDTH * scale), int(HEIGHT * scale))
+        self.viewport.center = (window_width // 2, window_height // 2)
+        self.window.fill((0, 0, 0))
+        self.target = self.window.subsurface(self.viewport)
+
+    def toggle_fullscreen(self):
+        self.configure(fullscreen=not self.fullscreen)
+
+    def resize(self, size: Tuple[int, int]):
+        # SCALED windows keep their size; only the letterboxed modes are resizable
+        if self.scale_mode != "gpu" and not self.fullscreen:
+            self.configure(window_size=size)
+
+    def present(self):
+        if self.viewport.size == self.surface.get_size():
+            self.target.blit(self.surface, (0, 0))
+        elif self.scale_mode == "smooth":
+            pygame.transform.smoothscale(self.surface, self.viewport.size, self.target)
+        else:
+            pygame.transform.scale(self.surface, self.viewport.size, self.target)
+        pygame.display.flip()
+
+    def to_logical(self, pos) -> Tuple[int, int]:
+        return ((pos[0] - self.viewport.x) * WIDTH // self.viewport.width,
+                (pos[1] - self.viewport.y) * HEIGHT // self.viewport.height)
+
+    def mouse_pos(self) -> Tuple[int, int]:
+        return self.to_logical(pygame.mouse.get_pos())
+
+display = Display()
+screen = display.surface
+
+# Constants
+class Colors:
+    WHITE = (255, 255, 255)
+    BLACK = (0, 0, 0)
+    RED = (255, 0, 0)
+    GREEN = (0, 255, 0)
+    BLUE = (0, 0, 255)
+    YELLOW = (255, 255, 0)
+    PURPLE = (128, 0, 128)
+    CYAN = (0, 255, 255)
+    ORANGE = (255, 165, 0)
+    DARK_GRAY = (30, 30, 30)
+    LIGHT_GRAY = (200, 200, 200)
+    NEON_BLUE = (0, 200, 255)
+    NEON_PINK = (255, 0, 200)
+
+# Fonts load on first use: finding a system font scans every installed font
+# (fc-list on Linux), which runs that never draw text should not pay for
+class LazyFont:
+    def __init__(self, size: int, bold: bool = False):
+        self.size = size
+        self.bold = bold
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner) -> pygame.font.Font:
+        try:
+            font = pygame.font.SysFont('orbitron', self.size, bold=self.bold)
+        except Exception:
+            font = pygame.font.SysFont('comicsans', self.size, bold=self.bold)
+        # Replaces this descriptor, so later lookups are plain attributes
+        setattr(owner, self.name, font)
+        return font
+
+class Fonts:
+    title = LazyFont(60, bold=True)
+    menu = LazyFont(36)
+    game = LazyFont(28)
+    small = LazyFont(20)
+
+# Game states
+# Games are not listed here: a game's state is its registry key
+class GameStates:
+    MENU = 0
+    EXIT_CONFIRM = 5
+    SETTINGS = 6
+
+# Utility functions
+def create_gradient_surface(size, color1, color2, vertical=True):
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+
+    
+    for i in range(size[1 if vertical else 0]):
+        ratio = i / (size[1 if vertical else 0] - 1)
+        r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
+        g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
+        b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
+        if vertical:
+            pygame.draw.line(surface, (r, g, b), (0, i), (size[0], i))
+        else:
+            pygame.draw.line(surface, (r, g, b), (i, 0), (i, size[1]))
+    return surface
+
+# Every procedural asset is a pure function of its key, kind first and then
+# the builder's arguments; load_asset() maps it in from the disk cache or
+# builds it and stores it there. The font file is part of the salt because it
+# changes every glyph.
+def asset_salt() -> tuple:
+    return (pygame.version.ver, pygame.font.match_font('orbitron', bold=True) or pygame.font.get_default_font())
+
+asset_cache = AssetCache(salt=asset_salt)
+
+def load_asset(key) -> pygame.Surface:
+    if key[0] in MEMORY_KINDS:
+        return ASSET_BUILDERS[key[0]](*key[1:])
+    surface = asset_cache.load(key)
+    if surface is None:
+        surface = ASSET_BUILDERS[key[0]](*key[1:])
+        asset_cache.store(key, surface)
+    return surface
+
+def build_gradient_text(text, font, color1, color2):
+    surface = font.render(text, True, color1)
+    grad = create_gradient_surface((surface.get_width(), surface.get_height()), color1, color2, False)
+    surface.blit(grad, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    return surface
+
+def build_title(text, color1, color2):
+    return build_gradient_text(text, Fonts.title, color1, color2)
+
+# Draw code asks for the same gradients and captions every frame, so these
+# return shared surfaces from small LRU caches; treat them as read-only.
+# Only fixed captions pass persist=True and go to the disk cache, text that
+# changes with play (scrambled words, level numbers) stays in memory
+@lru_cache(maxsize=16)
+def cached_gradient_surface(size, color1, color2, vertical=True):
+    return load_asset(("gradient", size, color1, color2, vertical))
+
+@lru_cache(maxsize=256)
+def render_text_with_gradient(text, font, color1, color2, persist=False):
+    if persist and font is Fonts.title:
+        return load_asset(("title", text, color1, color2))
+    return build_gradient_text(text, font, color1, color2)
+
+# Pulsing titles snap to a few fixed scale steps so each size is built once;
+# scale 1.0 hands back the surface itself
+PULSE_STEP = 0.02
+
+@lru_cache(maxsize=64)
+def scaled_step(surface, step):
+    scale = 1.0 + step * PULSE_STEP
+    return pygame.transform.scale(surface, (int(surface.get_width() * scale), int(surface.get_height() * scale)))
+
+def pulsed(surface, scale):
+    step = round((scale - 1.0) / PULSE_STEP)
+    return scaled_step(surface, step) if step else surface
+
+@lru_cache(maxsize=256)
+def render_text_with_shadow(text, font, color, shadow_color, shadow_offset=(2, 2)):
+    shadow = font.render(text, True, shadow_color)
+    main = font.render(text, True, color)
+    surface = pygame.Surface((main.get_width() + shadow_offset[0], main.get_height() + shadow_offset[1]), pygame.SRCALPHA)
+    surface.blit(shadow, shadow_offset)
+    surface.blit(main, (0, 0))
+    return surface
+
+# Texture atlas: every procedural sprite is loaded once, on first use, into
+# one shared surface and drawn afterwards as an area blit from it
+class SpriteAtlas:
+    def __init__(self, width=1024, height=1024, padding=1):
+        self.padding = padding
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.rects = {}
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+
+    def get(self, key) -> pygame.Rect:
+        rect = self.rects.get(key)
+        if rect is None:
+            sprite = load_asset(key)
+            rect = self.pack(sprite.get_size())
+            self.surface.fill((0, 0, 0, 0), rect)
+            self.surface.blit(sprite, rect)
+            self.rects[key] = rect
+        return rect
+
+    def pack(self, size) -> pygame.Rect:
+        width, height = size[0] + self.padding, size[1] + self.padding
+        if width > self.surface.get_width():
+            raise ValueError(f"Sprite of size {size} does not fit in the atlas")
+        if self.shelf_x + width > self.surface.get_width():
+            self.shelf_y += self.shelf_height
+            self.shelf_x = 0
+            self.shelf_height = 0
+        while self.shelf_y + height > self.surface.get_height():
+            self.grow()
+        rect = pygame.Rect(self.shelf_x, self.shelf_y, size[0], size[1])
+        self.shelf_x += width
+        self.shelf_height = max(self.shelf_height, height)
+        return rect
+
+    def grow(self):
+        surface = pygame.Surface((self.surface.get_width(), self.surface.get_height() * 2), pygame.SRCALPHA)
+        surface.blit(self.surface, (0, 0))
+        self.surface = surface
+
+    def rebuild(self):
+        # Sprite sizes depend on the layout, so after a resolution change
+        # everything is dropped and re-rendered lazily at the new sizes
+        self.surface = pygame.Surface(self.surface.get_size(), pygame.SRCALPHA)
+        self.rects.clear()
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+
+atlas = SpriteAtlas()
+
+def build_tile(size, color1, color2, border_width, border_radius):
+    surface = create_gradient_surface(size, color1, color2)
+    if border_width:
+        pygame.draw.rect(surface, Colors.WHITE, (0, 0, *size), border_width, border_radius=border_radius)
+    return surface
+
+def build_panel(size, border_color, border_width, border_radius):
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(surface, Colors.DARK_GRAY, (0, 0, *size), border_radius=border_radius)
+    pygame.draw.rect(surface, border_color, (0, 0, *size), border_width, border_radius=border_radius)
+    return surface
+
+def build_circle(radius, color, outline_color):
+    surface = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+    if radius:
+        pygame.draw.circle(surface, color, (radius, radius), radius)
+    else:
+        # A single pixel, which draw.circle leaves empty
+        surface.fill(color)
+    if outline_color:
+        pygame.draw.circle(surface, outline_color, (radius, radius), radius, 1)
+    return surface
+
+def build_particle(color, shape, size):
+    surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    if shape == 'circle':
+        pygame.draw.circle(surface, color, (size, size), size)
+    elif shape == 'square':
+        pygame.draw.rect(surface, color, (0, 0, size * 2, size * 2))
+    return surface
+
+def build_card(size, color, symbol, scaled_size):
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(surface, color, (0, 0, *size), border_radius=5)
+    if symbol is not None:
+        symbol_text = render_text_with_shadow(str(symbol), Fonts.game, Colors.BLACK, Colors.WHITE)
+        fit = min(1, size[0] / symbol_text.get_width(), size[1] / symbol_text.get_height())
+        if fit < 1:
+            symbol_text = pygame.transform.smoothscale(symbol_text, (max(1, int(symbol_text.get_width() * fit)),
+                                                                     max(1, int(symbol_text.get_height() * fit))))
+        surface.blit(symbol_text, (size[0] // 2 - symbol_text.get_width() // 2,
+                                   size[1] // 2 - symbol_text.get_height() // 2))
+    if scaled_size != size:
+        surface = pygame.transform.scale(surface, scaled_size)
+    return surface
+
+def build_button(size, color, scaled_size):
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(surface, color, (0, 0, *size), border_radius=10)
+    pygame.draw.rect(surface, Colors.WHITE, (0, 0, *size), 2, border_radius=10)
+    if scaled_size != size:
+        surface = pygame.transform.scale(surface, scaled_size)
+    return surface
+
+def build_heart():
+    return render_text_with_shadow('❤', Fonts.game, Colors.RED, Colors.BLACK)
+
+ASSET_BUILDERS = {
+    "gradient": create_gradient_surface,
+    "title": build_title,
+    "tile": build_tile,
+    "panel": build_panel,
+    "circle": build_circle,
+    "particle": build_particle,
+    "card": build_card,
+    "button": build_button,
+    "heart": build_heart,
+}
+# Kinds that live in the atlas and are mapped in when the app starts
+ATLAS_KINDS = {"tile", "panel", "circle", "particle", "card", "button", "heart"}
+# Particles come in hundreds of colour and alpha variants and draw faster
+# (about 1us) than a cached file maps in (about 20us), so they skip the disk
+MEMORY_KINDS = {"particle"}
+
+def warm_assets(workers: int = None):
+    for key in asset_cache.warm(ASSET_BUILDERS, workers):
+        if key[0] in ATLAS_KINDS:
+            atlas.get(key)
+
+def tile_sprite(size, color1, color2, border_width=1, border_radius=5) -> pygame.Rect:
+    return atlas.get(("tile", size, color1, color2, border_width, border_radius))
+
+def panel_sprite(size, border_color, border_width=2, border_radius=10) -> pygame.Rect:
+    return atlas.get(("panel", size, border_color, border_width, border_radius))
+
+def circle_sprite(radius, color, outline_color=None) -> pygame.Rect:
+    return atlas.get(("circle", radius, color, outline_color))
+
+def particle_sprite(color, shape, size, alpha) -> pygame.Rect:
+    # Alpha is quantized to 16 levels to keep the number of variants small
+    alpha = min(255, (alpha + 8) // 16 * 16)
+    return atlas.get(("particle", (*color[:3], alpha), shape, size))
+
+def card_sprite(size, color, symbol, scale) -> pygame.Rect:
+    scaled_size = (int(size[0] * scale), int(size[1] * scale))
+    return atlas.get(("card", size, color, symbol, scaled_size))
+
+def button_sprite(size, color, scale) -> pygame.Rect:
+    scaled_size = (int(size[0] * scale), int(size[1] * scale))
+    return atlas.get(("button", size, color, scaled_size))
+
+def heart_sprite() -> pygame.Rect:
+    return atlas.get(("heart",))
+
+# Per-frame draw list: game code queues blits and the renderer submits them
+# in one Surface.blits call. blits() takes per-entry blend flags, so queued
+# entries keep their painter's order; flush() before drawing on the target
+# directly.
+class DrawList:
+    def __init__(self, target):
+        self.target = target
+        self.entries = []
+        self.shade = None
+        self.frame_blits = 0
+        self.frame_flushes = 0
+        self.last_frame_blits = 0
+        self.last_frame_flushes = 0
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        self.entries.append((source, dest, area, special_flags))
+
+    def flush(self):
+        if self.entries:
+            self.target.blits(self.entries, doreturn=False)
+            self.frame_blits += len(self.entries)
+            self.frame_flushes += 1
+            self.entries.clear()
+
+    def blit_many(self, source, dests, area=None, special_flags=0):
+        self.entries.extend((source, dest, area, special_flags) for dest in dests)
+
+    def darken(self, alpha: int):
+        # Blends black over everything drawn so far. One opaque surface with a
+        # surface alpha serves every overlay, so it is blitted right away
+        # instead of queued with an alpha a later darken() could change
+        self.flush()
+        if self.shade is None or self.shade.get_size() != self.target.get_size():
+            self.shade = pygame.Surface(self.target.get_size()).convert(self.target)
+            self.shade.fill(Colors.BLACK)
+        self.shade.set_alpha(alpha)
+        self.target.blit(self.shade, (0, 0))
+
+    def end_frame(self):
+        self.flush()
+        self.last_frame_blits = self.frame_blits
+        self.last_frame_flushes = self.frame_flushes
+        self.frame_blits = 0
+        self.frame_flushes = 0
+
+# Entity storage shared by the games. Records are recycled through a free list,
+# live records stay packed in one list and despawn is an O(1) swap-remove.
+# Iterate with reversed(pool) when despawning during the loop. A pool with a
+# capacity ignores spawns once full and returns None.
+class PoolRecord:
+    __slots__ = ('slot', 'generation', 'index')
+
+class EntityPool:
+    def __init__(self, record_type, capacity: int = None):
+        self.record_type = record_type
+        self.capacity = capacity
+        self.records = []
+        self.live = []
+        self.free = []
+
+    def spawn(self, *args):
+        if self.capacity is not None and len(self.live) >= self.capacity:
+            return None
+        if self.free:
+            record = self.records[self.free.pop()]
+        else:
+            record = self.record_type()
+            record.slot = len(self.records)
+            record.generation = 0
+            self.records.append(record)
+        record.generation += 1
+        record.index = len(self.live)
+        self.live.append(record)
+        record.setup(*args)
+        return record
+
+    def despawn(self, record):
+        last = self.live.pop()
+        if last is not record:
+            self.live[record.index] = last
+            last.index = record.index
+        record.index = -1
+        self.free.append(record.slot)
+
+    def clear(self):
+        for record in self.live:
+            record.index = -1
+            self.free.append(record.slot)
+        self.live.clear()
+
+    def handle(self, record) -> int:
+        return record.generation << 24 | record.slot
+
+    def get(self, handle: int):
+        slot = handle & 0xFFFFFF
+        if slot < len(self.records):
+            record = self.records[slot]
+            if record.index >= 0 and record.generation == handle >> 24:
+                return record
+        return None
+
+    def __len__(self):
+        return len(self.live)
+
+    def __iter__(self):
+        return iter(self.live)
+
+    def __reversed__(self):
+        return reversed(self.live)
+
+    def __getitem__(self, index: int):
+        return self.live[index]
+
+MAX_PARTICLES = 400
+
+class Particle(PoolRecord):
+    __slots__ = ('x', 'y', 'vx', 'vy', 'color', 'lifetime', 'size', 'shape', 'alpha')
+
+    def setup(self, x, y, color, shape='circle'):
+        self.x = x
+        self.y = y
+        self.vx = random.uniform(-3, 3)
+        self.vy = random.uniform(-3, 3)
+        self.color = color
+        self.lifetime = random.randint(20, 50)
+        self.size = random.randint(3, 8)
+        self.shape = shape
+        self.alpha = 255
+
+    def update(self):
+        self.x += self.vx
+        self.y += self.vy
+        self.lifetime -= 1
+        self.alpha = max(0, int(255 * (self.lifetime / 50)))
+
+    def draw(self, surface):
+        if self.lifetime > 0:
+            surface.blit(atlas.surface, (int(self.x - self.size), int(self.y - self.size)),
+                         particle_sprite(self.color, self.shape, self.size, self.alpha))
+
+def update_particles(particles: EntityPool):
+    for p in reversed(particles):
+        p.update()
+        if p.lifetime <= 0:
+            particles.despawn(p)
+
+# Immutable copy of a particle for the pipelined renderer; draws like the original
+class ParticleView(NamedTuple):
+    x: float
+    y: float
+    color: tuple
+    shape: str
+    size: int
+    alpha: int
+    lifetime: int
+
+    draw = Particle.draw
+
+def capture_particles(particles: EntityPool) -> tuple:
+    return tuple(ParticleView(p.x, p.y, p.color, p.shape, p.size, p.alpha, p.lifetime) for p in particles)
+
+# Parallax starfield. Each depth layer keeps its stars' positions and speeds
+# in NumPy arrays and moves them in one vectorized step. Far layers are single
+# pixels written straight into the frame; near layers are pre-rendered atlas
+# sprites queued as one batch of blits. A blit costs about ten pixel writes,
+# so the sprite layers are capped and a denser field only adds pixel stars.
+# A field of `count` stars shows each layer's share of it. High draws
+# MAX_STARS: update + draw measured 0.175 ms, against 0.095 ms for the old 50
+# Star objects. 5000 took 0.33 ms, more than the background is worth, so no
+# tier asks for it.
+MAX_STARS = 1500
+# radius 0 is a single pixel; max caps the layer whatever the count
+STAR_LAYERS = [
+    {"share": 0.6, "speed": (0.2, 0.5), "color": (80, 80, 110), "radius": 0},
+    {"share": 0.3, "speed": (0.5, 1.0), "color": (150, 150, 180), "radius": 0},
+    {"share": 0.07, "max": 40, "speed": (1.0, 1.6), "color": Colors.WHITE, "radius": 1},
+    {"share": 0.03, "max": 10, "speed": (1.6, 2.2), "color": Colors.WHITE, "radius": 2},
+]
+
+class StarLayer:
+    def __init__(self, settings: dict, capacity: int):
+        self.share = settings["share"]
+        self.color = settings["color"]
+        self.radius = settings["radius"]
+        capacity = min(settings.get("max", capacity), math.ceil(capacity * self.share))
+        self.x = np.random.uniform(0, WIDTH, capacity)
+        self.y = np.random.uniform(0, HEIGHT, capacity)
+        self.speed = np.random.uniform(*settings["speed"], capacity)
+
+    def visible(self, count: int) -> int:
+        return min(len(self.x), round(count * self.share))
+
+    def update(self, count: int):
+        y = self.y[:self.visible(count)]
+        y += self.speed[:len(y)]
+        wrapped = np.flatnonzero(y >= HEIGHT)
+        if len(wrapped):
+            y[wrapped] -= HEIGHT
+            self.x[wrapped] = np.random.uniform(0, WIDTH, len(wrapped))
+
+class Starfield:
+    def __init__(self, capacity: int = MAX_STARS, layers: List[dict] = STAR_LAYERS):
+        self.layers = [StarLayer(settings, capacity) for settings in layers]
+
+    def update(self, count: int):
+        for layer in self.layers:
+            layer.update(count)
+
+    def draw(self, draw_list: DrawList, count: int):
+        draw_list.flush()
+        pixels = None
+        # surfarray has no pixel view of 24-bit surfaces; those get 1x1 sprites instead
+        direct = draw_list.target.get_bytesize() != 3
+        for layer in self.layers:
+            n = layer.visible(count)
+            x = layer.x[:n].astype(np.intp)
+            y = layer.y[:n].astype(np.intp)
+            if layer.radius or not direct:
+                r = layer.radius
+                draw_list.blit_many(atlas.surface, zip((x - r).tolist(), (y - r).tolist()),
+                                    circle_sprite(r, layer.color))
+            else:
+                if pixels is None:
+                    pixels = pygame.surfarray.pixels2d(draw_list.target)
+                pixels[x, y] = draw_list.target.map_rgb(layer.color)
+        # Releases the lock the pixel view holds on the frame
+        del pixels
+
+# High score manager
+class HighScoreManager:
+    def __init__(self, keys: List[str]):
+        self.filename = "high_scores.json"
+        self.scores = {key: 0 for key in keys}
+        self.load_scores()
+
+    def load_scores(self):
+        try:
+            with open(self.filename, 'r') as f:
+                self.scores.update(json.load(f))
+        except FileNotFoundError:
+            self.save_scores()
+
+    def save_scores(self):
+        with open(self.filename, 'w') as f:
+            json.dump(self.scores, f)
+
+    def update_score(self, game: str, score: int):
+        if score > self.scores[game]:
+            self.scores[game] = score
+            self.save_scores()
+
+# Quality tiers, highest first. The governor steps down when the rolling
+# frame time misses the budget and back up after a sustained run of headroom.
+QUALITY_TIERS = [
+    {"name": "High", "particles": MAX_PARTICLES, "background": True, "card_flip": True, "title_pulse": True, "stars": MAX_STARS},
+    {"name": "Medium", "particles": 200, "background": True, "card_flip": True, "title_pulse": False, "stars": 600},
+    {"name": "Low", "particles": 80, "background": False, "card_flip": False, "title_pulse": False, "stars": 150},
+    {"name": "Minimal", "particles": 20, "background": False, "card_flip": False, "title_pulse": False, "stars": 0},
+]
+
+class QualityGovernor:
+    def __init__(self, budget_ms: float = 1000 / 60, window: int = 30, recover_frames: int = 180):
+        self.budget_ms = budget_ms
+        self.samples = deque(maxlen=window)
+        self.recover_frames = recover_frames
+        self.headroom_frames = 0
+        self.tier = 0
+        self.auto = True
+        self.frame_start = 0.0
+
+    @property
+    def settings(self) -> Dict:
+        return QUALITY_TIERS[self.tier]
+
+    def label(self) -> str:
+        name = self.settings["name"]
+        return f"Quality: Auto ({name})" if self.auto else f"Quality: {name}"
+
+    def cycle(self):
+        # Auto -> each fixed tier -> back to Auto
+        if self.auto:
+            self.auto = False
+            self.set_tier(0, "manual")
+        elif self.tier + 1 < len(QUALITY_TIERS):
+            self.set_tier(self.tier + 1, "manual")
+        else:
+            self.auto = True
+            self.samples.clear()
+            logger.info("Quality governor back on auto at %s", self.settings["name"])
+
+    def set_tier(self, tier: int, reason: str):
+        if tier != self.tier:
+            logger.info("Quality %s -> %s (%s)", self.settings["name"], QUALITY_TIERS[tier]["name"], reason)
+            self.tier = tier
+        self.samples.clear()
+        self.headroom_frames = 0
+
+    def begin_frame(self):
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        # Work time only: measured before clock.tick() sleeps off the rest of the frame
+        self.samples.append((time.perf_counter() - self.frame_start) * 1000)
+        if not self.auto or len(self.samples) < self.samples.maxlen:
+            return
+        average = sum(self.samples) / len(self.samples)
+        if average > self.budget_ms * 0.9 and self.tier + 1 < len(QUALITY_TIERS):
+            self.set_tier(self.tier + 1, f"{average:.1f} ms/frame over budget")
+        elif average < self.budget_ms * 0.5 and self.tier > 0:
+            self.headroom_frames += 1
+            if self.headroom_frames >= self.recover_frames:
+                self.set_tier(self.tier - 1, f"{average:.1f} ms/frame headroom")
+        else:
+            self.headroom_frames = 0
+
+# Static screens block on the event queue instead of redrawing at 60 FPS.
+# CPU time is accounted separately for active and idle frames.
+class IdleMonitor:
+    def __init__(self, timeout_ms: int = 1000, report_interval: float = 60.0):
+        self.timeout_ms = timeout_ms
+        self.report_interval = report_interval
+        self.stats = {"active": [0.0, 0.0], "idle": [0.0, 0.0]}
+        self.last_cpu = time.process_time()
+        self.last_wall = time.perf_counter()
+        self.last_report = self.last_wall
+
+    def wait(self, hover_rects: List[pygame.Rect] = None):
+        # Returns on the first event that can change the frame, or after the timeout.
+        # With hover_rects, mouse motion only wakes when the hovered rect changes.
+        if hover_rects is not None:
+            hovered = [rect.collidepoint(display.mouse_pos()) for rect in hover_rects]
+        while True:
+            event = pygame.event.wait(self.timeout_ms)
+            if event.type == pygame.NOEVENT:
+                return
+            if (event.type == pygame.MOUSEMOTION and hover_rects is not None and
+                    [rect.collidepoint(display.to_logical(event.pos)) for rect in hover_rects] == hovered):
+                continue
+            pygame.event.post(event)
+            return
+
+    def account(self, idle: bool):
+        cpu = time.process_time()
+        wall = time.perf_counter()
+        bucket = self.stats["idle" if idle else "active"]
+        bucket[0] += cpu - self.last_cpu
+        bucket[1] += wall - self.last_wall
+        self.last_cpu = cpu
+        self.last_wall = wall
+        if wall - self.last_report >= self.report_interval:
+            self.report()
+
+    def report(self):
+        self.last_report = self.last_wall
+        parts = []
+        for mode, (cpu, wall) in self.stats.items():
+            if wall > 0:
+                parts.append(f"{mode} {cpu / wall * 100:.1f}% over {wall:.0f}s")
+        logger.info("CPU usage: %s", ", ".join(parts))
+
+# Events are stamped with perf_counter() as they come off the SDL queue. Scenes
+# hand back the stamps of inputs the simulation has applied and the App closes
+# them out once the frame showing the result has been presented.
+class InputLatency:
+    def __init__(self, window: int = 1000, report_interval: float = 60.0):
+        self.samples = deque(maxlen=window)
+        self.pending = []
+        self.report_interval = report_interval
+        self.last_report = time.perf_counter()
+
+    def poll(self) -> List[pygame.event.Event]:
+        events = pygame.event.get()
+        now = time.perf_counter()
+        for event in events:
+            event.stamp = now
+        return events
+
+    def applied(self, stamps):
+        self.pending.extend(stamps)
+
+    def presented(self):
+        now = time.perf_counter()
+        for stamp in self.pending:
+            self.samples.append((now - stamp) * 1000)
+        self.pending.clear()
+        if now - self.last_report >= self.report_interval:
+            self.report()
+
+    def percentile(self, q: float) -> float:
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+    def report(self):
+        self.last_report = time.perf_counter()
+        if self.samples:
+            logger.info("Input latency over %d inputs: p50 %.1f ms, p95 %.1f ms, max %.1f ms",
+                        len(self.samples), self.percentile(0.5), self.percentile(0.95), max(self.samples))
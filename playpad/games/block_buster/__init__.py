@@ -0,0 +1,18 @@
+from playpad.registry import GameEntry
+
+DIFFICULTY = {
+    1: {"ball_speed": 5, "lives": 5},
+    2: {"ball_speed": 6, "lives": 3},
+    3: {"ball_speed": 7, "lives": 2},
+}
+# Shared by the game, its snapshots and the level packs
+POWER_UP_TYPES = ["expand", "slow", "extra_life", "multiball"]
+
+ENTRY = GameEntry(
+    key="block_buster",
+    title="Block Buster Bonanza",
+    tooltip="Break blocks with a bouncing ball!",
+    score_key="block_buster",
+    difficulty=DIFFICULTY,
+    scene="playpad.games.block_buster.scene:BlockBusterScene",
+)
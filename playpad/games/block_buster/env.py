@@ -0,0 +1,221 @@
+import os
+
+# Environments never open a window or an audio device, though importing the
+# game modules initialises both
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+
+from playpad.core import WIDTH, HEIGHT
+from playpad.games.block_buster.scene import BlockBusterBonanza
+
+# Gym-style Block Buster. Actions are 0 stay, 1 left, 2 right (one paddle_speed
+# step each). Observations are float32: paddle x, first ball x, y, dx, dy, all
+# scaled to about [-1, 1], then one 0/1 per brick slot in row-major order.
+# Reward is +1 per brick broken and -1 per life lost; a cleared level moves
+# straight on to the next one.
+STAY, LEFT, RIGHT = 0, 1, 2
+COLS = 8
+MAX_ROWS = 8
+BRICK_WIDTH = WIDTH // COLS - 5
+BRICK_HEIGHT = 20
+BRICK_LEFT = 5
+BRICK_TOP = 50
+BRICK_PITCH_X = BRICK_WIDTH + 5
+BRICK_PITCH_Y = BRICK_HEIGHT + 5
+MAX_BALL_SPEED = 14
+OBS_SIZE = 5 + MAX_ROWS * COLS
+PADDLE_MOVES = np.array([0, -1, 1])
+
+class BlockBusterEnv:
+    num_actions = 3
+
+    def __init__(self, difficulty: int = 1):
+        self.difficulty = difficulty
+        self.obs = np.zeros(OBS_SIZE, dtype=np.float32)
+        # Observations assume the generated 8-column rows, not the level pack
+        self.game = BlockBusterBonanza(levels=None)
+
+    def reset(self) -> np.ndarray:
+        game = self.game
+        game.reset()
+        game.set_difficulty(self.difficulty)
+        # reset() laid out the bricks before the difficulty was known
+        game.create_blocks()
+        self.observe()
+        return self.obs
+
+    def step(self, action: int):
+        game = self.game
+        x = game.paddle_x + PADDLE_MOVES[action] * game.paddle_speed
+        game.paddle_x = max(0, min(WIDTH - game.paddle_width, x))
+        blocks, lives = len(game.blocks), game.lives
+        game.update()
+        reward = blocks - len(game.blocks) - (game.lives < lives)
+        if game.level_complete:
+            game.next_level()
+        self.observe()
+        return self.obs, float(reward), game.game_over
+
+    def observe(self):
+        game = self.game
+        obs = self.obs
+        obs[0] = game.paddle_x / WIDTH
+        if game.balls.count:
+            balls = game.balls
+            obs[1:5] = (balls.x[0] / WIDTH, balls.y[0] / HEIGHT,
+                        balls.dx[0] / MAX_BALL_SPEED, balls.dy[0] / MAX_BALL_SPEED)
+        obs[5:] = 0
+        for block in game.blocks:
+            row = (block.y - BRICK_TOP) // BRICK_PITCH_Y
+            if row < MAX_ROWS:
+                obs[5 + row * COLS + (block.x - BRICK_LEFT) // BRICK_PITCH_X] = 1
+
+# Steps num_envs games at once, one ball each, with bricks as a
+# (num_envs, MAX_ROWS, COLS) array of hits left. Movement, bounces and brick
+# hits follow BlockBusterBonanza.update; a ball can only touch the bricks in
+# the slots under its four corners, so those are all that is tested. Power-ups
+# are left out and levels stop growing at MAX_ROWS rows. Finished envs reset
+# on the next step and an episode is cut short after max_steps.
+class BlockBusterVecEnv:
+    num_actions = 3
+
+    def __init__(self, num_envs: int, difficulty: int = 1, seed: int = None, max_steps: int = 10000,
+                 buffers: dict = None):
+        buffers = buffers or {}
+        self.num_envs = num_envs
+        self.difficulty = max(1, min(3, difficulty))
+        self.max_steps = max_steps
+        self.rng = np.random.default_rng(seed)
+        self.index = np.arange(num_envs)
+        self.paddle_x = np.zeros(num_envs)
+        self.paddle_width = 100
+        self.paddle_height = 15
+        self.paddle_y = HEIGHT - 30
+        self.paddle_speed = 8
+        self.ball_radius = 10
+        self.x = np.zeros(num_envs)
+        self.y = np.zeros(num_envs)
+        self.dx = np.zeros(num_envs)
+        self.dy = np.zeros(num_envs)
+        self.hits = np.zeros((num_envs, MAX_ROWS, COLS), dtype=np.int8)
+        self.level = np.zeros(num_envs, dtype=np.int32)
+        self.lives = np.zeros(num_envs, dtype=np.int32)
+        self.score = np.zeros(num_envs, dtype=np.int64)
+        self.steps = np.zeros(num_envs, dtype=np.int32)
+        self.obs = buffers.get("obs", np.zeros((num_envs, OBS_SIZE), dtype=np.float32))
+        self.rewards = buffers.get("rewards", np.zeros(num_envs, dtype=np.float32))
+        self.dones = buffers.get("dones", np.zeros(num_envs, dtype=np.bool_))
+        self.reset()
+
+    def reset(self) -> np.ndarray:
+        self.reset_envs(self.index)
+        self.rewards.fill(0)
+        self.dones.fill(False)
+        self.observe()
+        return self.obs
+
+    def reset_envs(self, envs: np.ndarray):
+        self.paddle_x[envs] = WIDTH // 2 - self.paddle_width // 2
+        self.level[envs] = 1
+        self.lives[envs] = 3
+        self.score[envs] = 0
+        self.steps[envs] = 0
+        self.serve(envs)
+        self.create_blocks(envs)
+
+    def serve(self, envs: np.ndarray):
+        self.x[envs] = WIDTH // 2
+        self.y[envs] = HEIGHT // 2
+        self.dx[envs] = 5 * self.rng.choice([-1, 1], len(envs)) * self.difficulty
+        self.dy[envs] = -5 * self.difficulty
+
+    def create_blocks(self, envs: np.ndarray):
+        level = self.level[envs]
+        rows = np.minimum(level + 2, MAX_ROWS)
+        hits = np.clip(level // 2, 1, 3) if self.difficulty == 3 else np.ones_like(level)
+        self.hits[envs] = np.where(np.arange(MAX_ROWS)[None, :, None] < rows[:, None, None],
+                                   hits[:, None, None], 0)
+
+    def step(self, actions):
+        if self.dones.any():
+            self.reset_envs(np.flatnonzero(self.dones))
+
+        self.paddle_x += PADDLE_MOVES[np.asarray(actions)] * self.paddle_speed
+        np.clip(self.paddle_x, 0, WIDTH - self.paddle_width, out=self.paddle_x)
+
+        x, y, dx, dy, r = self.x, self.y, self.dx, self.dy, self.ball_radius
+        x += dx * self.difficulty
+        y += dy * self.difficulty
+        dx[(x <= r) | (x >= WIDTH - r)] *= -1
+        dy[y <= r] *= -1
+
+        on_paddle = ((y + r >= self.paddle_y) & (y - r <= self.paddle_y + self.paddle_height) &
+                     (x >= self.paddle_x) & (x <= self.paddle_x + self.paddle_width))
+        relative_x = (x - self.paddle_x) / self.paddle_width
+        dx[on_paddle] = ((relative_x * 2 - 1) * 7 * self.difficulty)[on_paddle]
+        dy[on_paddle] *= -1
+
+        self.rewards.fill(0)
+        lost = y > HEIGHT
+        if lost.any():
+            self.rewards[lost] = -1
+            self.lives[lost] -= 1
+            self.serve(np.flatnonzero(lost & (self.lives > 0)))
+
+        self.collide_blocks()
+
+        cleared = ~self.hits.reshape(self.num_envs, -1).any(axis=1)
+        if cleared.any():
+            envs = np.flatnonzero(cleared)
+            self.level[envs] += 1
+            self.serve(envs)
+            self.create_blocks(envs)
+
+        self.steps += 1
+        self.dones[:] = (self.lives <= 0) | (self.steps >= self.max_steps)
+        self.observe()
+        return self.obs, self.rewards, self.dones
+
+    def collide_blocks(self):
+        x, y, r = self.x, self.y, self.ball_radius
+        # Walk the corner slots last to first so the lowest slot hit wins
+        rows = ((y - r - BRICK_TOP) // BRICK_PITCH_Y, (y + r - BRICK_TOP) // BRICK_PITCH_Y)
+        cols = ((x - r - BRICK_LEFT) // BRICK_PITCH_X, (x + r - BRICK_LEFT) // BRICK_PITCH_X)
+        hit_row = np.full(self.num_envs, -1)
+        hit_col = np.zeros(self.num_envs, dtype=np.int64)
+        for row in reversed(rows):
+            for col in reversed(cols):
+                row_i = np.clip(row, 0, MAX_ROWS - 1).astype(np.int64)
+                col_i = np.clip(col, 0, COLS - 1).astype(np.int64)
+                left = BRICK_LEFT + col_i * BRICK_PITCH_X
+                top = BRICK_TOP + row_i * BRICK_PITCH_Y
+                hit = ((row == row_i) & (col == col_i) & (self.hits[self.index, row_i, col_i] > 0) &
+                       (x + r > left) & (x - r < left + BRICK_WIDTH) &
+                       (y + r > top) & (y - r < top + BRICK_HEIGHT))
+                hit_row = np.where(hit, row_i, hit_row)
+                hit_col = np.where(hit, col_i, hit_col)
+
+        envs = np.flatnonzero(hit_row >= 0)
+        if envs.size == 0:
+            return
+        row_i, col_i = hit_row[envs], hit_col[envs]
+        self.hits[envs, row_i, col_i] -= 1
+        broken = self.hits[envs, row_i, col_i] <= 0
+        self.rewards[envs[broken]] += 1
+        self.score[envs[broken]] += 10 * self.level[envs[broken]] * self.difficulty
+
+        left = BRICK_LEFT + col_i * BRICK_PITCH_X
+        side = (x[envs] < left) | (x[envs] > left + BRICK_WIDTH)
+        self.dx[envs[side]] *= -1
+        self.dy[envs[~side]] *= -1
+
+    def observe(self):
+        obs = self.obs
+        obs[:, 0] = self.paddle_x / WIDTH
+        obs[:, 1] = self.x / WIDTH
+        obs[:, 2] = self.y / HEIGHT
+        obs[:, 3] = self.dx / MAX_BALL_SPEED
+        obs[:, 4] = self.dy / MAX_BALL_SPEED
+        obs[:, 5:] = self.hits.reshape(self.num_envs, -1) > 0
@@ -0,0 +1,298 @@
+import argparse
+import json
+import logging
+import os
+import struct
+import sys
+import time
+from array import array
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional
+
+from playpad.games.block_buster import POWER_UP_TYPES
+from playpad.snapshot import SnapshotError, SnapshotReader, SnapshotWriter
+
+logger = logging.getLogger("playpad")
+
+# Block Buster levels. Layouts are authored as JSON, one row of bricks per
+# string with a legend mapping characters to a color and a hit count:
+#
+#     {"legend": {"R": {"color": "RED"}, "#": {"color": [90, 90, 110], "hits": 3}},
+#      "levels": [{"name": "Gate", "rows": ["RRRR..RRRR", "#..######..#"],
+#                  "power_ups": {"multiball": 2, "expand": 1}, "power_up_chance": 0.3}]}
+#
+# "." or a space leaves a gap, a level may override the legend, and the power-up
+# table weights the drop types (missing: all equal, chance from tuning). The
+# columns of a level are its longest row, laid out like the generated levels.
+#
+# The game reads a compiled pack instead: a header and an offset table, then
+# each level as a snapshot-format record holding its palette of distinct
+# bricks and a grid of one palette byte per cell. Opening a pack reads only the index;
+# level(n) seeks to one record, and the last few compiled layouts stay in an
+# LRU cache, so a pack of any size costs a few bytes per level until it is
+# played. The pack in the cache directory is rebuilt whenever levels.json
+# changes; PLAYPAD_LEVELS names a pack compiled ahead of time instead. Levels
+# past the end of the pack are generated as before.
+#
+#   python -m playpad.games.block_buster.levels levels.json -o block_buster.pack
+LEVEL_SOURCE = os.path.join(os.path.dirname(__file__), "levels.json")
+CACHE_PACK = os.path.join("cache", "levels", "block_buster.pack")
+PACK_MAGIC = b"PPLP"
+PACK_VERSION = 1
+# magic, version, source mtime_ns and size, level count
+PACK_HEADER = struct.Struct("<4sHqqI")
+OFFSET = struct.Struct("<I")
+LEVEL_KIND = b"LEVL"
+LEVEL_VERSION = 1
+# columns, rows, power-up chance (negative: the tuned default)
+LEVEL_STATE = struct.Struct("<BBf")
+# r, g, b, hits
+PALETTE_STATE = struct.Struct("<BBBB")
+# power-up type, weight
+WEIGHT_STATE = struct.Struct("<BH")
+MAX_COLS = 16
+MAX_ROWS = 16
+LEVEL_CACHE_SIZE = 8
+
+class LevelError(ValueError):
+    pass
+
+class Level(NamedTuple):
+    name: str
+    cols: int
+    # (column, row, color, hits)
+    bricks: tuple
+    # (type, weight); empty for an even draw
+    power_ups: tuple
+    power_up_chance: Optional[float]
+
+def parse_color(value, path: str) -> tuple:
+    if isinstance(value, str):
+        # Color names need core, which sets up pygame, so it is only imported here
+        from playpad.core import Colors
+        color = getattr(Colors, value.upper(), None)
+        if not isinstance(color, tuple):
+            raise LevelError(f"{path}: unknown color {value!r}")
+        return color[:3]
+    if (isinstance(value, list) and len(value) == 3
+            and all(isinstance(c, int) and not isinstance(c, bool) and 0 <= c <= 255 for c in value)):
+        return tuple(value)
+    raise LevelError(f"{path}: expected a color name or [r, g, b]")
+
+def parse_legend(data, path: str, legend: dict = None) -> dict:
+    legend = dict(legend or {})
+    if not isinstance(data, dict):
+        raise LevelError(f"{path}: expected an object")
+    for char, brick in data.items():
+        if len(char) != 1 or char in ". ":
+            raise LevelError(f"{path}: {char!r} is not a single brick character")
+        if not isinstance(brick, dict) or set(brick) - {"color", "hits"} or "color" not in brick:
+            raise LevelError(f"{path}.{char}: expected {{\"color\": ..., \"hits\": ...}}")
+        hits = brick.get("hits", 1)
+        if isinstance(hits, bool) or not isinstance(hits, int) or not 1 <= hits <= 255:
+            raise LevelError(f"{path}.{char}.hits: expected a whole number from 1 to 255")
+        legend[char] = (parse_color(brick["color"], f"{path}.{char}.color"), hits)
+    return legend
+
+def parse_level(data, path: str, legend: dict) -> Level:
+    if not isinstance(data, dict):
+        raise LevelError(f"{path}: expected an object")
+    unknown = sorted(set(data) - {"name", "rows", "legend", "power_ups", "power_up_chance"})
+    if unknown:
+        raise LevelError(f"{path}: unknown field {', '.join(unknown)}")
+    legend = parse_legend(data.get("legend", {}), f"{path}.legend", legend)
+    rows = data.get("rows")
+    if not isinstance(rows, list) or not rows or not all(isinstance(row, str) for row in rows):
+        raise LevelError(f"{path}.rows: expected a list of strings")
+    if len(rows) > MAX_ROWS or max(map(len, rows)) > MAX_COLS:
+        raise LevelError(f"{path}.rows: at most {MAX_ROWS} rows of {MAX_COLS} bricks")
+    bricks = []
+    for row, line in enumerate(rows):
+        for col, char in enumerate(line):
+            if char in ". ":
+                continue
+            if char not in legend:
+                raise LevelError(f"{path}.rows[{row}]: {char!r} is not in the legend")
+            bricks.append((col, row, *legend[char]))
+    if not bricks:
+        raise LevelError(f"{path}.rows: the level has no bricks")
+
+    table = data.get("power_ups", {})
+    if not isinstance(table, dict):
+        raise LevelError(f"{path}.power_ups: expected an object")
+    power_ups = []
+    for kind, weight in table.items():
+        if kind not in POWER_UP_TYPES:
+            raise LevelError(f"{path}.power_ups: unknown power-up {kind!r}")
+        if isinstance(weight, bool) or not isinstance(weight, int) or not 0 <= weight <= 0xFFFF:
+            raise LevelError(f"{path}.power_ups.{kind}: expected a whole number weight")
+        power_ups.append((kind, weight))
+    if power_ups and not any(weight for _, weight in power_ups):
+        raise LevelError(f"{path}.power_ups: every weight is zero")
+    chance = data.get("power_up_chance")
+    if chance is not None and (isinstance(chance, bool) or not isinstance(chance, (int, float)) or not 0 <= chance <= 1):
+        raise LevelError(f"{path}.power_up_chance: expected a probability")
+    return Level(str(data.get("name", "")), max(map(len, rows)), tuple(bricks), tuple(power_ups), chance)
+
+def parse_source(text: str) -> List[Level]:
+    try:
+        data = json.loads(text)
+    except ValueError as e:
+        raise LevelError(f"not valid JSON: {e}") from None
+    if not isinstance(data, dict) or not isinstance(data.get("levels"), list) or set(data) - {"legend", "levels"}:
+        raise LevelError("expected {\"legend\": {...}, \"levels\": [...]}")
+    legend = parse_legend(data.get("legend", {}), "legend")
+    return [parse_level(level, f"levels[{i}]", legend) for i, level in enumerate(data["levels"])]
+
+def encode_level(level: Level) -> bytes:
+    rows = max(row for _, row, _, _ in level.bricks) + 1
+    palette = list(dict.fromkeys((color, hits) for _, _, color, hits in level.bricks))
+    # 0 is a gap, anything else a palette entry counted from 1
+    grid = array("B", bytes(level.cols * rows))
+    for col, row, color, hits in level.bricks:
+        grid[row * level.cols + col] = palette.index((color, hits)) + 1
+    writer = SnapshotWriter(LEVEL_KIND, LEVEL_VERSION)
+    writer.write(LEVEL_STATE, level.cols, rows, -1.0 if level.power_up_chance is None else level.power_up_chance)
+    writer.write_str(level.name)
+    writer.write_records(PALETTE_STATE, ((*color, hits) for color, hits in palette))
+    writer.write_array(grid)
+    writer.write_records(WEIGHT_STATE, ((POWER_UP_TYPES.index(kind), weight) for kind, weight in level.power_ups))
+    return writer.getvalue()
+
+def decode_level(data: bytes) -> Level:
+    reader = SnapshotReader(data, LEVEL_KIND, LEVEL_VERSION)
+    cols, rows, chance = reader.read(LEVEL_STATE)
+    name = reader.read_str()
+    palette = [None] + [((r, g, b), hits) for r, g, b, hits in reader.read_records(PALETTE_STATE)]
+    grid = reader.read_array("B")
+    if len(grid) != cols * rows or max(grid, default=0) >= len(palette):
+        raise SnapshotError(f"Level {name!r} has a damaged grid")
+    bricks = tuple((i % cols, i // cols, *palette[cell]) for i, cell in enumerate(grid) if cell)
+    power_ups = tuple((POWER_UP_TYPES[kind], weight) for kind, weight in reader.read_records(WEIGHT_STATE))
+    return Level(name, cols, bricks, power_ups, None if chance < 0 else chance)
+
+def source_stamp(path: str) -> tuple:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+def write_pack(levels: List[Level], path: str, stamp: tuple = (0, 0)) -> int:
+    records = [encode_level(level) for level in levels]
+    offset = PACK_HEADER.size + OFFSET.size * (len(records) + 1)
+    offsets = []
+    for record in records:
+        offsets.append(offset)
+        offset += len(record)
+    offsets.append(offset)
+    # Written beside and renamed over, so a reader never sees half a pack
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path + ".tmp", "wb") as f:
+        f.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, *stamp, len(records)))
+        f.write(b"".join(OFFSET.pack(o) for o in offsets))
+        f.write(b"".join(records))
+    os.replace(path + ".tmp", path)
+    return offset
+
+def compile_source(source: str, path: str) -> int:
+    with open(source, encoding="utf-8") as f:
+        levels = parse_source(f.read())
+    size = write_pack(levels, path, source_stamp(source))
+    logger.info("Compiled %d levels from %s into %s (%d bytes)", len(levels), source, path, size)
+    return len(levels)
+
+# A compiled pack, opened on first use. With a source, a pack that is missing or
+# was built from another version of the source is compiled again first.
+class LevelPack:
+    def __init__(self, path: str, source: str = None, cache_size: int = LEVEL_CACHE_SIZE):
+        self.path = path
+        self.source = source
+        self.cache_size = cache_size
+        self.offsets = None
+        self.cache = OrderedDict()
+
+    def read_index(self) -> tuple:
+        with open(self.path, "rb") as f:
+            header = f.read(PACK_HEADER.size)
+            if len(header) < PACK_HEADER.size:
+                raise LevelError(f"{self.path} is truncated")
+            magic, version, mtime_ns, size, count = PACK_HEADER.unpack(header)
+            if magic != PACK_MAGIC:
+                raise LevelError(f"{self.path} is not a level pack")
+            if version != PACK_VERSION:
+                raise LevelError(f"{self.path}: pack version {version} is not supported (expected {PACK_VERSION})")
+            index = f.read(OFFSET.size * (count + 1))
+        if len(index) < OFFSET.size * (count + 1):
+            raise LevelError(f"{self.path} is truncated")
+        return (mtime_ns, size), array("I", (offset for offset, in OFFSET.iter_unpack(index)))
+
+    def open(self):
+        self.offsets = array("I")
+        try:
+            if self.source is not None:
+                stamp = source_stamp(self.source)
+                try:
+                    found = self.read_index()[0]
+                except (OSError, LevelError):
+                    found = None
+                if found != stamp:
+                    compile_source(self.source, self.path)
+            self.offsets = self.read_index()[1]
+        except (OSError, LevelError) as e:
+            logger.warning("No level pack, generating every level: %s", e)
+            return
+        self.cache.clear()
+
+    def __len__(self) -> int:
+        if self.offsets is None:
+            self.open()
+        return max(0, len(self.offsets) - 1)
+
+    def level(self, number: int) -> Optional[Level]:
+        # Levels count from 1; None past the end of the pack
+        if not 1 <= number <= len(self):
+            return None
+        level = self.cache.get(number)
+        if level is not None:
+            self.cache.move_to_end(number)
+            return level
+        start, end = self.offsets[number - 1], self.offsets[number]
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(start)
+                level = decode_level(f.read(end - start))
+        except (OSError, SnapshotError) as e:
+            logger.warning("Could not read level %d from %s: %s", number, self.path, e)
+            return None
+        self.cache[number] = level
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return level
+
+def default_pack() -> LevelPack:
+    path = os.environ.get("PLAYPAD_LEVELS")
+    if path:
+        return LevelPack(path)
+    return LevelPack(CACHE_PACK, LEVEL_SOURCE)
+
+level_pack = default_pack()
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile Block Buster levels into a level pack")
+    parser.add_argument("source", nargs="?", default=LEVEL_SOURCE)
+    parser.add_argument("-o", "--output", default=CACHE_PACK, help=f"pack to write (default {CACHE_PACK})")
+    args = parser.parse_args()
+    # Color names come from core, whose pygame.init() needs no display or audio device here
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    started = time.perf_counter()
+    try:
+        with open(args.source, encoding="utf-8") as f:
+            levels = parse_source(f.read())
+    except (OSError, LevelError) as e:
+        print(f"{args.source}: {e}")
+        sys.exit(1)
+    size = write_pack(levels, args.output, source_stamp(args.source))
+    print(f"{args.output}: {len(levels)} levels, {sum(len(level.bricks) for level in levels)} bricks, "
+          f"{size} bytes in {time.perf_counter() - started:.2f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,547 @@
+import math
+import random
+import struct
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+import pygame
+
+from playpad.core import (WIDTH, HEIGHT, MAX_PARTICLES, Colors, Fonts, DrawList, EntityPool, Particle, PoolRecord,
+                          atlas, cached_gradient_surface, capture_particles, circle_sprite, display, panel_sprite,
+                          render_text_with_shadow, tile_sprite, update_particles)
+from playpad.audio import audio
+from playpad.games.block_buster import POWER_UP_TYPES
+from playpad.games.block_buster.levels import Level, LevelPack, level_pack
+from playpad.scenes import GameScene
+from playpad.snapshot import SnapshotReader, SnapshotWriter, lookup
+from playpad.telemetry import telemetry
+from playpad.tuning import tuning
+
+# arcade, level, score, lives, difficulty, paddle x and width, ball speed, paused,
+# game over, level complete, paddle powered, ms left on the power-up
+BUSTER_STATE = struct.Struct("<?HIhBhHh????i")
+# x, y, width, height, r, g, b, hits
+BLOCK_STATE = struct.Struct("<hhhhBBBB")
+# x, y, type
+POWER_UP_STATE = struct.Struct("<ffB")
+
+class Block(PoolRecord):
+    __slots__ = ('x', 'y', 'width', 'height', 'color', 'hits')
+
+    def setup(self, x, y, width, height, color, hits):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.color = color
+        self.hits = hits
+
+class PowerUp(PoolRecord):
+    __slots__ = ('x', 'y', 'type')
+
+    def setup(self, x, y, type):
+        self.x = x
+        self.y = y
+        self.type = type
+
+# Ball state for Block Buster lives in parallel NumPy arrays so any number of
+# balls moves, bounces and collides with a handful of vector operations
+class BallSet:
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.dx = np.zeros(capacity)
+        self.dy = np.zeros(capacity)
+        self.radius = np.zeros(capacity)
+
+    def add(self, x, y, dx, dy, radius) -> bool:
+        if self.count >= self.capacity:
+            return False
+        i = self.count
+        self.x[i], self.y[i], self.dx[i], self.dy[i], self.radius[i] = x, y, dx, dy, radius
+        self.count += 1
+        return True
+
+    def remove(self, mask):
+        keep = ~mask
+        n = int(keep.sum())
+        for array in (self.x, self.y, self.dx, self.dy, self.radius):
+            array[:n] = array[:self.count][keep]
+        self.count = n
+
+    def clear(self):
+        self.count = 0
+
+    def split(self, copies: int):
+        # Each ball spawns copies fanned out around its own heading
+        n = self.count
+        speed = np.hypot(self.dx[:n], self.dy[:n])
+        heading = np.arctan2(self.dy[:n], self.dx[:n])
+        for k in range(1, copies + 1):
+            room = min(n, self.capacity - self.count)
+            if room <= 0:
+                break
+            angle = heading[:room] + (0.35 if k % 2 else -0.35) * ((k + 1) // 2)
+            end = self.count + room
+            self.x[self.count:end] = self.x[:room]
+            self.y[self.count:end] = self.y[:room]
+            self.dx[self.count:end] = np.cos(angle) * speed[:room]
+            self.dy[self.count:end] = np.sin(angle) * speed[:room]
+            self.radius[self.count:end] = self.radius[:room]
+            self.count = end
+
+# Game 2: Block Buster Bonanza
+class BlockBusterBonanza:
+    SNAPSHOT_KIND = b"BUST"
+    SNAPSHOT_VERSION = 1
+    MAX_BALLS = 12
+    ARCADE_MAX_BALLS = 500
+    ARCADE_START_BALLS = 8
+
+    def __init__(self, arcade: bool = False, levels: Optional[LevelPack] = level_pack):
+        self.arcade = arcade
+        # None plays generated levels only
+        self.levels = levels
+        self.reset()
+
+    def reset(self):
+        settings = tuning.current.block_buster
+        self.paddle_width = settings.paddle_width
+        self.paddle_height = 15
+        self.paddle_x = WIDTH // 2 - self.paddle_width // 2
+        self.paddle_y = HEIGHT - 30
+        self.paddle_speed = settings.paddle_speed
+        self.paddle_shake = 0
+        # Latest mouse x not yet applied, with the stamp of the oldest motion event behind it
+        self.paddle_target = None
+        self.applied_inputs = []
+
+        self.ball_radius = 10
+        self.ball_speed = settings.difficulty[0].ball_speed
+        self.balls = BallSet(self.ARCADE_MAX_BALLS if self.arcade else self.MAX_BALLS)
+        self.block_list = []
+        self.block_bounds = None
+
+        self.level = 1
+        self.score = 0
+        self.lives = 3
+        self.blocks = EntityPool(Block)
+        self.block_views = None
+        self.game_over = False
+        self.level_complete = False
+        self.power_ups = EntityPool(PowerUp)
+        self.paddle_powered = False
+        self.power_timer = 0
+        self.paused = False
+        self.difficulty = 1
+        self.particles = EntityPool(Particle, MAX_PARTICLES)
+        self.score_animation = 0
+        self.background_offset = 0
+        self.serve()
+        self.create_blocks()
+
+    def serve(self):
+        settings = tuning.current.block_buster
+        speed = settings.serve_speed * self.difficulty
+        self.balls.clear()
+        self.balls.add(WIDTH // 2, HEIGHT // 2, speed * random.choice([-1, 1]), -speed, self.ball_radius)
+        if self.arcade:
+            speed = settings.bounce_speed * self.difficulty
+            for _ in range(self.ARCADE_START_BALLS - 1):
+                angle = random.uniform(-2.5, -0.6)
+                self.balls.add(WIDTH // 2, HEIGHT // 2, math.cos(angle) * speed, math.sin(angle) * speed,
+                               self.ball_radius)
+
+    def get_block_bounds(self):
+        # Brick rectangles as (left, top, right, bottom) rows, rebuilt only
+        # after the brick set changes; block_list maps rows back to records
+        if self.block_bounds is None:
+            self.block_list = list(self.blocks)
+            self.block_bounds = np.array([(b.x, b.y, b.x + b.width, b.y + b.height) for b in self.block_list],
+                                         dtype=float).reshape(-1, 4)
+        return self.block_bounds
+
+    def generate_level(self) -> Level:
+        # Uniform rows for levels past the end of the level pack
+        colors = [Colors.RED, Colors.GREEN, Colors.BLUE, Colors.YELLOW, Colors.PURPLE, Colors.CYAN, Colors.ORANGE]
+        bricks = tuple((col, row, colors[row % len(colors)], 1) for row in range(self.level + 2) for col in range(8))
+        return Level(f"Level {self.level}", 8, bricks, (), None)
+
+    def load_layout(self):
+        level = self.levels.level(self.level) if self.levels is not None else None
+        self.layout = level or self.generate_level()
+
+    def create_blocks(self):
+        self.blocks.clear()
+        self.block_bounds = None
+        self.block_views = None
+        self.load_layout()
+        block_width = WIDTH // self.layout.cols - 5
+        block_height = 20
+        # On hard, bricks get tougher every other level, up to three hits
+        min_hits = max(1, min((self.level or 1) // 2, 3)) if self.difficulty == 3 else 1
+        for col, row, color, hits in self.layout.bricks:
+            self.blocks.spawn(5 + col * (block_width + 5), 50 + row * (block_height + 5),
+                              block_width, block_height, color, max(hits, min_hits))
+
+    def move_paddle(self, mouse_x: int, stamp: float):
+        if self.paused:
+            return
+        if self.paddle_target is not None:
+            stamp = self.paddle_target[1]
+        self.paddle_target = (mouse_x, stamp)
+
+    def update(self):
+        if self.paused:
+            return
+        settings = tuning.current.block_buster
+
+        # Mouse control for paddle
+        if self.paddle_target is not None:
+            mouse_x, stamp = self.paddle_target
+            self.paddle_target = None
+            if mouse_x > 0 and mouse_x < WIDTH - self.paddle_width:
+                self.paddle_x = mouse_x
+            self.applied_inputs.append(stamp)
+
+        n = self.balls.count
+        x, y = self.balls.x[:n], self.balls.y[:n]
+        dx, dy = self.balls.dx[:n], self.balls.dy[:n]
+        r = self.balls.radius[:n]
+
+        x += dx * self.difficulty
+        y += dy * self.difficulty
+
+        dx[(x <= r) | (x >= WIDTH - r)] *= -1
+        dy[y <= r] *= -1
+
+        on_paddle = ((y + r >= self.paddle_y) & (y - r <= self.paddle_y + self.paddle_height) &
+                     (x >= self.paddle_x) & (x <= self.paddle_x + self.paddle_width))
+        if on_paddle.any():
+            relative_x = (x[on_paddle] - self.paddle_x) / self.paddle_width
+            dx[on_paddle] = (relative_x * 2 - 1) * settings.bounce_speed * self.difficulty
+            dy[on_paddle] *= -1
+            self.paddle_shake = 10
+            audio.play("paddle")
+            for ball_x in x[on_paddle][:4].tolist():
+                for _ in range(settings.paddle_particles):
+                    self.particles.spawn(ball_x, self.paddle_y, Colors.NEON_BLUE, 'circle')
+
+        lost = y > HEIGHT
+        if lost.any():
+            self.balls.remove(lost)
+            if self.balls.count == 0:
+                self.lives -= 1
+                telemetry.emit("life_lost", game="block_buster", level=self.level)
+                if self.lives <= 0:
+                    self.game_over = True
+                else:
+                    self.serve()
+            n = self.balls.count
+            x, y = self.balls.x[:n], self.balls.y[:n]
+            dx, dy = self.balls.dx[:n], self.balls.dy[:n]
+            r = self.balls.radius[:n]
+
+        if n and len(self.blocks):
+            self.collide_blocks(x, y, dx, dy, r)
+
+        if len(self.blocks) == 0 and not self.level_complete:
+            self.level_complete = True
+            audio.play("level_complete")
+
+        for power in reversed(self.power_ups):
+            power.y += settings.power_up_fall_speed
+            if (power.y >= self.paddle_y and
+                    power.x >= self.paddle_x and
+                    power.x <= self.paddle_x + self.paddle_width):
+                if power.type == "expand":
+                    self.paddle_width = settings.expanded_paddle_width
+                    self.paddle_powered = True
+                    self.power_timer = pygame.time.get_ticks()
+                elif power.type == "slow":
+                    self.ball_speed = max(settings.min_ball_speed, self.ball_speed - settings.slow_ball_step)
+                    self.paddle_powered = True
+                    self.power_timer = pygame.time.get_ticks()
+                elif power.type == "extra_life":
+                    self.lives += 1
+                elif power.type == "multiball":
+                    self.balls.split(settings.multiball_copies)
+                telemetry.emit("power_up", game="block_buster", type=power.type)
+                self.power_ups.despawn(power)
+            elif power.y > HEIGHT:
+                self.power_ups.despawn(power)
+
+        if self.paddle_powered and pygame.time.get_ticks() - self.power_timer > settings.power_up_ms:
+            self.paddle_width = settings.paddle_width
+            self.ball_speed = settings.difficulty[self.difficulty - 1].ball_speed
+            self.paddle_powered = False
+
+        update_particles(self.particles)
+        self.background_offset = (self.background_offset + 1) % WIDTH
+        if self.score_animation > 0:
+            self.score_animation -= 1
+        if self.paddle_shake > 0:
+            self.paddle_shake -= 1
+
+    def collide_blocks(self, x, y, dx, dy, r):
+        settings = tuning.current.block_buster
+        bounds = self.get_block_bounds()
+        # Broad phase: only balls inside the brick band are tested, against
+        # every brick at once; each ball hits at most its first brick
+        near = np.nonzero((y + r > bounds[:, 1].min()) & (y - r < bounds[:, 3].max()))[0]
+        if near.size == 0:
+            return
+        overlap = ((x[near, None] + r[near, None] > bounds[:, 0]) & (x[near, None] - r[near, None] < bounds[:, 2]) &
+                   (y[near, None] + r[near, None] > bounds[:, 1]) & (y[near, None] - r[near, None] < bounds[:, 3]))
+        hit = overlap.any(axis=1)
+        debris = settings.debris_bricks
+        for i, j in zip(near[hit].tolist(), overlap[hit].argmax(axis=1).tolist()):
+            block = self.block_list[j]
+            if block.index < 0:
+                continue
+            block.hits -= 1
+            self.block_views = None
+            if block.hits <= 0:
+                self.blocks.despawn(block)
+                self.block_bounds = None
+                audio.play("brick")
+                points = settings.brick_points * self.level * self.difficulty
+                self.score += points
+                self.score_animation = points
+                if debris > 0:
+                    debris -= 1
+                    for _ in range(settings.brick_particles):
+                        self.particles.spawn(block.x + block.width // 2,
+                                             block.y + block.height // 2,
+                                             block.color, random.choice(['circle', 'square']))
+                layout = self.layout
+                chance = settings.power_up_chance if layout.power_up_chance is None else layout.power_up_chance
+                if random.random() < chance:
+                    if layout.power_ups:
+                        kinds, weights = zip(*layout.power_ups)
+                        kind = random.choices(kinds, weights)[0]
+                    else:
+                        kind = random.choice(POWER_UP_TYPES)
+                    self.power_ups.spawn(block.x + block.width // 2, block.y, kind)
+            if x[i] < block.x or x[i] > block.x + block.width:
+                dx[i] *= -1
+            else:
+                dy[i] *= -1
+
+    def is_static(self, animations: bool) -> bool:
+        # update() returns early while paused; after game over the power-ups and particles settle first
+        return self.paused or (self.game_over and not animations and not self.particles
+                               and not self.power_ups and not self.paddle_shake)
+
+    def draw_background(self, surface):
+        grid_surface = cached_gradient_surface((WIDTH, HEIGHT), (*Colors.BLUE[:3], 50), Colors.BLACK)
+        for x in range(-WIDTH, WIDTH, 50):
+            pygame.draw.line(surface, Colors.NEON_BLUE, ((x + self.background_offset) % WIDTH, 0),
+                            ((x + self.background_offset) % WIDTH, HEIGHT), 1)
+        surface.blit(grid_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+
+    def draw_particles(self, surface):
+        for p in self.particles:
+            p.draw(surface)
+
+    def capture(self) -> "BlockBusterView":
+        # Brick views are rebuilt only after a hit; the rest is copied every tick
+        if self.block_views is None:
+            self.block_views = tuple(BlockView(b.x, b.y, b.width, b.height, b.color, b.hits) for b in self.blocks)
+        n = self.balls.count
+        balls = BallView(self.balls.x[:n].copy(), self.balls.y[:n].copy(), self.balls.radius[:n].copy(), n)
+        inputs = tuple(self.applied_inputs)
+        self.applied_inputs.clear()
+        return BlockBusterView(self.paddle_x, self.paddle_y, self.paddle_width, self.paddle_height, self.paddle_shake,
+                               self.ball_radius, balls, self.block_views,
+                               tuple(PowerUpView(p.x, p.y, p.type) for p in self.power_ups),
+                               capture_particles(self.particles), self.level, self.score, self.lives,
+                               self.score_animation, self.game_over, self.level_complete, self.paused,
+                               self.background_offset, inputs)
+
+    def next_level(self):
+        self.level += 1
+        self.serve()
+        self.create_blocks()
+        self.level_complete = False
+        self.power_ups.clear()
+        self.paddle_powered = False
+
+    def set_difficulty(self, difficulty: int):
+        self.difficulty = max(1, min(3, difficulty))
+        settings = tuning.current.block_buster.difficulty[self.difficulty - 1]
+        self.ball_speed = settings.ball_speed
+        self.lives = settings.lives
+
+    def snapshot(self) -> bytes:
+        writer = SnapshotWriter(self.SNAPSHOT_KIND, self.SNAPSHOT_VERSION)
+        power_ms = tuning.current.block_buster.power_up_ms
+        power_left = power_ms - (pygame.time.get_ticks() - self.power_timer) if self.paddle_powered else 0
+        writer.write(BUSTER_STATE, self.arcade, self.level, self.score, self.lives, self.difficulty,
+                     self.paddle_x, self.paddle_width, self.ball_speed, self.paused, self.game_over,
+                     self.level_complete, self.paddle_powered, power_left)
+        balls = self.balls
+        for column in (balls.x, balls.y, balls.dx, balls.dy, balls.radius):
+            writer.write_ndarray(column[:balls.count])
+        writer.write_records(BLOCK_STATE, ((b.x, b.y, b.width, b.height, *b.color[:3], b.hits) for b in self.blocks))
+        writer.write_records(POWER_UP_STATE, ((p.x, p.y, POWER_UP_TYPES.index(p.type)) for p in self.power_ups))
+        return writer.getvalue()
+
+    def restore(self, data: bytes):
+        reader = SnapshotReader(data, self.SNAPSHOT_KIND, self.SNAPSHOT_VERSION)
+        (self.arcade, self.level, self.score, self.lives, self.difficulty, self.paddle_x, self.paddle_width,
+         self.ball_speed, self.paused, self.game_over, self.level_complete, self.paddle_powered,
+         power_left) = reader.read(BUSTER_STATE)
+        self.power_timer = pygame.time.get_ticks() - (tuning.current.block_buster.power_up_ms - power_left)
+        self.paddle_target = None
+
+        self.balls = BallSet(self.ARCADE_MAX_BALLS if self.arcade else self.MAX_BALLS)
+        columns = [np.frombuffer(reader.read_items(8), dtype="<f8") for _ in range(5)]
+        n = min(len(columns[0]), self.balls.capacity)
+        for array, column in zip((self.balls.x, self.balls.y, self.balls.dx, self.balls.dy, self.balls.radius),
+                                 columns):
+            array[:n] = column[:n]
+        self.balls.count = n
+
+        self.load_layout()
+        self.blocks.clear()
+        for x, y, width, height, r, g, b, hits in reader.read_records(BLOCK_STATE):
+            self.blocks.spawn(x, y, width, height, (r, g, b), hits)
+        self.block_bounds = None
+        self.block_views = None
+        self.power_ups.clear()
+        for x, y, kind in reader.read_records(POWER_UP_STATE):
+            self.power_ups.spawn(x, y, lookup(POWER_UP_TYPES, kind, "power-up"))
+
+# One tick of Block Buster as the pipelined renderer sees it
+class BallView(NamedTuple):
+    x: np.ndarray
+    y: np.ndarray
+    radius: np.ndarray
+    count: int
+
+class BlockView(NamedTuple):
+    x: int
+    y: int
+    width: int
+    height: int
+    color: tuple
+    hits: int
+
+class PowerUpView(NamedTuple):
+    x: float
+    y: float
+    type: str
+
+class BlockBusterView(NamedTuple):
+    paddle_x: float
+    paddle_y: int
+    paddle_width: int
+    paddle_height: int
+    paddle_shake: int
+    ball_radius: int
+    balls: BallView
+    blocks: tuple
+    power_ups: tuple
+    particles: tuple
+    level: int
+    score: int
+    lives: int
+    score_animation: int
+    game_over: bool
+    level_complete: bool
+    paused: bool
+    background_offset: float
+    inputs: tuple
+
+    draw_background = BlockBusterBonanza.draw_background
+    draw_particles = BlockBusterBonanza.draw_particles
+
+class BlockBusterScene(GameScene):
+    pipelined = True
+    sounds = ("paddle", "brick", "level_complete")
+
+    def create_game(self):
+        return BlockBusterBonanza(self.app.arcade_mode)
+
+    def warm(self):
+        game = self.game
+        tile_sprite((game.paddle_width, game.paddle_height), Colors.NEON_BLUE, Colors.CYAN, 2)
+        tile_sprite((game.ball_radius * 2, game.ball_radius * 2), Colors.WHITE, Colors.NEON_BLUE, 0)
+        yield
+        for block in game.blocks:
+            tile_sprite((block.width, block.height), block.color, Colors.BLACK, 1, 3)
+        yield
+        for color in (Colors.GREEN, Colors.BLUE, Colors.YELLOW, Colors.RED):
+            circle_sprite(8, color, Colors.WHITE)
+
+    def handle_key(self, event):
+        game = self.game
+        if event.key == pygame.K_SPACE and (game.game_over or game.level_complete):
+            if game.game_over:
+                self.app.high_scores.update_score(self.entry.score_key, game.score)
+                game.reset()
+            else:
+                game.next_level()
+
+    def handle_motion(self, event):
+        self.game.move_paddle(display.to_logical(event.pos)[0], event.stamp)
+
+    def update_game(self):
+        if not self.game.paused:
+            self.game.update()
+        if not self.app.pipelined(self):
+            # Pipelined, the inputs count once the view they are in is shown
+            self.app.input_latency.applied(self.game.applied_inputs)
+            self.game.applied_inputs.clear()
+
+    def capture(self) -> BlockBusterView:
+        return self.game.capture()
+
+    def render_game(self, draw_list: DrawList):
+        game = self.view()
+        game.draw_particles(draw_list)
+
+        paddle_offset = math.sin(self.app.animation_timer * 0.5) * 5 if game.paddle_shake > 0 and self.app.enable_animations else 0
+        # The white border saturates under additive blending, so one sprite covers both passes
+        paddle_sprite = tile_sprite((game.paddle_width, game.paddle_height), Colors.NEON_BLUE, Colors.CYAN, 2)
+        draw_list.blit(atlas.surface, (game.paddle_x, game.paddle_y + paddle_offset), paddle_sprite, pygame.BLEND_RGBA_ADD)
+
+        balls = game.balls
+        ball_sprite = tile_sprite((game.ball_radius * 2, game.ball_radius * 2), Colors.WHITE, Colors.NEON_BLUE, 0)
+        ball_left = (balls.x[:balls.count] - balls.radius[:balls.count]).astype(int).tolist()
+        ball_top = (balls.y[:balls.count] - balls.radius[:balls.count]).astype(int).tolist()
+        draw_list.blit_many(atlas.surface, zip(ball_left, ball_top), ball_sprite)
+
+        for block in game.blocks:
+            draw_list.blit(atlas.surface, (block.x, block.y), tile_sprite((block.width, block.height), block.color, Colors.BLACK, 1, 3))
+            if block.hits > 1:
+                hits_text = render_text_with_shadow(str(block.hits), Fonts.small, Colors.WHITE, Colors.BLACK)
+                draw_list.blit(hits_text, (block.x + block.width // 2 - hits_text.get_width() // 2,
+                                           block.y + block.height // 2 - hits_text.get_height() // 2))
+
+        for power in game.power_ups:
+            color = Colors.GREEN if power.type == "expand" else Colors.BLUE if power.type == "slow" else Colors.YELLOW if power.type == "multiball" else Colors.RED
+            draw_list.blit(atlas.surface, (power.x - 8, power.y - 8), circle_sprite(8, color, Colors.WHITE))
+
+        self.draw_title(draw_list, 10)
+        self.draw_hud(draw_list, f"Level: {game.level}", f"Score: {game.score}")
+
+        draw_list.blit(atlas.surface, (WIDTH // 2 - 50, 20), panel_sprite((100, 40), Colors.RED if game.lives <= 1 else Colors.NEON_BLUE))
+        lives_text = render_text_with_shadow(f"{game.lives}", Fonts.game, Colors.WHITE, Colors.BLACK)
+        draw_list.blit(lives_text, (WIDTH // 2 - lives_text.get_width() // 2, 30))
+
+        if game.game_over:
+            self.draw_banner(draw_list, "GAME OVER", Colors.RED, Colors.NEON_PINK)
+            self.draw_caption(draw_list, "Press SPACE to restart", Fonts.game, Colors.WHITE, HEIGHT // 2 + 50)
+        elif game.level_complete:
+            self.draw_banner(draw_list, f"LEVEL {game.level} COMPLETE!", Colors.GREEN, Colors.NEON_BLUE, False)
+            self.draw_caption(draw_list, "Press SPACE for next level", Fonts.game, Colors.WHITE, HEIGHT // 2 + 50)
+
+        self.draw_caption(draw_list, "Press 'P' to pause | Mouse to move paddle", Fonts.small, Colors.YELLOW, HEIGHT - 80)
+
+    def hover_rects(self) -> Optional[List[pygame.Rect]]:
+        # The paddle follows the mouse, so any motion counts
+        return None
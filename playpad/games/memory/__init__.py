@@ -0,0 +1,16 @@
+from playpad.registry import GameEntry
+
+DIFFICULTY = {
+    1: {"time_limit": 60},
+    2: {"time_limit": 45},
+    3: {"time_limit": 30},
+}
+
+ENTRY = GameEntry(
+    key="memory",
+    title="Memory Matching",
+    tooltip="Match cards to test your memory!",
+    score_key="memory_game",
+    difficulty=DIFFICULTY,
+    scene="playpad.games.memory.scene:MemoryScene",
+)
@@ -0,0 +1,351 @@
+import random
+import struct
+import time
+from array import array
+from typing import Optional
+
+import pygame
+
+from playpad.core import (WIDTH, HEIGHT, MAX_PARTICLES, Colors, Fonts, DrawList, EntityPool, Particle, PoolRecord,
+                          atlas, cached_gradient_surface, card_sprite, display, panel_sprite, render_text_with_shadow,
+                          update_particles)
+from playpad.audio import audio
+from playpad.scenes import GameScene
+from playpad.snapshot import SnapshotError, SnapshotReader, SnapshotWriter, lookup
+from playpad.tuning import tuning
+
+# board cols/rows (0 for the classic board), level, moves, score, difficulty, time limit,
+# paused, game over, seconds elapsed, then the layout: cols, card size, margin, origin
+MEMORY_STATE = struct.Struct("<HHBIIBI??dHhhhhh")
+CARD_FACE_UP, CARD_MATCHED = 1, 2
+
+class Card(PoolRecord):
+    __slots__ = ('x', 'y', 'width', 'height', 'symbol', 'face_up', 'matched', 'flip_progress')
+
+    def setup(self, x, y, width, height, symbol):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.symbol = symbol
+        self.face_up = False
+        self.matched = False
+        self.flip_progress = 0
+
+# Game 4: Memory Game
+class MemoryGame:
+    SNAPSHOT_KIND = b"MEMO"
+    SNAPSHOT_VERSION = 1
+    ARCADE_BOARD = (32, 32)
+
+    def __init__(self, cols=None, rows=None):
+        self.board_cols = cols
+        self.board_rows = rows
+        # Large boards get proportionally more time: one classic minute per eight cards
+        self.time_scale = 1 if cols is None else cols * rows // 8
+        self.dirty_cards = set()
+        self.animating = set()
+        self.reset()
+
+    def reset(self):
+        self.level = 1
+        self.cards = EntityPool(Card)
+        self.selected = []
+        self.matched = []
+        self.moves = 0
+        self.score = 0
+        self.game_over = False
+        self.create_cards()
+        self.start_time = time.time()
+        self.time_limit = tuning.current.memory.difficulty[0].time_limit * self.time_scale
+        self.paused = False
+        self.difficulty = 1
+        self.particles = EntityPool(Particle, MAX_PARTICLES)
+        self.score_animation = 0
+        self.background_offset = 0
+
+    def create_cards(self):
+        if self.board_cols is None:
+            pairs = self.level + 2
+            symbols = list(range(1, 13))
+            random.shuffle(symbols)
+            card_symbols = symbols[:pairs] * 2
+            self.card_width = 80
+            self.card_height = 100
+            self.margin = 10
+            self.cols = min(6, pairs + 2)
+        else:
+            # Large board: a distinct symbol per pair, cards sized to fit between the HUD and the footer
+            card_symbols = list(range(1, self.board_cols * self.board_rows // 2 + 1)) * 2
+            self.margin = 2
+            self.cols = self.board_cols
+            self.card_width = (WIDTH - 40) // self.board_cols - self.margin
+            self.card_height = (HEIGHT - 190) // self.board_rows - self.margin
+        random.shuffle(card_symbols)
+        self.rows = (len(card_symbols) + self.cols - 1) // self.cols
+
+        self.start_x = (WIDTH - (self.cols * (self.card_width + self.margin))) // 2
+        self.start_y = (HEIGHT - (self.rows * (self.card_height + self.margin))) // 2
+
+        self.cards.clear()
+        for i, symbol in enumerate(card_symbols):
+            row = i // self.cols
+            col = i % self.cols
+            self.cards.spawn(self.start_x + col * (self.card_width + self.margin),
+                             self.start_y + row * (self.card_height + self.margin),
+                             self.card_width, self.card_height, symbol)
+        self.dirty_cards.clear()
+        self.animating.clear()
+        self.redraw_board = True
+
+    def card_at(self, pos) -> Optional[int]:
+        col, offset_x = divmod(pos[0] - self.start_x, self.card_width + self.margin)
+        row, offset_y = divmod(pos[1] - self.start_y, self.card_height + self.margin)
+        if 0 <= col < self.cols and 0 <= row < self.rows and offset_x <= self.card_width and offset_y <= self.card_height:
+            index = row * self.cols + col
+            if index < len(self.cards):
+                return index
+        return None
+
+    def flip_card(self, index: int):
+        if (len(self.selected) < 2 and
+                index not in self.selected and
+                not self.cards[index].matched):
+            self.cards[index].face_up = True
+            # Grows to full size over the next frames in update()
+            self.cards[index].flip_progress = 0
+            self.animating.add(index)
+            self.selected.append(index)
+            self.dirty_cards.add(index)
+
+            if len(self.selected) == 2:
+                settings = tuning.current.memory
+                self.moves += 1
+                idx1, idx2 = self.selected
+                if self.cards[idx1].symbol == self.cards[idx2].symbol:
+                    self.cards[idx1].matched = True
+                    self.cards[idx2].matched = True
+                    self.matched.extend(self.selected)
+                    points = settings.match_points * self.level * self.difficulty
+                    self.score += points
+                    self.score_animation = points
+                    audio.play("match")
+                    for _ in range(settings.match_particles):
+                        self.particles.spawn(self.cards[idx1].x + self.cards[idx1].width // 2,
+                                             self.cards[idx1].y + self.cards[idx1].height // 2,
+                                             Colors.GREEN, 'circle')
+                    if len(self.matched) == len(self.cards):
+                        audio.play("level_complete")
+                        self.level += 1
+                        if self.level > settings.levels:
+                            self.game_over = True
+                        else:
+                            self.create_cards()
+                            self.selected = []
+                            self.matched = []
+
+    def hide_selected(self):
+        for idx in self.selected:
+            self.cards[idx].face_up = False
+            self.cards[idx].flip_progress = 0
+            self.animating.discard(idx)
+        self.dirty_cards.update(self.selected)
+        self.selected = []
+
+    def time_remaining(self) -> float:
+        if not self.paused:
+            elapsed = time.time() - self.start_time
+            return max(0, self.time_limit / self.difficulty - elapsed)
+        return self.time_limit
+
+    def set_difficulty(self, difficulty: int):
+        self.difficulty = max(1, min(3, difficulty))
+        self.time_limit = tuning.current.memory.difficulty[self.difficulty - 1].time_limit * self.time_scale
+
+    def snapshot(self) -> bytes:
+        writer = SnapshotWriter(self.SNAPSHOT_KIND, self.SNAPSHOT_VERSION)
+        writer.write(MEMORY_STATE, self.board_cols or 0, self.board_rows or 0, self.level, self.moves, self.score,
+                     self.difficulty, self.time_limit, self.paused, self.game_over, time.time() - self.start_time,
+                     self.cols, self.card_width, self.card_height, self.margin, self.start_x, self.start_y)
+        writer.write_array(array("H", [card.symbol for card in self.cards]))
+        writer.write_array(array("B", [card.face_up * CARD_FACE_UP | card.matched * CARD_MATCHED for card in self.cards]))
+        writer.write_array(array("H", self.selected))
+        return writer.getvalue()
+
+    def restore(self, data: bytes):
+        reader = SnapshotReader(data, self.SNAPSHOT_KIND, self.SNAPSHOT_VERSION)
+        (cols, rows, self.level, self.moves, self.score, self.difficulty, self.time_limit, self.paused,
+         self.game_over, elapsed, self.cols, self.card_width, self.card_height, self.margin, self.start_x,
+         self.start_y) = reader.read(MEMORY_STATE)
+        self.board_cols = cols or None
+        self.board_rows = rows or None
+        self.time_scale = 1 if cols == 0 else cols * rows // 8
+        self.start_time = time.time() - elapsed
+        if self.cols == 0:
+            raise SnapshotError("Memory snapshot has no columns")
+
+        symbols = reader.read_array("H")
+        flags = reader.read_array("B")
+        self.rows = (len(symbols) + self.cols - 1) // self.cols
+        self.cards.clear()
+        for i, (symbol, flag) in enumerate(zip(symbols, flags)):
+            row, col = divmod(i, self.cols)
+            card = self.cards.spawn(self.start_x + col * (self.card_width + self.margin),
+                                    self.start_y + row * (self.card_height + self.margin),
+                                    self.card_width, self.card_height, symbol)
+            card.face_up = bool(flag & CARD_FACE_UP)
+            card.matched = bool(flag & CARD_MATCHED)
+            card.flip_progress = 1 if card.face_up else 0
+        self.selected = list(reader.read_array("H"))
+        for index in self.selected:
+            lookup(self.cards, index, "card")
+        self.matched = [i for i, card in enumerate(self.cards) if card.matched]
+        self.dirty_cards.clear()
+        self.animating.clear()
+        self.redraw_board = True
+
+    def update(self):
+        update_particles(self.particles)
+        self.background_offset = (self.background_offset + 0.5) % WIDTH
+        if self.score_animation > 0:
+            self.score_animation -= 1
+        # Only cards part way through a flip are touched, not the whole board
+        for index in list(self.animating):
+            card = self.cards[index]
+            # Ten steps of 0.1 fall just short of 1 in floating point
+            card.flip_progress = card.flip_progress + 0.1 if card.flip_progress < 0.85 else 1
+            self.dirty_cards.add(index)
+            if card.flip_progress == 1:
+                self.animating.discard(index)
+
+    def hide_pending(self) -> bool:
+        # A mismatched pair is showing and waits to be turned back
+        return len(self.selected) == 2 and not self.cards[self.selected[0]].matched
+
+    def is_static(self, animations: bool) -> bool:
+        return ((self.paused or (self.game_over and not animations))
+                and not self.particles and not self.animating and not self.hide_pending())
+
+    def draw_background(self, surface):
+        wave_surface = cached_gradient_surface((WIDTH, HEIGHT), (*Colors.CYAN[:3], 50), Colors.BLACK)
+        for x in range(-WIDTH, WIDTH, 50):
+            pygame.draw.line(surface, Colors.NEON_PINK, ((x + self.background_offset) % WIDTH, 0),
+                            ((x + self.background_offset) % WIDTH, HEIGHT), 1)
+        surface.blit(wave_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+
+    def draw_particles(self, surface):
+        for p in self.particles:
+            p.draw(surface)
+
+# Persistent card layer: only cards that changed state or are mid-flip get redrawn
+class MemoryBoard:
+    def __init__(self):
+        self.layer = None
+        self.animations = None
+
+    def draw_card(self, game: MemoryGame, index: int, animations: bool):
+        card = game.cards[index]
+        x = card.x - game.start_x
+        y = card.y - game.start_y
+        self.layer.fill((0, 0, 0, 0), (x, y, card.width, card.height))
+        scale = 1 - (1 - card.flip_progress) * 0.5 if animations else 1
+        color = Colors.GREEN if card.matched else Colors.BLUE if card.face_up else Colors.WHITE
+        symbol = card.symbol if card.face_up or card.matched else None
+        sprite = card_sprite((card.width, card.height), color, symbol, scale)
+        self.layer.blit(atlas.surface, (x + (card.width - sprite.width) // 2,
+                                        y + (card.height - sprite.height) // 2), sprite)
+
+    def sync(self, game: MemoryGame, animations: bool):
+        size = (game.cols * (game.card_width + game.margin), game.rows * (game.card_height + game.margin))
+        if self.layer is None or self.layer.get_size() != size:
+            self.layer = pygame.Surface(size, pygame.SRCALPHA)
+            game.redraw_board = True
+        if animations != self.animations:
+            self.animations = animations
+            game.redraw_board = True
+
+        if game.redraw_board:
+            self.layer.fill((0, 0, 0, 0))
+            indices = range(len(game.cards))
+            game.redraw_board = False
+        else:
+            indices = game.dirty_cards
+        for index in indices:
+            self.draw_card(game, index, animations)
+        game.dirty_cards.clear()
+
+    def draw(self, surface, game: MemoryGame, animations: bool):
+        self.sync(game, animations)
+        surface.blit(self.layer, (game.start_x, game.start_y))
+
+class MemoryScene(GameScene):
+    sounds = ("match", "level_complete")
+
+    def __init__(self, app, entry):
+        super().__init__(app, entry)
+        self.board = MemoryBoard()
+
+    def create_game(self):
+        return MemoryGame(*MemoryGame.ARCADE_BOARD) if self.app.arcade_mode else MemoryGame()
+
+    def warm(self):
+        game = self.game
+        self.board.sync(game, self.card_flip())
+        yield
+        # Face-up sprites for every symbol, a slice per frame
+        symbols = sorted({card.symbol for card in game.cards})
+        for start in range(0, len(symbols), 64):
+            for symbol in symbols[start:start + 64]:
+                card_sprite((game.card_width, game.card_height), Colors.BLUE, symbol, 1)
+                card_sprite((game.card_width, game.card_height), Colors.GREEN, symbol, 1)
+            yield
+
+    def card_flip(self) -> bool:
+        return self.app.enable_animations and self.app.quality["card_flip"]
+
+    def handle_key(self, event):
+        game = self.game
+        if event.key == pygame.K_SPACE and game.game_over:
+            self.app.high_scores.update_score(self.entry.score_key, game.score)
+            game.reset()
+
+    def handle_click(self, event):
+        game = self.game
+        if game.paused:
+            return
+        if len(game.selected) == 2:
+            game.hide_selected()
+        index = game.card_at(display.to_logical(event.pos))
+        if index is not None:
+            card = game.cards[index]
+            if not card.matched and not card.face_up:
+                game.flip_card(index)
+
+    def game_stats(self) -> dict:
+        return {**super().game_stats(), "moves": self.game.moves}
+
+    def update_game(self):
+        if self.game.time_remaining() <= 0 and not self.game.paused:
+            self.game.game_over = True
+        self.game.update()
+
+    def render_game(self, draw_list: DrawList):
+        game = self.game
+        game.draw_particles(draw_list)
+
+        self.draw_title(draw_list, 10)
+        self.draw_hud(draw_list, f"Level: {game.level}", f"Score: {game.score}")
+
+        draw_list.blit(atlas.surface, (WIDTH // 2 - 50, 20), panel_sprite((100, 40), Colors.YELLOW if game.time_remaining() < 10 else Colors.NEON_BLUE))
+        time_text = render_text_with_shadow(f"{int(game.time_remaining())}s", Fonts.game, Colors.YELLOW if game.time_remaining() < 10 else Colors.WHITE, Colors.BLACK)
+        draw_list.blit(time_text, (WIDTH // 2 - time_text.get_width() // 2, 30))
+
+        self.board.draw(draw_list, game, self.card_flip())
+
+        if game.game_over:
+            self.draw_banner(draw_list, "GAME OVER", Colors.RED, Colors.NEON_PINK)
+            if game.level > tuning.current.memory.levels:
+                self.draw_caption(draw_list, "You completed all levels!", Fonts.game, Colors.GREEN, HEIGHT // 2 + 20)
+            self.draw_caption(draw_list, "Press SPACE to restart", Fonts.game, Colors.WHITE, HEIGHT // 2 + 80)
+
+        self.draw_caption(draw_list, "Press 'P' to pause", Fonts.small, Colors.YELLOW, HEIGHT - 80)
@@ -0,0 +1,16 @@
+from playpad.registry import GameEntry
+
+DIFFICULTY = {
+    1: {"time_limit": 30, "lives": 5},
+    2: {"time_limit": 20, "lives": 3},
+    3: {"time_limit": 15, "lives": 2},
+}
+
+ENTRY = GameEntry(
+    key="scrambled_saga",
+    title="Scrambled Saga",
+    tooltip="Unscramble words to score points!",
+    score_key="scrambled_saga",
+    difficulty=DIFFICULTY,
+    scene="playpad.games.scrambled_saga.scene:ScrambledSagaScene",
+)
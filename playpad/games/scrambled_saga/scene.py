@@ -0,0 +1,213 @@
+import random
+import struct
+import time
+
+import pygame
+
+from playpad.core import (WIDTH, HEIGHT, MAX_PARTICLES, Colors, Fonts, DrawList, EntityPool, Particle, atlas,
+                          cached_gradient_surface, heart_sprite, panel_sprite, render_text_with_gradient,
+                          render_text_with_shadow, update_particles)
+from playpad.audio import audio
+from playpad.scenes import GameScene
+from playpad.snapshot import SnapshotReader, SnapshotWriter
+from playpad.telemetry import telemetry
+from playpad.tuning import tuning
+
+# level, score, lives, difficulty, time limit, hint used, paused, seconds elapsed on the word
+SAGA_STATE = struct.Struct("<HIbBH??d")
+
+# Game 1: Scrambled Saga
+class ScrambledSaga:
+    SNAPSHOT_KIND = b"SAGA"
+    SNAPSHOT_VERSION = 1
+
+    def __init__(self):
+        self.level = 1
+        self.score = 0
+        self.lives = 3
+        self.current_word = ""
+        self.scrambled_word = ""
+        self.user_input = ""
+        self.words_by_level = {
+            1: ["banana", "dog", "cat", "tree", "book", "water", "eraser"],
+            2: ["lizard", "giraffe", "kangaroo", "computer", "keyboard", "monitor", "clap"],
+            3: ["extravaganza", "magnificent", "quadrilateral", "piano", "quintessential"]
+        }
+        self.time_limit = 30
+        self.start_time = 0
+        self.hint_used = False
+        self.paused = False
+        self.difficulty = 1
+        self.particles = EntityPool(Particle, MAX_PARTICLES)
+        self.score_animation = 0
+        self.background_offset = 0
+
+    def new_word(self):
+        word_list = self.words_by_level.get(self.level, self.words_by_level[3])
+        self.current_word = random.choice(word_list)
+        self.scrambled_word = self.scramble_word(self.current_word)
+        self.user_input = ""
+        self.hint_used = False
+        self.start_time = time.time()
+
+    def scramble_word(self, word: str) -> str:
+        letters = list(word)
+        while True:
+            random.shuffle(letters)
+            scrambled = ''.join(letters)
+            if scrambled != word:
+                return scrambled
+
+    def check_answer(self) -> bool:
+        if self.user_input.lower() == self.current_word.lower():
+            settings = tuning.current.scrambled_saga
+            score_multipliers = {1: 1, 2: 2, 3: 3}
+            points = len(self.current_word) * score_multipliers.get(self.difficulty, 1)
+            if not self.hint_used:
+                points += settings.no_hint_bonus
+            self.score += points
+            self.score_animation = points
+            audio.play("match")
+            for _ in range(settings.answer_particles):
+                self.particles.spawn(WIDTH // 2, HEIGHT // 2, Colors.YELLOW, random.choice(['circle', 'square']))
+            return True
+        self.lives -= 1
+        audio.play("wrong")
+        telemetry.emit("life_lost", game="scrambled_saga", level=self.level, cause="wrong")
+        return False
+
+    def get_hint(self) -> str:
+        self.hint_used = True
+        telemetry.emit("hint", game="scrambled_saga", level=self.level)
+        hint = ""
+        for i, letter in enumerate(self.current_word):
+            if i < len(self.current_word) // 2:
+                hint += letter
+            else:
+                hint += "_"
+        return hint
+
+    def time_remaining(self) -> float:
+        if not self.paused:
+            elapsed = time.time() - self.start_time
+            return max(0, self.time_limit - elapsed * self.difficulty)
+        return self.time_limit
+
+    def set_difficulty(self, difficulty: int):
+        self.difficulty = max(1, min(3, difficulty))
+        settings = tuning.current.scrambled_saga.difficulty[self.difficulty - 1]
+        self.time_limit = settings.time_limit
+        self.lives = settings.lives
+
+    @property
+    def game_over(self) -> bool:
+        return self.lives <= 0
+
+    def snapshot(self) -> bytes:
+        writer = SnapshotWriter(self.SNAPSHOT_KIND, self.SNAPSHOT_VERSION)
+        writer.write(SAGA_STATE, self.level, self.score, self.lives, self.difficulty, self.time_limit,
+                     self.hint_used, self.paused, time.time() - self.start_time)
+        writer.write_str(self.current_word)
+        writer.write_str(self.scrambled_word)
+        writer.write_str(self.user_input)
+        return writer.getvalue()
+
+    def restore(self, data: bytes):
+        reader = SnapshotReader(data, self.SNAPSHOT_KIND, self.SNAPSHOT_VERSION)
+        (self.level, self.score, self.lives, self.difficulty, self.time_limit,
+         self.hint_used, self.paused, elapsed) = reader.read(SAGA_STATE)
+        self.start_time = time.time() - elapsed
+        self.current_word = reader.read_str()
+        self.scrambled_word = reader.read_str()
+        self.user_input = reader.read_str()
+
+    def update(self):
+        update_particles(self.particles)
+        self.background_offset = (self.background_offset + 0.5) % HEIGHT
+        if self.score_animation > 0:
+            self.score_animation -= 1
+
+    def is_static(self, animations: bool) -> bool:
+        return self.paused and not self.particles
+
+    def draw_background(self, surface):
+        cloud_surface = cached_gradient_surface((WIDTH, HEIGHT), (*Colors.PURPLE[:3], 50), Colors.BLACK)
+        for y in range(-HEIGHT, HEIGHT, 100):
+            pygame.draw.ellipse(surface, Colors.WHITE, (100, (y + self.background_offset) % HEIGHT, 200, 50), 2)
+        surface.blit(cloud_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+
+    def draw_particles(self, surface):
+        for p in self.particles:
+            p.draw(surface)
+
+class ScrambledSagaScene(GameScene):
+    sounds = ("match", "wrong")
+
+    def create_game(self):
+        return ScrambledSaga()
+
+    def new_game(self):
+        self.game.new_word()
+
+    def warm(self):
+        heart_sprite()
+        panel_sprite((100, 40), Colors.RED)
+        panel_sprite((100, 40), Colors.NEON_BLUE)
+        panel_sprite((100, 40), Colors.YELLOW)
+        yield
+
+    def handle_key(self, event):
+        game = self.game
+        if game.paused:
+            return
+        if event.key == pygame.K_RETURN:
+            if game.check_answer():
+                if game.lives > 0:
+                    game.new_word()
+                else:
+                    self.finish()
+            elif game.lives <= 0:
+                self.finish()
+        elif event.key == pygame.K_BACKSPACE:
+            game.user_input = game.user_input[:-1]
+        elif event.key == pygame.K_h:
+            hint = game.get_hint()
+            game.user_input = hint.replace("_", "")
+        elif len(game.user_input) < len(game.current_word):
+            char = event.unicode
+            if char.isalnum():
+                game.user_input += char
+
+    def update_game(self):
+        game = self.game
+        if not game.game_over and game.time_remaining() <= 0 and not game.paused:
+            game.lives -= 1
+            telemetry.emit("life_lost", game="scrambled_saga", level=game.level, cause="timeout")
+            if game.lives <= 0:
+                self.finish()
+            else:
+                game.new_word()
+        game.update()
+
+    def render_game(self, draw_list: DrawList):
+        game = self.game
+        game.draw_particles(draw_list)
+        self.draw_title(draw_list, 50)
+        self.draw_hud(draw_list, f"Level: {game.level}", f"Score: {game.score}")
+
+        draw_list.blit(atlas.surface, (WIDTH // 2 - 50, 20), panel_sprite((100, 40), Colors.RED if game.lives <= 1 else Colors.NEON_BLUE))
+        heart = heart_sprite()
+        hearts_x = WIDTH // 2 - heart.width * game.lives // 2
+        for i in range(game.lives):
+            draw_list.blit(atlas.surface, (hearts_x + i * heart.width, 30), heart)
+
+        draw_list.blit(atlas.surface, (WIDTH // 2 - 50, 120), panel_sprite((100, 40), Colors.YELLOW if game.time_remaining() < 10 else Colors.NEON_BLUE))
+        time_text = render_text_with_shadow(f"{int(game.time_remaining())}s", Fonts.game, Colors.YELLOW if game.time_remaining() < 10 else Colors.WHITE, Colors.BLACK)
+        draw_list.blit(time_text, (WIDTH // 2 - time_text.get_width() // 2, 130))
+
+        scrambled_text = render_text_with_gradient(game.scrambled_word, Fonts.title, Colors.CYAN, Colors.NEON_BLUE)
+        draw_list.blit(scrambled_text, (WIDTH // 2 - scrambled_text.get_width() // 2, 200))
+
+        self.draw_caption(draw_list, f"Your answer: {game.user_input}", Fonts.game, Colors.WHITE, 300)
+        self.draw_caption(draw_list, "Press 'H' for hint (reduces bonus)", Fonts.small, Colors.YELLOW, 350)
+        self.draw_caption(draw_list, "Press 'P' to pause", Fonts.small, Colors.YELLOW, 380)
@@ -0,0 +1,25 @@
+from playpad.registry import GameEntry
+
+DIFFICULTY = {
+    1: {"speed": 10},
+    2: {"speed": 8},
+    3: {"speed": 6},
+}
+
+ENTRY = GameEntry(
+    key="snake",
+    title="Snake Eating Fruit",
+    tooltip="Grow your snake by eating fruit!",
+    score_key="snake_game",
+    difficulty=DIFFICULTY,
+    scene="playpad.games.snake.scene:SnakeScene",
+)
+
+ONLINE_ENTRY = GameEntry(
+    key="snake_online",
+    title="Snake Head-to-Head",
+    tooltip="Race other players to the fruit over the network!",
+    score_key="snake_online",
+    difficulty=DIFFICULTY,
+    scene="playpad.games.snake.online:OnlineSnakeScene",
+)
@@ -0,0 +1,158 @@
+import os
+
+# Environments never open a window or an audio device, though importing the
+# game modules initialises both
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from playpad.games.snake.net import DIRECTIONS
+from playpad.games.snake.scene import SnakeGame
+
+# Gym-style Snake. Actions index DIRECTIONS (up, down, left, right) and
+# observations are a (rows, cols) int8 grid of the values below. Reward is
+# +1 per fruit and -1 on death; one step is one move of the snake, so speed
+# and difficulty play no part.
+EMPTY, BODY, HEAD, FRUIT, SPECIAL = 0, 1, 2, 3, 4
+DX = np.array([dx for dx, _ in DIRECTIONS])
+DY = np.array([dy for _, dy in DIRECTIONS])
+
+class SnakeEnv:
+    num_actions = len(DIRECTIONS)
+
+    def __init__(self, cols: int = 20, rows: int = 15):
+        self.cols = cols
+        self.rows = rows
+        self.obs = np.zeros((rows, cols), dtype=np.int8)
+        self.game = SnakeGame(cols, rows, cell_size=1)
+
+    def reset(self) -> np.ndarray:
+        self.game.reset()
+        self.obs.fill(EMPTY)
+        self.sync()
+        return self.obs
+
+    def sync(self):
+        # Only the cells the game marked dirty change between steps
+        game = self.game
+        for x, y in game.dirty_cells:
+            if 0 <= x < self.cols and 0 <= y < self.rows:
+                self.obs[y, x] = BODY if (x, y) in game.occupied else EMPTY
+        game.dirty_cells.clear()
+        if game.snake_body:
+            x, y = game.snake_body[-1]
+            self.obs[y, x] = HEAD
+            if len(game.snake_body) > 1:
+                x, y = game.snake_body[-2]
+                self.obs[y, x] = BODY
+        if game.special_fruit:
+            self.obs[game.special_fruit.y, game.special_fruit.x] = SPECIAL
+        self.obs[game.fruit_y, game.fruit_x] = FRUIT
+
+    def step(self, action: int):
+        game = self.game
+        game.queue_turn(*DIRECTIONS[action])
+        length = game.snake_length
+        game.step(pygame.time.get_ticks())
+        if game.game_over:
+            return self.obs, -1.0, True
+        self.sync()
+        return self.obs, float(game.snake_length - length), False
+
+# Steps num_envs snakes at once on (num_envs, rows, cols) arrays. Each cell
+# holds how many more steps the body stays there, so moving is a decrement
+# and eating adds a step to every body cell. The rules match SnakeGame's
+# except that there is no special fruit; reversing is ignored like a
+# rejected turn. Finished envs reset on the next step and an episode is cut
+# short after max_idle steps without fruit.
+class SnakeVecEnv:
+    num_actions = len(DIRECTIONS)
+
+    def __init__(self, num_envs: int, cols: int = 20, rows: int = 15, seed: int = None, max_idle: int = 1000,
+                 buffers: dict = None):
+        buffers = buffers or {}
+        self.num_envs = num_envs
+        self.cols = cols
+        self.rows = rows
+        self.max_idle = max_idle
+        self.rng = np.random.default_rng(seed)
+        self.index = np.arange(num_envs)
+        self.life = np.zeros((num_envs, rows, cols), dtype=np.int32)
+        self.head_x = np.zeros(num_envs, dtype=np.int64)
+        self.head_y = np.zeros(num_envs, dtype=np.int64)
+        self.direction = np.zeros(num_envs, dtype=np.int64)
+        self.length = np.zeros(num_envs, dtype=np.int32)
+        self.fruit_x = np.zeros(num_envs, dtype=np.int64)
+        self.fruit_y = np.zeros(num_envs, dtype=np.int64)
+        self.idle = np.zeros(num_envs, dtype=np.int32)
+        self.obs = buffers.get("obs", np.zeros((num_envs, rows, cols), dtype=np.int8))
+        self.rewards = buffers.get("rewards", np.zeros(num_envs, dtype=np.float32))
+        self.dones = buffers.get("dones", np.zeros(num_envs, dtype=np.bool_))
+        self.reset()
+
+    def reset(self) -> np.ndarray:
+        self.reset_envs(self.index)
+        self.rewards.fill(0)
+        self.dones.fill(False)
+        self.observe()
+        return self.obs
+
+    def reset_envs(self, envs: np.ndarray):
+        self.life[envs] = 0
+        self.head_x[envs] = self.cols // 2
+        self.head_y[envs] = self.rows // 2
+        self.direction[envs] = 3
+        self.length[envs] = 1
+        self.idle[envs] = 0
+        self.life[envs, self.head_y[envs], self.head_x[envs]] = 1
+        self.place_fruit(envs)
+
+    def place_fruit(self, envs: np.ndarray):
+        # A random free cell per env: the highest random priority among empty cells
+        priority = self.rng.random((len(envs), self.rows * self.cols))
+        priority[self.life[envs].reshape(len(envs), -1) > 0] = -1
+        cells = priority.argmax(axis=1)
+        self.fruit_y[envs], self.fruit_x[envs] = np.divmod(cells, self.cols)
+
+    def step(self, actions):
+        if self.dones.any():
+            self.reset_envs(np.flatnonzero(self.dones))
+
+        actions = np.asarray(actions)
+        turn = (DX[actions] != -DX[self.direction]) | (DY[actions] != -DY[self.direction])
+        self.direction = np.where(turn, actions, self.direction)
+        self.head_x += DX[self.direction]
+        self.head_y += DY[self.direction]
+
+        inside = (self.head_x >= 0) & (self.head_x < self.cols) & (self.head_y >= 0) & (self.head_y < self.rows)
+        x = np.clip(self.head_x, 0, self.cols - 1)
+        y = np.clip(self.head_y, 0, self.rows - 1)
+        # The tail has not moved yet when the head arrives, as in SnakeGame.step
+        dead = ~inside | (self.life[self.index, y, x] > 0)
+        alive = ~dead
+
+        np.subtract(self.life, 1, out=self.life, where=self.life > 0)
+        self.life[self.index[alive], y[alive], x[alive]] = self.length[alive]
+        ate = alive & (x == self.fruit_x) & (y == self.fruit_y)
+        if ate.any():
+            eaters = np.flatnonzero(ate)
+            grown = self.life[eaters]
+            grown[grown > 0] += 1
+            self.life[eaters] = grown
+            self.length[eaters] += 1
+            self.place_fruit(eaters)
+
+        self.idle = np.where(ate, 0, self.idle + 1)
+        self.rewards[:] = ate
+        self.rewards[dead] = -1
+        self.dones[:] = dead | (self.idle >= self.max_idle)
+        self.observe()
+        return self.obs, self.rewards, self.dones
+
+    def observe(self):
+        np.minimum(self.life, BODY, out=self.obs, casting="unsafe")
+        inside = (self.head_x >= 0) & (self.head_x < self.cols) & (self.head_y >= 0) & (self.head_y < self.rows)
+        self.obs[self.index[inside], self.head_y[inside], self.head_x[inside]] = HEAD
+        self.obs[self.index, self.fruit_y, self.fruit_x] = FRUIT
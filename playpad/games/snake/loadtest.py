@@ -0,0 +1,94 @@
+import os
+
+# Bots never draw; keep SDL from opening a window when playpad.core initialises
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+
+from playpad.games.snake.net import DIRECTIONS, FRUIT, SnakeClient, SnakeServer
+
+# python -m playpad.games.snake.loadtest --bots 8 --seconds 30
+# Connects bots to a match (hosted in-process unless --port is given) and
+# reports the server's tick time and the bandwidth each player uses.
+class Bot(SnakeClient):
+    def __init__(self):
+        super().__init__()
+        self.heading = None
+
+    def apply(self, payload: bytes):
+        last_head = self.head
+        super().apply(payload)
+        if self.head is None:
+            return
+        if last_head is not None and self.head != last_head:
+            move = (self.head[0] - last_head[0], self.head[1] - last_head[1])
+            if move in DIRECTIONS:
+                self.heading = DIRECTIONS.index(move)
+        self.steer()
+
+    def steer(self):
+        # Greedy: the free neighbour closest to the fruit, never straight back
+        hx, hy = self.head
+        fx, fy = self.fruit or (hx, hy)
+        choices = []
+        for direction, (dx, dy) in enumerate(DIRECTIONS):
+            if self.heading is not None and DIRECTIONS[self.heading] == (-dx, -dy):
+                continue
+            cell = (hx + dx, hy + dy)
+            if not (0 <= cell[0] < self.cols and 0 <= cell[1] < self.rows):
+                continue
+            if self.cells.get(cell, FRUIT) != FRUIT:
+                continue
+            choices.append((abs(cell[0] - fx) + abs(cell[1] - fy), random.random(), direction))
+        if choices:
+            direction = min(choices)[2]
+            if direction != self.heading:
+                self.turn(direction)
+
+async def run(args):
+    server = None
+    port = args.port
+    if port is None:
+        server = SnakeServer(port=0, tick_rate=args.tick_rate, cols=args.cols, rows=args.rows,
+                             max_players=args.bots, min_players=1)
+        await server.start()
+        port = server.port
+
+    bots = [Bot() for _ in range(args.bots)]
+    for bot in bots:
+        await bot.connect(args.host, port)
+    tasks = [asyncio.get_running_loop().create_task(bot.receive()) for bot in bots]
+    await asyncio.sleep(args.seconds)
+    for bot in bots:
+        bot.close()
+    await asyncio.gather(*tasks)
+
+    print(f"{len(bots)} bots for {args.seconds:.0f}s at {args.tick_rate} ticks/s on a {args.cols}x{args.rows} board")
+    if server is not None:
+        times = sorted(t * 1000 for t in server.tick_times)
+        print(f"tick time: mean {statistics.mean(times):.3f} ms, p95 {times[int(len(times) * 0.95)]:.3f} ms, "
+              f"max {times[-1]:.3f} ms over {len(times)} ticks")
+        await server.stop()
+    down = statistics.mean(bot.bytes_received for bot in bots) / args.seconds
+    up = statistics.mean(bot.bytes_sent for bot in bots) / args.seconds
+    print(f"per player: {down:.0f} B/s down, {up:.0f} B/s up")
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the Snake server with bots")
+    parser.add_argument("--bots", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="connect to a running server instead of hosting one")
+    parser.add_argument("--tick-rate", type=int, default=10)
+    parser.add_argument("--cols", type=int, default=64)
+    parser.add_argument("--rows", type=int, default=48)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+import asyncio
+import logging
+import random
+import socket
+import struct
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from playpad.games.snake.scene import SnakeGame
+
+logger = logging.getLogger("playpad")
+
+# Head-to-head Snake over TCP. The server owns the only simulation and steps it
+# at a fixed tick rate; clients send turns and draw whatever the server says is
+# in each cell. Every message is a length-prefixed binary frame:
+#
+#     frame     !H       payload length, then the payload
+#     HELLO     !BBBHHB  type, player id (NO_SLOT when full), max players, cols, rows, tick rate
+#     TURN      !BB      type, direction (index into DIRECTIONS)
+#     SNAPSHOT  !BIHB    type, tick, cell count, player count
+#               !HHB     per cell: x, y, value (EMPTY, FRUIT or SNAKE + player id)
+#               !BBHI    per player: id, alive, length, score
+#
+# A snapshot only carries the cells and player rows that changed since the
+# previous tick; a player who left is sent once more with length 0. A client
+# that joins late first gets one with every non-empty cell and every player.
+DEFAULT_PORT = 7777
+MSG_HELLO, MSG_TURN, MSG_SNAPSHOT = 1, 2, 3
+NO_SLOT = 0xFF
+EMPTY, FRUIT, SNAKE = 0, 1, 2
+DIRECTIONS = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+RESPAWN_TICKS = 20
+# A client that falls this far behind is dropped rather than buffered forever
+MAX_BUFFERED = 256 * 1024
+
+FRAME = struct.Struct("!H")
+HELLO = struct.Struct("!BBBHHB")
+TURN = struct.Struct("!BB")
+SNAPSHOT = struct.Struct("!BIHB")
+CELL = struct.Struct("!HHB")
+PLAYER = struct.Struct("!BBHI")
+
+Cell = Tuple[int, int]
+
+class ProtocolError(ValueError):
+    pass
+
+def pack_frame(payload: bytes) -> bytes:
+    return FRAME.pack(len(payload)) + payload
+
+async def read_frame(reader: asyncio.StreamReader, max_size: int = 0xFFFF) -> bytes:
+    # Every message starts with its type byte, so an empty frame is malformed too
+    size, = FRAME.unpack(await reader.readexactly(FRAME.size))
+    if not 0 < size <= max_size:
+        raise ProtocolError(f"frame of {size} bytes (at most {max_size})")
+    return await reader.readexactly(size)
+
+def check_snapshot(payload: bytes):
+    if len(payload) < SNAPSHOT.size:
+        raise ProtocolError(f"snapshot of {len(payload)} bytes")
+    _, _, cell_count, player_count = SNAPSHOT.unpack_from(payload)
+    if len(payload) != SNAPSHOT.size + cell_count * CELL.size + player_count * PLAYER.size:
+        raise ProtocolError(f"snapshot of {len(payload)} bytes for {cell_count} cells and {player_count} players")
+
+def encode_snapshot(tick: int, cells: Dict[Cell, int], players: List[Tuple[int, int, int, int]]) -> bytes:
+    parts = [SNAPSHOT.pack(MSG_SNAPSHOT, tick, len(cells), len(players))]
+    parts.extend(CELL.pack(x, y, value) for (x, y), value in cells.items())
+    parts.extend(PLAYER.pack(*row) for row in players)
+    return pack_frame(b"".join(parts))
+
+def decode_snapshot(payload: bytes):
+    _, tick, cell_count, player_count = SNAPSHOT.unpack_from(payload)
+    offset = SNAPSHOT.size
+    cells = []
+    for _ in range(cell_count):
+        x, y, value = CELL.unpack_from(payload, offset)
+        cells.append(((x, y), value))
+        offset += CELL.size
+    players = [PLAYER.unpack_from(payload, offset + i * PLAYER.size) for i in range(player_count)]
+    return tick, cells, players
+
+# One player's snake on the shared board. The fruit belongs to the match, so
+# eating it moves it for everyone.
+class ArenaSnake(SnakeGame):
+    def __init__(self, match, player_id: int):
+        self.match = match
+        self.player_id = player_id
+        self.spawning = False
+        super().__init__(match.cols, match.rows, cell_size=1)
+
+    def reset(self):
+        self.spawning = True
+        super().reset()
+        self.spawning = False
+        self.snake_x, self.snake_y, self.snake_dx = self.match.spawn_point(self.player_id)
+        self.fruit_x, self.fruit_y = self.match.fruit
+
+    def place_fruit(self):
+        if not self.spawning:
+            self.match.place_fruit()
+
+class SnakeMatch:
+    def __init__(self, cols: int = 64, rows: int = 48, max_players: int = 8):
+        # Cell coordinates and values have to fit the snapshot encoding
+        if cols * rows * CELL.size + SNAPSHOT.size > 0xFFFF or max_players > 0xFF - SNAKE:
+            raise ValueError(f"{cols}x{rows} board with {max_players} players does not fit a snapshot frame")
+        self.cols = cols
+        self.rows = rows
+        self.max_players = max_players
+        self.snakes: Dict[int, ArenaSnake] = {}
+        self.respawn: Dict[int, int] = {}
+        self.tick = 0
+        self.fruit = (0, 0)
+        self.dirty = set()
+        self.sent_players = {}
+        self.place_fruit()
+
+    def spawn_point(self, player_id: int) -> Tuple[int, int, int]:
+        # Every player has a lane of their own, entered alternately from the left and right
+        y = (player_id + 1) * self.rows // (self.max_players + 1)
+        if player_id % 2 == 0:
+            return self.cols // 4, y, 1
+        return self.cols * 3 // 4, y, -1
+
+    def blocked(self, cell: Cell) -> bool:
+        return any(cell in snake.occupied for snake in self.snakes.values())
+
+    def place_fruit(self):
+        self.dirty.add(self.fruit)
+        cell = (random.randrange(self.cols), random.randrange(self.rows))
+        while self.blocked(cell):
+            cell = (random.randrange(self.cols), random.randrange(self.rows))
+        self.fruit = cell
+        self.dirty.add(cell)
+        for snake in self.snakes.values():
+            snake.fruit_x, snake.fruit_y = cell
+
+    def add_player(self) -> Optional[int]:
+        for player_id in range(self.max_players):
+            if player_id not in self.snakes:
+                self.snakes[player_id] = ArenaSnake(self, player_id)
+                return player_id
+        return None
+
+    def remove_player(self, player_id: int):
+        self.clear_body(self.snakes.pop(player_id))
+        self.respawn.pop(player_id, None)
+
+    def turn(self, player_id: int, direction: int):
+        dx, dy = DIRECTIONS[direction]
+        self.snakes[player_id].queue_turn(dx, dy)
+
+    def clear_body(self, snake: ArenaSnake):
+        self.dirty.update(snake.occupied)
+        self.dirty.update(snake.dirty_cells)
+        snake.occupied.clear()
+        snake.snake_body.clear()
+        snake.dirty_cells.clear()
+
+    def cell_value(self, cell: Cell) -> int:
+        if cell == self.fruit:
+            return FRUIT
+        for player_id, snake in self.snakes.items():
+            if cell in snake.occupied:
+                return SNAKE + player_id
+        return EMPTY
+
+    def player_rows(self) -> Dict[int, Tuple[int, int, int, int]]:
+        return {player_id: (player_id, int(not snake.game_over), snake.snake_length, snake.score)
+                for player_id, snake in self.snakes.items()}
+
+    def step(self):
+        self.tick += 1
+        moving = [snake for snake in self.snakes.values() if not snake.game_over]
+        for snake in moving:
+            snake.step(self.tick)
+
+        # Heads are checked against the other snakes only once everyone has
+        # moved, so the outcome does not depend on the order they stepped in.
+        # Two heads meeting in one cell both die.
+        crashed = []
+        for snake in moving:
+            head = (snake.snake_x, snake.snake_y)
+            if any(head in other.occupied for other in moving if other is not snake):
+                crashed.append(snake)
+        for snake in crashed:
+            snake.game_over = True
+
+        for player_id, snake in self.snakes.items():
+            if snake.game_over and player_id not in self.respawn:
+                self.clear_body(snake)
+                self.respawn[player_id] = self.tick + RESPAWN_TICKS
+        for player_id, tick in list(self.respawn.items()):
+            x, y, dx = self.spawn_point(player_id)
+            if tick <= self.tick and not self.blocked((x, y)) and not self.blocked((x + dx, y)):
+                self.snakes[player_id].reset()
+                del self.respawn[player_id]
+
+        for snake in self.snakes.values():
+            self.dirty.update(snake.dirty_cells)
+            snake.dirty_cells.clear()
+
+    def delta_snapshot(self) -> bytes:
+        cells = {cell: self.cell_value(cell) for cell in self.dirty}
+        self.dirty.clear()
+        rows = self.player_rows()
+        changed = [row for player_id, row in rows.items() if self.sent_players.get(player_id) != row]
+        # A player who left is sent once with length 0
+        changed.extend((player_id, 0, 0, 0) for player_id in self.sent_players if player_id not in rows)
+        self.sent_players = rows
+        return encode_snapshot(self.tick, cells, changed)
+
+    def full_snapshot(self) -> bytes:
+        cells = {self.fruit: FRUIT}
+        for player_id, snake in self.snakes.items():
+            for cell in snake.occupied:
+                cells[cell] = SNAKE + player_id
+        return encode_snapshot(self.tick, cells, list(self.player_rows().values()))
+
+class SnakeServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT, tick_rate: int = 10,
+                 cols: int = 64, rows: int = 48, max_players: int = 8, min_players: int = 2):
+        self.host = host
+        self.port = port
+        self.tick_rate = tick_rate
+        self.min_players = min_players
+        self.match = SnakeMatch(cols, rows, max_players)
+        self.writers: Dict[int, asyncio.StreamWriter] = {}
+        self.handlers = set()
+        self.server = None
+        self.ticker = None
+        self.tick_times = deque(maxlen=10000)
+        self.bytes_sent = 0
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        # Port 0 asks the OS for a free one
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.ticker = asyncio.get_running_loop().create_task(self.run())
+        logger.info("Snake server listening on %s:%d", self.host, self.port)
+
+    async def stop(self):
+        self.ticker.cancel()
+        self.server.close()
+        # Closing the connections lets each handler see EOF and clean up after itself
+        for writer in self.writers.values():
+            writer.close()
+        await asyncio.gather(self.ticker, *self.handlers, return_exceptions=True)
+        await self.server.wait_closed()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        match = self.match
+        player_id = match.add_player()
+        hello = HELLO.pack(MSG_HELLO, NO_SLOT if player_id is None else player_id, match.max_players,
+                           match.cols, match.rows, self.tick_rate)
+        writer.write(pack_frame(hello))
+        if player_id is None:
+            writer.close()
+            return
+
+        logger.info("Player %d joined from %s", player_id, writer.get_extra_info("peername"))
+        writer.write(match.full_snapshot())
+        self.writers[player_id] = writer
+        handler = asyncio.current_task()
+        self.handlers.add(handler)
+        try:
+            while True:
+                # Turns are the only thing clients send
+                payload = await read_frame(reader, TURN.size)
+                if payload[0] == MSG_TURN:
+                    if len(payload) != TURN.size:
+                        raise ProtocolError(f"turn of {len(payload)} bytes")
+                    _, direction = TURN.unpack(payload)
+                    if direction < len(DIRECTIONS):
+                        match.turn(player_id, direction)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except ProtocolError as e:
+            logger.warning("Dropping player %d: %s", player_id, e)
+        finally:
+            self.handlers.discard(handler)
+            self.drop(player_id)
+
+    def drop(self, player_id: int):
+        writer = self.writers.pop(player_id, None)
+        if writer is not None:
+            writer.close()
+            self.match.remove_player(player_id)
+            logger.info("Player %d left", player_id)
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        interval = 1 / self.tick_rate
+        next_tick = loop.time()
+        while True:
+            next_tick += interval
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            if len(self.writers) < self.min_players:
+                next_tick = loop.time()
+                continue
+
+            start = time.perf_counter()
+            self.match.step()
+            frame = self.match.delta_snapshot()
+            for player_id, writer in list(self.writers.items()):
+                if writer.transport.get_write_buffer_size() > MAX_BUFFERED:
+                    logger.warning("Player %d is not keeping up, dropping them", player_id)
+                    self.drop(player_id)
+                    continue
+                writer.write(frame)
+                self.bytes_sent += len(frame)
+            self.tick_times.append(time.perf_counter() - start)
+
+class SnakeClient:
+    def __init__(self):
+        self.reader = None
+        self.writer = None
+        self.player_id = None
+        self.cols = self.rows = self.tick_rate = 0
+        self.tick = 0
+        self.cells: Dict[Cell, int] = {}
+        self.players: Dict[int, Tuple[int, int, int]] = {}
+        self.fruit = None
+        self.head = None
+        self.bytes_received = 0
+        self.bytes_sent = 0
+
+    async def connect(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT):
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        self.writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        payload = await read_frame(self.reader)
+        self.bytes_received += FRAME.size + len(payload)
+        if len(payload) != HELLO.size or payload[0] != MSG_HELLO:
+            self.writer.close()
+            raise ProtocolError(f"{host}:{port} did not answer with a Snake hello")
+        _, self.player_id, _, self.cols, self.rows, self.tick_rate = HELLO.unpack(payload)
+        if self.player_id == NO_SLOT:
+            self.writer.close()
+            raise ConnectionError(f"The match on {host}:{port} is full")
+
+    async def receive(self, handler=None):
+        # Runs until the server goes away. The handler defaults to applying
+        # snapshots here; a UI thread can pass a queue's put instead.
+        handler = handler or self.apply
+        try:
+            while True:
+                payload = await read_frame(self.reader)
+                self.bytes_received += FRAME.size + len(payload)
+                if payload[0] == MSG_SNAPSHOT:
+                    # Checked here, so a handler on another thread never decodes a bad one
+                    check_snapshot(payload)
+                    handler(payload)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except ProtocolError as e:
+            logger.warning("Disconnecting from the server: %s", e)
+            self.writer.close()
+
+    def apply(self, payload: bytes):
+        self.tick, cells, players = decode_snapshot(payload)
+        own = SNAKE + self.player_id
+        for cell, value in cells:
+            if value == EMPTY:
+                self.cells.pop(cell, None)
+            else:
+                self.cells[cell] = value
+                if value == FRUIT:
+                    self.fruit = cell
+                elif value == own:
+                    self.head = cell
+        for player_id, alive, length, score in players:
+            if length:
+                self.players[player_id] = (alive, length, score)
+            else:
+                self.players.pop(player_id, None)
+            if player_id == self.player_id and not alive:
+                self.head = None
+
+    def turn(self, direction: int):
+        frame = pack_frame(TURN.pack(MSG_TURN, direction))
+        self.writer.write(frame)
+        self.bytes_sent += len(frame)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import os
+import threading
+from collections import deque
+
+import pygame
+
+from playpad.core import (WIDTH, HEIGHT, MAX_PARTICLES, Colors, Fonts, DrawList, EntityPool, Particle, atlas,
+                          screen, tile_sprite)
+from playpad.games.snake.net import DEFAULT_PORT, FRUIT, SNAKE, ProtocolError, SnakeClient, SnakeServer
+from playpad.scenes import GameScene
+
+logger = logging.getLogger("playpad")
+
+PLAYER_COLORS = [Colors.NEON_BLUE, Colors.NEON_PINK, Colors.ORANGE, Colors.PURPLE, Colors.CYAN, Colors.YELLOW,
+                 Colors.BLUE, Colors.LIGHT_GRAY]
+DIRECTION_KEYS = {pygame.K_UP: 0, pygame.K_DOWN: 1, pygame.K_LEFT: 2, pygame.K_RIGHT: 3}
+
+# Client side of an online match. The connection runs on its own thread with
+# an asyncio loop; snapshots are queued and applied on the main thread. If
+# nobody is hosting at the address yet, the match is hosted in this process.
+class OnlineSnake:
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.client = SnakeClient()
+        self.server = None
+        self.inbox = deque()
+        self.task = None
+        self.status = f"Connecting to {host}:{port}..."
+        self.score = 0
+        self.score_animation = 0
+        self.paused = False
+        self.particles = EntityPool(Particle, MAX_PARTICLES)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self.connect(), self.loop)
+
+    async def connect(self):
+        self.task = asyncio.current_task()
+        try:
+            try:
+                await self.client.connect(self.host, self.port)
+            except ConnectionRefusedError:
+                self.server = SnakeServer(self.host, self.port)
+                await self.server.start()
+                await self.client.connect(self.host, self.port)
+        except (OSError, ProtocolError) as e:
+            self.status = str(e)
+            return
+        self.status = None
+        await self.client.receive(self.inbox.append)
+        self.status = "Disconnected"
+
+    def turn(self, direction: int):
+        self.loop.call_soon_threadsafe(self.client.turn, direction)
+
+    def close(self):
+        if self.loop.is_closed():
+            return
+        async def shutdown():
+            self.client.close()
+            if self.server is not None:
+                await self.server.stop()
+            if self.task is not None:
+                await asyncio.wait([self.task], timeout=1.0)
+            self.loop.stop()
+        asyncio.run_coroutine_threadsafe(shutdown(), self.loop)
+        # Every entry starts a new loop and thread, so this one is torn down
+        self.thread.join(timeout=2.0)
+        if self.thread.is_alive():
+            logger.warning("Online Snake: network thread did not stop")
+        else:
+            self.loop.close()
+
+    def update(self):
+        while self.inbox:
+            self.client.apply(self.inbox.popleft())
+        _, _, score = self.client.players.get(self.client.player_id, (0, 0, 0))
+        if score > self.score:
+            self.score_animation = score - self.score
+        elif self.score_animation > 0:
+            self.score_animation -= 1
+        self.score = score
+
+    def is_static(self, animations: bool) -> bool:
+        return False
+
+    def set_difficulty(self, difficulty: int):
+        pass
+
+    def draw_background(self, surface):
+        pass
+
+class OnlineSnakeScene(GameScene):
+    def create_game(self):
+        host = os.environ.get("PLAYPAD_SERVER", "127.0.0.1")
+        return OnlineSnake(host, int(os.environ.get("PLAYPAD_PORT", DEFAULT_PORT)))
+
+    def finish(self):
+        if not self.finished:
+            self.game.close()
+        super().finish()
+
+    def handle_event(self, event):
+        # The match carries on for everyone else, so there is no pause
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_p:
+            return
+        super().handle_event(event)
+
+    def handle_key(self, event):
+        client = self.game.client
+        if event.key in DIRECTION_KEYS and client.writer is not None and self.game.status is None:
+            self.game.turn(DIRECTION_KEYS[event.key])
+
+    def update_game(self):
+        self.game.update()
+
+    def render_game(self, draw_list: DrawList):
+        game = self.game
+        client = game.client
+        self.draw_title(draw_list, 10)
+        alive, _, _ = client.players.get(client.player_id, (0, 0, 0))
+        self.draw_hud(draw_list, f"Score: {game.score}", f"Players: {len(client.players)}")
+
+        if game.status is not None:
+            self.draw_caption(draw_list, game.status, Fonts.game, Colors.WHITE, HEIGHT // 2)
+            return
+
+        cell = max(1, min(WIDTH // client.cols, (HEIGHT - 200) // client.rows))
+        left = (WIDTH - cell * client.cols) // 2
+        top = 110
+        board = pygame.Rect(left - 2, top - 2, cell * client.cols + 4, cell * client.rows + 4)
+        draw_list.flush()
+        pygame.draw.rect(screen, Colors.NEON_BLUE, board, 2)
+
+        sprites = {}
+        for (x, y), value in client.cells.items():
+            if value not in sprites:
+                if value == FRUIT:
+                    sprites[value] = tile_sprite((cell, cell), Colors.RED, Colors.BLACK, 1, cell // 2)
+                else:
+                    player_id = value - SNAKE
+                    color = Colors.GREEN if player_id == client.player_id else PLAYER_COLORS[player_id % len(PLAYER_COLORS)]
+                    sprites[value] = tile_sprite((cell, cell), color, Colors.BLACK, 1, 2)
+            draw_list.blit(atlas.surface, (left + x * cell, top + y * cell), sprites[value])
+
+        if len(client.players) < 2:
+            self.draw_caption(draw_list, "Waiting for another player...", Fonts.game, Colors.YELLOW, HEIGHT // 2)
+        elif not alive:
+            self.draw_caption(draw_list, "Respawning...", Fonts.game, Colors.YELLOW, HEIGHT // 2)
@@ -0,0 +1,405 @@
+import random
+import struct
+from array import array
+from collections import deque
+from typing import NamedTuple, Tuple
+
+import pygame
+
+from playpad.core import (WIDTH, HEIGHT, MAX_PARTICLES, Colors, Fonts, DrawList, EntityPool, Particle, PoolRecord,
+                          atlas, cached_gradient_surface, capture_particles, panel_sprite, render_text_with_shadow,
+                          tile_sprite, update_particles)
+from playpad.audio import audio
+from playpad.scenes import GameScene
+from playpad.snapshot import SnapshotReader, SnapshotWriter, lookup
+from playpad.tuning import tuning
+
+# cols, rows, cell size, head x/y, heading dx/dy, length, score, level, speed, difficulty,
+# paused, game over, ms since the last step, fruit x/y
+SNAKE_STATE = struct.Struct("<HHHhhhhIIHhB??Ihh")
+# x, y, type, r, g, b, ms since it appeared
+SPECIAL_FRUIT_STATE = struct.Struct("<hhBBBBI")
+TURN_STATE = struct.Struct("<hh")
+SPECIAL_FRUIT_TYPES = ["speed", "slow", "bonus"]
+
+class SpecialFruit(PoolRecord):
+    __slots__ = ('x', 'y', 'type', 'color')
+
+    def setup(self, x, y, type, color):
+        self.x = x
+        self.y = y
+        self.type = type
+        self.color = color
+
+# Game 3: Snake Game
+class SnakeGame:
+    SNAPSHOT_KIND = b"SNAK"
+    SNAPSHOT_VERSION = 1
+    ARCADE_BOARD = (200, 150, 4)
+    MAX_QUEUED_TURNS = 3
+
+    def __init__(self, cols: int = None, rows: int = None, cell_size: int = 20):
+        self.cell_size = cell_size
+        self.board_cols = cols or WIDTH // cell_size
+        self.board_rows = rows or HEIGHT // cell_size
+        self.board_width = self.board_cols * cell_size
+        self.board_height = self.board_rows * cell_size
+        self.reset()
+
+    def reset(self):
+        self.snake_size = self.cell_size
+        self.snake_x = self.board_cols // 2 * self.cell_size
+        self.snake_y = self.board_rows // 2 * self.cell_size
+        self.snake_dx = self.snake_size
+        self.snake_dy = 0
+        # Turns wait here and are applied one per step, so quick presses are not lost
+        self.turn_queue = deque()
+        self.applied_inputs = []
+        # Head at the right end; the tail leaves from the left in O(1)
+        self.snake_body = deque()
+        self.snake_length = 1
+        # Cells whose contents changed since the playfield layer last synced
+        self.occupied = set()
+        self.dirty_cells = set()
+        self.redraw_board = True
+        self.fruit_x = 0
+        self.fruit_y = 0
+        self.fruit_size = self.cell_size
+        self.special_fruits = EntityPool(SpecialFruit)
+        self.special_fruit = None
+        self.score = 0
+        self.level = 1
+        self.game_over = False
+        self.place_fruit()
+        self.speed = 10
+        self.last_move = pygame.time.get_ticks()
+        self.special_timer = 0
+        self.paused = False
+        self.difficulty = 1
+        self.particles = EntityPool(Particle, MAX_PARTICLES)
+        self.score_animation = 0
+        self.background_offset = 0
+
+    def place_fruit(self):
+        max_x = (self.board_width - self.fruit_size) // self.fruit_size
+        max_y = (self.board_height - self.fruit_size) // self.fruit_size
+        self.dirty_cells.add((self.fruit_x, self.fruit_y))
+        self.fruit_x = random.randint(0, max_x) * self.fruit_size
+        self.fruit_y = random.randint(0, max_y) * self.fruit_size
+        self.dirty_cells.add((self.fruit_x, self.fruit_y))
+
+        if (self.fruit_x, self.fruit_y) in self.occupied:
+            self.place_fruit()
+            return
+
+        if random.random() < tuning.current.snake.special_fruit_chance and self.level > 1:
+            self.clear_special_fruit()
+            self.special_fruit = self.special_fruits.spawn(random.randint(0, max_x) * self.fruit_size,
+                                                           random.randint(0, max_y) * self.fruit_size,
+                                                           random.choice(SPECIAL_FRUIT_TYPES),
+                                                           Colors.YELLOW if random.random() < 0.5 else Colors.PURPLE)
+            self.dirty_cells.add((self.special_fruit.x, self.special_fruit.y))
+            self.special_timer = pygame.time.get_ticks()
+
+    def clear_special_fruit(self):
+        if self.special_fruit:
+            self.dirty_cells.add((self.special_fruit.x, self.special_fruit.y))
+            self.special_fruits.despawn(self.special_fruit)
+            self.special_fruit = None
+
+    def step_interval(self) -> float:
+        # Smaller cells cover less ground per step, so large boards step faster
+        settings = tuning.current.snake
+        return ((self.speed * settings.step_ms_per_speed - self.level * settings.step_ms_per_level)
+                / self.difficulty * self.cell_size / 20)
+
+    def queue_turn(self, dx: int, dy: int, stamp: float = None) -> bool:
+        # Checked against the last queued direction rather than the current one,
+        # so two presses within a step can never reverse the snake into itself
+        if self.turn_queue:
+            last_dx, last_dy, _ = self.turn_queue[-1]
+        else:
+            last_dx, last_dy = self.snake_dx, self.snake_dy
+        if (dx, dy) in ((last_dx, last_dy), (-last_dx, -last_dy)):
+            return False
+        if len(self.turn_queue) >= self.MAX_QUEUED_TURNS:
+            return False
+        self.turn_queue.append((dx, dy, stamp))
+        return True
+
+    def update(self):
+        if self.paused or self.game_over:
+            return
+
+        current_time = pygame.time.get_ticks()
+        if current_time - self.last_move < self.step_interval():
+            return
+
+        self.last_move = current_time
+        self.step(current_time)
+
+    def step(self, current_time: int):
+        settings = tuning.current.snake
+        if self.turn_queue:
+            self.snake_dx, self.snake_dy, stamp = self.turn_queue.popleft()
+            if stamp is not None:
+                self.applied_inputs.append(stamp)
+
+        self.snake_x += self.snake_dx
+        self.snake_y += self.snake_dy
+
+        if (self.snake_x < 0 or self.snake_x >= self.board_width or
+                self.snake_y < 0 or self.snake_y >= self.board_height):
+            self.game_over = True
+            return
+
+        head = (self.snake_x, self.snake_y)
+        if head in self.occupied:
+            self.game_over = True
+            return
+
+        self.snake_body.append(head)
+        self.occupied.add(head)
+        self.dirty_cells.add(head)
+        if len(self.snake_body) > self.snake_length:
+            tail = self.snake_body.popleft()
+            self.occupied.discard(tail)
+            self.dirty_cells.add(tail)
+
+        if (abs(self.snake_x - self.fruit_x) < self.snake_size and
+                abs(self.snake_y - self.fruit_y) < self.snake_size):
+            self.snake_length += 1
+            points = settings.fruit_points * self.level * self.difficulty
+            self.score += points
+            self.score_animation = points
+            audio.play("fruit")
+            if self.snake_length % settings.fruits_per_level == 0:
+                self.level += 1
+                audio.play("level_complete")
+            for _ in range(settings.fruit_particles):
+                self.particles.spawn(self.fruit_x + self.fruit_size // 2,
+                                     self.fruit_y + self.fruit_size // 2,
+                                     Colors.RED, 'circle')
+            self.place_fruit()
+
+        if self.special_fruit:
+            if (abs(self.snake_x - self.special_fruit.x) < self.snake_size and
+                    abs(self.snake_y - self.special_fruit.y) < self.snake_size):
+                if self.special_fruit.type == "speed":
+                    self.speed = max(settings.min_speed, self.speed - settings.speed_fruit_step)
+                elif self.special_fruit.type == "slow":
+                    self.speed = min(settings.max_speed, self.speed + settings.slow_fruit_step)
+                elif self.special_fruit.type == "bonus":
+                    points = settings.bonus_points * self.level * self.difficulty
+                    self.score += points
+                    self.score_animation = points
+                audio.play("fruit")
+                for _ in range(settings.fruit_particles):
+                    self.particles.spawn(self.special_fruit.x + self.fruit_size // 2,
+                                         self.special_fruit.y + self.fruit_size // 2,
+                                         self.special_fruit.color, 'square')
+                self.clear_special_fruit()
+            elif current_time - self.special_timer > settings.special_fruit_ms:
+                self.clear_special_fruit()
+
+        update_particles(self.particles)
+        self.background_offset = (self.background_offset + 0.5) % HEIGHT
+        if self.score_animation > 0:
+            self.score_animation -= 1
+
+    def is_static(self, animations: bool) -> bool:
+        return self.paused or (self.game_over and not animations)
+
+    def cell_sprites(self, cell: Tuple[int, int]) -> tuple:
+        sprites = []
+        if cell in self.occupied:
+            sprites.append((self.snake_size, Colors.GREEN, Colors.NEON_BLUE))
+        if cell == (self.fruit_x, self.fruit_y):
+            sprites.append((self.fruit_size, Colors.RED, Colors.YELLOW))
+        special = self.special_fruit
+        if special and cell == (special.x, special.y):
+            sprites.append((self.fruit_size, special.color, Colors.BLACK))
+        return tuple(sprites)
+
+    def board_changes(self) -> "BoardView":
+        # The cells changed since the last call, each with the sprites now on it
+        redraw = self.redraw_board
+        if redraw:
+            cells = set(self.occupied)
+            cells.add((self.fruit_x, self.fruit_y))
+            if self.special_fruit:
+                cells.add((self.special_fruit.x, self.special_fruit.y))
+            self.redraw_board = False
+        else:
+            cells = self.dirty_cells
+        changes = tuple((cell, self.cell_sprites(cell)) for cell in cells)
+        self.dirty_cells.clear()
+        return BoardView((self.board_width, self.board_height), self.snake_size, redraw, changes)
+
+    def capture(self) -> "SnakeView":
+        inputs = tuple(self.applied_inputs)
+        self.applied_inputs.clear()
+        return SnakeView(capture_particles(self.particles), self.board_changes(), self.score, self.level,
+                         self.snake_length, self.game_over, self.paused, self.score_animation,
+                         self.background_offset, inputs)
+
+    def draw_background(self, surface):
+        grass_surface = cached_gradient_surface((WIDTH, HEIGHT), (*Colors.GREEN[:3], 50), Colors.BLACK)
+        for y in range(-HEIGHT, HEIGHT, 50):
+            pygame.draw.line(surface, Colors.YELLOW, (0, (y + self.background_offset) % HEIGHT),
+                            (WIDTH, (y + self.background_offset) % HEIGHT), 1)
+        surface.blit(grass_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+
+    def draw_particles(self, surface):
+        for p in self.particles:
+            p.draw(surface)
+
+    def set_difficulty(self, difficulty: int):
+        self.difficulty = max(1, min(3, difficulty))
+        self.speed = tuning.current.snake.difficulty[self.difficulty - 1].speed
+
+    def snapshot(self) -> bytes:
+        writer = SnapshotWriter(self.SNAPSHOT_KIND, self.SNAPSHOT_VERSION)
+        now = pygame.time.get_ticks()
+        writer.write(SNAKE_STATE, self.board_cols, self.board_rows, self.cell_size, self.snake_x, self.snake_y,
+                     self.snake_dx, self.snake_dy, self.snake_length, self.score, self.level, self.speed,
+                     self.difficulty, self.paused, self.game_over, now - self.last_move, self.fruit_x, self.fruit_y)
+        writer.write_array(array("h", [value for cell in self.snake_body for value in cell]))
+        special = self.special_fruit
+        rows = [(special.x, special.y, SPECIAL_FRUIT_TYPES.index(special.type), *special.color[:3],
+                 now - self.special_timer)] if special else []
+        writer.write_records(SPECIAL_FRUIT_STATE, rows)
+        writer.write_records(TURN_STATE, ((dx, dy) for dx, dy, _ in self.turn_queue))
+        return writer.getvalue()
+
+    def restore(self, data: bytes):
+        reader = SnapshotReader(data, self.SNAPSHOT_KIND, self.SNAPSHOT_VERSION)
+        (cols, rows, cell_size, self.snake_x, self.snake_y, self.snake_dx, self.snake_dy, self.snake_length,
+         self.score, self.level, self.speed, self.difficulty, self.paused, self.game_over, since_move,
+         self.fruit_x, self.fruit_y) = reader.read(SNAKE_STATE)
+        now = pygame.time.get_ticks()
+        self.cell_size = self.snake_size = self.fruit_size = cell_size
+        self.board_cols, self.board_rows = cols, rows
+        self.board_width, self.board_height = cols * cell_size, rows * cell_size
+        self.last_move = now - since_move
+
+        body = reader.read_array("h")
+        self.snake_body = deque(zip(body[::2], body[1::2]))
+        self.occupied = set(self.snake_body)
+        self.dirty_cells = set()
+        self.redraw_board = True
+
+        self.special_fruits.clear()
+        self.special_fruit = None
+        for x, y, kind, r, g, b, age in reader.read_records(SPECIAL_FRUIT_STATE):
+            self.special_fruit = self.special_fruits.spawn(x, y, lookup(SPECIAL_FRUIT_TYPES, kind, "fruit"), (r, g, b))
+            self.special_timer = now - age
+        self.turn_queue = deque((dx, dy, None) for dx, dy in reader.read_records(TURN_STATE))
+
+# Board changes since the previous view; cells hold absolute contents, so
+# applying the same changes twice is harmless
+class BoardView(NamedTuple):
+    size: Tuple[int, int]
+    cell_size: int
+    redraw: bool
+    changes: tuple
+
+# One tick of Snake as the pipelined renderer sees it
+class SnakeView(NamedTuple):
+    particles: tuple
+    board: BoardView
+    score: int
+    level: int
+    snake_length: int
+    game_over: bool
+    paused: bool
+    score_animation: int
+    background_offset: float
+    inputs: tuple
+
+    draw_background = SnakeGame.draw_background
+    draw_particles = SnakeGame.draw_particles
+
+# Persistent snake layer: each step only redraws the cells that changed. A new
+# board size always comes with a new game, which starts with a full redraw.
+class SnakePlayfield:
+    def __init__(self):
+        self.layer = None
+
+    def draw_sprite(self, cell, size: int, color1, color2):
+        self.layer.blit(atlas.surface, cell, tile_sprite((size, size), color1, color2, border_radius=min(5, size // 4)))
+
+    def apply(self, board: BoardView):
+        if self.layer is None or self.layer.get_size() != board.size:
+            self.layer = pygame.Surface(board.size, pygame.SRCALPHA)
+        if board.redraw:
+            self.layer.fill((0, 0, 0, 0))
+        size = board.cell_size
+        for cell, sprites in board.changes:
+            self.layer.fill((0, 0, 0, 0), (cell[0], cell[1], size, size))
+            for sprite_size, color1, color2 in sprites:
+                self.draw_sprite(cell, sprite_size, color1, color2)
+
+    def draw(self, surface, board: BoardView):
+        self.apply(board)
+        surface.blit(self.layer, (0, 0))
+
+class SnakeScene(GameScene):
+    pipelined = True
+    sounds = ("fruit", "level_complete")
+
+    def __init__(self, app, entry):
+        super().__init__(app, entry)
+        self.playfield = SnakePlayfield()
+
+    def create_game(self):
+        return SnakeGame(*SnakeGame.ARCADE_BOARD) if self.app.arcade_mode else SnakeGame()
+
+    def warm(self):
+        self.playfield.apply(self.game.board_changes())
+        yield
+
+    def handle_key(self, event):
+        game = self.game
+        if game.paused:
+            return
+        if event.key == pygame.K_UP:
+            game.queue_turn(0, -game.snake_size, event.stamp)
+        elif event.key == pygame.K_DOWN:
+            game.queue_turn(0, game.snake_size, event.stamp)
+        elif event.key == pygame.K_LEFT:
+            game.queue_turn(-game.snake_size, 0, event.stamp)
+        elif event.key == pygame.K_RIGHT:
+            game.queue_turn(game.snake_size, 0, event.stamp)
+        elif event.key == pygame.K_SPACE and game.game_over:
+            self.app.high_scores.update_score(self.entry.score_key, game.score)
+            game.reset()
+
+    def update_game(self):
+        if not (self.game.game_over or self.game.paused):
+            self.game.update()
+        if not self.app.pipelined(self):
+            # Pipelined, the inputs count once the view they are in is shown
+            self.app.input_latency.applied(self.game.applied_inputs)
+            self.game.applied_inputs.clear()
+
+    def capture(self) -> SnakeView:
+        return self.game.capture()
+
+    def render_game(self, draw_list: DrawList):
+        game = self.view()
+        game.draw_particles(draw_list)
+        self.playfield.draw(draw_list, self.game.board_changes() if self.front is None else game.board)
+
+        self.draw_title(draw_list, 10)
+        self.draw_hud(draw_list, f"Score: {game.score}", f"Level: {game.level}")
+
+        draw_list.blit(atlas.surface, (WIDTH // 2 - 50, 20), panel_sprite((100, 40), Colors.NEON_BLUE))
+        length_text = render_text_with_shadow(f"{game.snake_length}", Fonts.game, Colors.WHITE, Colors.BLACK)
+        draw_list.blit(length_text, (WIDTH // 2 - length_text.get_width() // 2, 30))
+
+        if game.game_over:
+            self.draw_banner(draw_list, "GAME OVER", Colors.RED, Colors.NEON_PINK)
+            self.draw_caption(draw_list, "Press SPACE to restart", Fonts.game, Colors.WHITE, HEIGHT // 2 + 50)
+
+        self.draw_caption(draw_list, "Press 'P' to pause", Fonts.small, Colors.YELLOW, HEIGHT - 80)
@@ -0,0 +1,35 @@
+import os
+
+# The server never draws; keep SDL off the display when playpad.core initialises pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import asyncio
+import logging
+
+from playpad.games.snake.net import DEFAULT_PORT, SnakeServer
+
+# python -m playpad.games.snake.serve --players 4
+async def serve(args):
+    server = SnakeServer(args.host, args.port, args.tick_rate, args.cols, args.rows, args.players)
+    await server.start()
+    await server.ticker
+
+def main():
+    parser = argparse.ArgumentParser(description="Host a head-to-head Snake match")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--tick-rate", type=int, default=10)
+    parser.add_argument("--cols", type=int, default=64)
+    parser.add_argument("--rows", type=int, default=48)
+    parser.add_argument("--players", type=int, default=8, help="2 to 8")
+    args = parser.parse_args()
+    args.players = max(2, min(8, args.players))
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import threading
+
+# Pipelined frames. The simulation thread runs a scene's update() and then
+# its capture(), an immutable view of everything render needs, into the back
+# buffer. Meanwhile the main thread renders the front view from the tick
+# before and presents it; blitting and display flips release the GIL, so the
+# two overlap. finish() waits for the tick and swaps the buffers.
+#
+# Only the simulation thread touches the game between begin() and finish(),
+# so the main thread handles input after finish() and renders nothing but the
+# front view. Frames show the game one tick later than in serial mode.
+class SimulationThread:
+    def __init__(self):
+        self.go = threading.Event()
+        self.done = threading.Event()
+        self.scene = None
+        self.back = None
+        self.error = None
+        self.pending = None
+        self.thread = threading.Thread(target=self.run, name="simulation", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while True:
+            self.go.wait()
+            self.go.clear()
+            scene = self.scene
+            if scene is None:
+                break
+            try:
+                scene.update()
+                self.back = scene.capture()
+            except BaseException as e:
+                self.error = e
+            self.done.set()
+
+    def begin(self, scene):
+        if scene.front is None:
+            # Nothing to show yet: the first view is taken here
+            scene.front = scene.capture()
+        self.scene = self.pending = scene
+        self.done.clear()
+        self.go.set()
+
+    def finish(self):
+        # Returns the scene whose front view was just replaced, if any
+        scene = self.pending
+        if scene is None:
+            return None
+        self.done.wait()
+        self.pending = None
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+        scene.front, self.back = self.back, None
+        return scene
+
+    def stop(self):
+        self.finish()
+        self.scene = None
+        self.go.set()
+        self.thread.join()
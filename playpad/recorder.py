@@ -0,0 +1,149 @@
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections import deque
+from multiprocessing import shared_memory
+
+import numpy as np
+import pygame
+
+logger = logging.getLogger("playpad")
+
+# Session recording. Each presented frame is copied once, straight from the
+# surface's pixel buffer into a free slot of a shared-memory ring, and the
+# slot number is handed to an encoder process that writes it out and hands
+# the slot back. When every slot is still waiting to be written the frame is
+# dropped, so a slow disk or encoder never stalls the game loop.
+#
+# A recording is a directory with recording.json (size, pitch, channel byte
+# offsets) and index.csv (frame, ms since start, then the byte offset into
+# frames.raw or the PNG file name).
+FORMATS = ("raw", "png")
+
+def encode_frames(shm_name: str, frame_bytes: int, path: str, fmt: str, meta: dict, frames, done):
+    # Runs in its own process: PNG encoding holds the GIL for ~40 ms a frame
+    shm = shared_memory.SharedMemory(name=shm_name)
+    width, height, pitch = meta["width"], meta["height"], meta["pitch"]
+    channels = [meta["offsets"][c] for c in "rgb"]
+    raw = open(os.path.join(path, "frames.raw"), "wb") if fmt == "raw" else None
+    with open(os.path.join(path, "index.csv"), "w") as index:
+        index.write("frame,ms,offset\n" if raw else "frame,ms,file\n")
+        while True:
+            item = frames.get()
+            if item is None:
+                break
+            slot, number, ms = item
+            data = shm.buf[slot * frame_bytes:(slot + 1) * frame_bytes]
+            if raw:
+                index.write(f"{number},{ms:.1f},{raw.tell()}\n")
+                raw.write(data)
+            else:
+                pixels = np.frombuffer(data, dtype=np.uint8).reshape(height, pitch // 4, 4)[:, :width, channels]
+                name = f"{number:06d}.png"
+                pygame.image.save(pygame.image.frombuffer(pixels.tobytes(), (width, height), "RGB"),
+                                  os.path.join(path, name))
+                index.write(f"{number},{ms:.1f},{name}\n")
+            del data
+            done.put(slot)
+    if raw:
+        raw.close()
+    shm.close()
+
+class Recorder:
+    def __init__(self, fmt: str = "raw", slots: int = 8, root: str = "recordings"):
+        self.fmt = fmt if fmt in FORMATS else "raw"
+        self.slots = slots
+        self.root = root
+        self.process = None
+        self.capture_times = deque(maxlen=10000)
+
+    @property
+    def recording(self) -> bool:
+        return self.process is not None
+
+    def start(self, surface: pygame.Surface):
+        width, height = surface.get_size()
+        pitch = surface.get_pitch()
+        self.path = os.path.join(self.root, time.strftime("%Y%m%d-%H%M%S"))
+        os.makedirs(self.path, exist_ok=True)
+        # Little-endian 32-bit pixels: a channel's byte offset is its shift / 8
+        offsets = dict(zip("rgba", (shift // 8 for shift in surface.get_shifts())))
+        meta = {"width": width, "height": height, "pitch": pitch, "offsets": offsets, "format": self.fmt}
+        with open(os.path.join(self.path, "recording.json"), "w") as f:
+            json.dump(meta, f)
+
+        self.size = (width, height, pitch)
+        self.frame_bytes = pitch * height
+        self.shm = shared_memory.SharedMemory(create=True, size=self.frame_bytes * self.slots)
+        self.buffers = [np.ndarray(self.frame_bytes, dtype=np.uint8, buffer=self.shm.buf, offset=i * self.frame_bytes)
+                        for i in range(self.slots)]
+        self.free = list(range(self.slots))
+        context = multiprocessing.get_context("spawn")
+        self.frames = context.Queue()
+        self.done = context.Queue()
+        self.process = context.Process(target=encode_frames, daemon=True,
+                                       args=(self.shm.name, self.frame_bytes, self.path, self.fmt, meta,
+                                             self.frames, self.done))
+        self.process.start()
+        self.started = time.perf_counter()
+        self.frame_count = 0
+        self.dropped = 0
+        self.capture_times.clear()
+        logger.info("Recording %s frames to %s", self.fmt, self.path)
+
+    def capture(self, surface: pygame.Surface):
+        start = time.perf_counter()
+        if (*surface.get_size(), surface.get_pitch()) != self.size:
+            logger.warning("Frame size changed, stopping the recording")
+            self.stop()
+            return
+        while True:
+            try:
+                self.free.append(self.done.get_nowait())
+            except queue.Empty:
+                break
+        if self.free:
+            slot = self.free.pop()
+            np.copyto(self.buffers[slot], np.frombuffer(surface.get_buffer(), dtype=np.uint8))
+            self.frames.put((slot, self.frame_count, (start - self.started) * 1000))
+            self.frame_count += 1
+        elif not self.process.is_alive():
+            logger.error("The frame encoder exited, stopping the recording")
+            self.stop()
+            return
+        else:
+            self.dropped += 1
+        self.capture_times.append(time.perf_counter() - start)
+
+    def stop(self, wait: bool = False):
+        # The encoder drains what is already queued; by default that happens
+        # in the background and the shared memory is released once it exits
+        if self.process is None:
+            return
+        self.frames.put(None)
+        finisher = threading.Thread(target=self.finish, args=(self.process, self.shm, self.buffers), daemon=not wait)
+        finisher.start()
+        self.report()
+        self.process = None
+        self.buffers = None
+        if wait:
+            finisher.join()
+
+    @staticmethod
+    def finish(process, shm, buffers):
+        process.join()
+        buffers.clear()
+        shm.close()
+        shm.unlink()
+
+    def report(self):
+        if not self.capture_times:
+            return
+        times = sorted(t * 1000 for t in self.capture_times)
+        logger.info("Recorded %d frames to %s (%d dropped), capture %.3f ms/frame mean, %.3f ms p95",
+                    self.frame_count, self.path, self.dropped, sum(times) / len(times),
+                    times[int(len(times) * 0.95)])
@@ -0,0 +1,59 @@
+import importlib
+import logging
+from importlib import metadata
+from typing import Dict
+
+logger = logging.getLogger("playpad")
+
+# Games are plugins: each publishes a GameEntry under the "playpad.games"
+# entry-point group, e.g. in pyproject.toml
+#
+#     [project.entry-points."playpad.games"]
+#     pong = "playpad_pong:ENTRY"
+#
+# The entry only carries what the menu needs. The module with the game itself
+# is named by entry.scene and imported the first time the game is selected.
+# Built-in games are listed here so a source checkout works without installed
+# package metadata.
+ENTRY_POINT_GROUP = "playpad.games"
+BUILTIN_GAMES = [
+    "playpad.games.scrambled_saga:ENTRY",
+    "playpad.games.block_buster:ENTRY",
+    "playpad.games.snake:ENTRY",
+    "playpad.games.memory:ENTRY",
+    # Appended so the original games keep their menu keys
+    "playpad.games.snake:ONLINE_ENTRY",
+]
+
+def load_object(target: str):
+    module_name, _, attr = target.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+class GameEntry:
+    def __init__(self, key: str, title: str, tooltip: str, score_key: str, difficulty: Dict[int, Dict], scene: str):
+        self.key = key
+        self.title = title
+        self.tooltip = tooltip
+        self.score_key = score_key
+        self.difficulty = difficulty
+        self.scene = scene
+
+    def load_scene(self):
+        return load_object(self.scene)
+
+def discover_games() -> Dict[str, GameEntry]:
+    games = {}
+    for target in BUILTIN_GAMES:
+        entry = load_object(target)
+        games[entry.key] = entry
+    for point in metadata.entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            entry = point.load()
+        except Exception:
+            logger.exception("Could not load game plugin %s", point.value)
+            continue
+        if entry.key in games:
+            logger.warning("Game plugin %s reuses the key %r, skipping it", point.value, entry.key)
+            continue
+        games[entry.key] = entry
+    return games
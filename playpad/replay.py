@@ -0,0 +1,74 @@
+import json
+import logging
+from typing import List
+
+import pygame
+
+logger = logging.getLogger("playpad")
+
+# Input journals. A recording is JSON lines: a header with the seed, game,
+# difficulty and fps the session started with, then one line per input event
+# tagged with the frame it arrived on, then an end line with the frame count.
+# Replaying seeds the same RNG and posts each event before its frame polls
+# input. Games time themselves with the clock as well as the frame count, so
+# a replay only follows the recording exactly when it runs at the same fps.
+RECORDED_EVENTS = {
+    pygame.QUIT: "quit",
+    pygame.KEYDOWN: "key_down",
+    pygame.KEYUP: "key_up",
+    pygame.MOUSEMOTION: "mouse_motion",
+    pygame.MOUSEBUTTONDOWN: "mouse_down",
+    pygame.MOUSEBUTTONUP: "mouse_up",
+    pygame.MOUSEWHEEL: "mouse_wheel",
+    pygame.VIDEORESIZE: "resize",
+}
+EVENT_TYPES = {name: event_type for event_type, name in RECORDED_EVENTS.items()}
+# Set by the game loop, not part of the input
+SKIPPED_FIELDS = {"stamp", "window"}
+
+class ReplayError(ValueError):
+    pass
+
+class InputRecorder:
+    def __init__(self, path: str, **header):
+        self.file = open(path, "w", encoding="utf-8")
+        self.write({"playpad_replay": 1, **header})
+        self.events = 0
+
+    def write(self, record: dict):
+        self.file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def record(self, frame: int, events: List[pygame.event.Event]):
+        for event in events:
+            name = RECORDED_EVENTS.get(event.type)
+            if name is not None:
+                fields = {key: value for key, value in event.dict.items() if key not in SKIPPED_FIELDS}
+                self.write({"frame": frame, "event": name, **fields})
+                self.events += 1
+
+    def close(self, frames: int):
+        self.write({"frame": frames, "end": True})
+        self.file.close()
+        logger.info("Recorded %d input events over %d frames", self.events, frames)
+
+class InputReplayer:
+    def __init__(self, path: str):
+        with open(path, encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f if line.strip()]
+        if not lines or lines[0].get("playpad_replay") != 1:
+            raise ReplayError(f"{path} is not a PlayPad input recording")
+        self.header = lines[0]
+        self.events = [line for line in lines[1:] if "event" in line]
+        self.end = max([line["frame"] for line in lines[1:]], default=0)
+        self.next = 0
+
+    def feed(self, frame: int):
+        # Post everything recorded up to this frame
+        while self.next < len(self.events) and self.events[self.next]["frame"] <= frame:
+            record = dict(self.events[self.next])
+            self.next += 1
+            event_type = EVENT_TYPES[record.pop("event")]
+            del record["frame"]
+            # JSON turned tuples (positions, rel, buttons) into lists
+            fields = {key: tuple(value) if isinstance(value, list) else value for key, value in record.items()}
+            pygame.event.post(pygame.event.Event(event_type, **fields))
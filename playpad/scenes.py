@@ -0,0 +1,365 @@
+import math
+import time
+from typing import Dict, List, Optional
+
+import pygame
+
+from playpad.core import (WIDTH, HEIGHT, Colors, Fonts, GameStates, DrawList, atlas, display, logger, screen,
+                          button_sprite, panel_sprite, pulsed, render_text_with_gradient, render_text_with_shadow)
+from playpad.audio import audio
+from playpad.registry import GameEntry
+from playpad.snapshot import SnapshotError, discard_snapshot, load_snapshot, save_snapshot
+from playpad.telemetry import telemetry
+
+# Scenes: every state maps to a Scene that handles its own input, update and
+# drawing. The App builds scenes on first use; entering a game starts a fresh
+# round or resumes a suspended one, and warm() pre-renders its sprites while
+# the fade runs.
+class Scene:
+    def __init__(self, app):
+        self.app = app
+
+    def enter(self):
+        pass
+
+    def warm(self):
+        # Generator, advanced one step per fade frame
+        return iter(())
+
+    def handle_event(self, event):
+        pass
+
+    def update(self):
+        pass
+
+    def render(self, draw_list: DrawList):
+        pass
+
+    def is_static(self) -> bool:
+        return False
+
+    def draws_background(self) -> bool:
+        # True when render() paints over the whole starfield
+        return False
+
+    def hover_rects(self) -> Optional[List[pygame.Rect]]:
+        # Rects the idle wait watches for hover changes; None wakes on any mouse motion
+        return []
+
+def draw_buttons(draw_list: DrawList, buttons: List[Dict], mouse_pos) -> Optional[Dict]:
+    hover_button = None
+    for button in buttons:
+        scale = 1.1 if button["rect"].collidepoint(mouse_pos) else 1.0
+        color = Colors.NEON_BLUE if button["rect"].collidepoint(mouse_pos) else Colors.LIGHT_GRAY
+        scaled_button = button_sprite(button["rect"].size, color, scale)
+        draw_list.blit(atlas.surface, (button["rect"].x + (button["rect"].width - scaled_button.width) // 2,
+                                       button["rect"].y + (button["rect"].height - scaled_button.height) // 2), scaled_button)
+        text = render_text_with_shadow(button["text"], Fonts.menu, Colors.BLACK, Colors.WHITE)
+        draw_list.blit(text, (button["rect"].x + button["rect"].width // 2 - text.get_width() // 2,
+                              button["rect"].y + button["rect"].height // 2 - text.get_height() // 2))
+        if button["rect"].collidepoint(mouse_pos):
+            hover_button = button
+    return hover_button
+
+class MenuScene(Scene):
+    def __init__(self, app):
+        super().__init__(app)
+        # One button per registered game, numbered in registry order, then Settings
+        self.buttons = [{"text": entry.title, "state": entry.key, "tooltip": entry.tooltip} for entry in app.games.values()]
+        for i, button in enumerate(self.buttons[:9]):
+            button["key"] = pygame.K_1 + i
+        self.buttons.append({"text": "Settings", "state": GameStates.SETTINGS, "tooltip": "Adjust game settings"})
+        spacing = min(70, 280 // (len(self.buttons) - 1))
+        for i, button in enumerate(self.buttons):
+            button["rect"] = pygame.Rect(WIDTH // 2 - 150, 200 + i * spacing, 300, 50)
+        self.score_surface = None
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_s:
+                self.app.switch(GameStates.SETTINGS)
+            elif event.key == pygame.K_ESCAPE:
+                self.app.switch(GameStates.EXIT_CONFIRM)
+            else:
+                for button in self.buttons:
+                    if button.get("key") == event.key:
+                        self.app.start_game(button["state"])
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            for button in self.buttons:
+                if button["rect"].collidepoint(self.app.mouse_pos):
+                    if button["state"] == GameStates.SETTINGS:
+                        self.app.fade_to(button["state"])
+                    else:
+                        self.app.start_game(button["state"])
+
+    def render(self, draw_list: DrawList):
+        app = self.app
+        title = render_text_with_gradient("4-in-1 Game Station", Fonts.title, Colors.NEON_BLUE, Colors.NEON_PINK, persist=True)
+        if app.pulse_titles:
+            title = pulsed(title, 1.0 + 0.05 * math.sin(app.animation_timer * 0.05))
+        draw_list.blit(title, (WIDTH // 2 - title.get_width() // 2, 50))
+
+        hover_button = draw_buttons(draw_list, self.buttons, app.mouse_pos)
+
+        # High scores
+        panel_height = 30 + 25 * len(app.high_scores.scores)
+        if self.score_surface is None or self.score_surface.get_height() != panel_height:
+            self.score_surface = pygame.Surface((220, panel_height), pygame.SRCALPHA)
+            pygame.draw.rect(self.score_surface, (*Colors.DARK_GRAY[:3], 200), (0, 0, 220, panel_height), border_radius=10)
+            pygame.draw.rect(self.score_surface, Colors.NEON_PINK, (0, 0, 220, panel_height), 2, border_radius=10)
+        draw_list.blit(self.score_surface, (20, HEIGHT - 20 - panel_height))
+        for i, (game, score) in enumerate(app.high_scores.scores.items()):
+            text = render_text_with_shadow(f"{game.replace('_', ' ').title()}: {score}", Fonts.small, Colors.CYAN, Colors.BLACK)
+            draw_list.blit(text, (30, HEIGHT - 10 - panel_height + i * 25))
+
+        # Tooltip
+        if hover_button and app.enable_animations:
+            tooltip = render_text_with_shadow(hover_button["tooltip"], Fonts.small, Colors.WHITE, Colors.BLACK)
+            tooltip_rect = pygame.Rect(app.mouse_pos[0] + 10, app.mouse_pos[1], tooltip.get_width() + 10, tooltip.get_height() + 10)
+            draw_list.blit(atlas.surface, tooltip_rect.topleft, panel_sprite(tooltip_rect.size, Colors.NEON_BLUE, 1, 5))
+            draw_list.blit(tooltip, (tooltip_rect.x + 5, tooltip_rect.y + 5))
+
+class SettingsScene(Scene):
+    def __init__(self, app):
+        super().__init__(app)
+        self.buttons = [
+            {"text": "", "rect": pygame.Rect(WIDTH // 2 - 150, 140, 300, 50), "action": "difficulty", "key": pygame.K_d},
+            {"text": "", "rect": pygame.Rect(WIDTH // 2 - 150, 200, 300, 50), "action": "animations", "key": pygame.K_a},
+            {"text": "", "rect": pygame.Rect(WIDTH // 2 - 150, 260, 300, 50), "action": "mode", "key": pygame.K_m},
+            {"text": "", "rect": pygame.Rect(WIDTH // 2 - 150, 320, 300, 50), "action": "quality", "key": pygame.K_q},
+            {"text": "", "rect": pygame.Rect(WIDTH // 2 - 150, 380, 300, 50), "action": "display", "key": pygame.K_f},
+            {"text": "", "rect": pygame.Rect(WIDTH // 2 - 150, 440, 300, 50), "action": "sound", "key": pygame.K_s},
+            {"text": "Back", "rect": pygame.Rect(WIDTH // 2 - 150, 500, 300, 50), "action": "back", "key": pygame.K_b}
+        ]
+        self.refresh()
+
+    def refresh(self):
+        app = self.app
+        self.buttons[0]["text"] = f"Difficulty: {'Easy' if app.difficulty == 1 else 'Medium' if app.difficulty == 2 else 'Hard'}"
+        self.buttons[1]["text"] = f"Animations: {'On' if app.enable_animations else 'Off'}"
+        self.buttons[2]["text"] = f"Mode: {'Arcade' if app.arcade_mode else 'Classic'}"
+        self.buttons[3]["text"] = app.governor.label()
+        self.buttons[4]["text"] = f"Display: {'Fullscreen' if display.fullscreen else 'Windowed'}"
+        self.buttons[5]["text"] = f"Sound: {'Off' if audio.muted else 'On'}"
+
+    def activate(self, action: str):
+        app = self.app
+        if action == "back":
+            app.switch(GameStates.MENU)
+        elif action == "difficulty":
+            app.difficulty = (app.difficulty % 3) + 1
+        elif action == "animations":
+            app.enable_animations = not app.enable_animations
+        elif action == "mode":
+            app.arcade_mode = not app.arcade_mode
+        elif action == "quality":
+            app.governor.cycle()
+        elif action == "display":
+            display.toggle_fullscreen()
+        elif action == "sound":
+            audio.muted = not audio.muted
+        self.refresh()
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.activate("back")
+            for button in self.buttons:
+                if button["key"] == event.key:
+                    self.activate(button["action"])
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            for button in self.buttons:
+                if button["rect"].collidepoint(self.app.mouse_pos):
+                    self.activate(button["action"])
+
+    def render(self, draw_list: DrawList):
+        title = render_text_with_gradient("Settings", Fonts.title, Colors.NEON_BLUE, Colors.NEON_PINK, persist=True)
+        draw_list.blit(title, (WIDTH // 2 - title.get_width() // 2, 50))
+        self.buttons[3]["text"] = self.app.governor.label()
+        draw_buttons(draw_list, self.buttons, self.app.mouse_pos)
+
+    def is_static(self) -> bool:
+        return True
+
+    def hover_rects(self) -> Optional[List[pygame.Rect]]:
+        return [button["rect"] for button in self.buttons]
+
+class ExitConfirmScene(Scene):
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_y:
+                self.app.running = False
+            elif event.key == pygame.K_n or event.key == pygame.K_ESCAPE:
+                self.app.switch(GameStates.MENU)
+
+    def render(self, draw_list: DrawList):
+        draw_list.darken(150)
+        confirm_text = render_text_with_gradient("Exit Game? (Y/N)", Fonts.title, Colors.RED, Colors.NEON_PINK, persist=True)
+        draw_list.blit(confirm_text, (WIDTH // 2 - confirm_text.get_width() // 2, HEIGHT // 2))
+
+    def is_static(self) -> bool:
+        return True
+
+# Shared behaviour of the games: ESC records the score and fades back to
+# the menu, P pauses, and the HUD, banners and pause overlay look the same.
+# Games with snapshot()/restore() are suspended on ESC and resumed on the next
+# visit instead of starting over.
+class GameScene(Scene):
+    # Scenes that set this implement capture() and render only from view(),
+    # so the app can run their simulation on the pipeline thread
+    pipelined = False
+    # Clips the game plays, built when it is entered
+    sounds = ()
+
+    def __init__(self, app, entry: GameEntry):
+        super().__init__(app)
+        self.entry = entry
+        self.game = None
+        self.finished = False
+        # Latest captured view while pipelined, else None
+        self.front = None
+
+    def create_game(self):
+        raise NotImplementedError
+
+    def enter(self):
+        self.front = None
+        self.finished = False
+        audio.preload(self.sounds)
+        self.game = self.create_game()
+        self.game.set_difficulty(self.app.difficulty)
+        resumed = self.resume()
+        if not resumed:
+            self.new_game()
+        self.started = time.perf_counter()
+        telemetry.emit("game_start", game=self.entry.key, difficulty=self.app.difficulty, resumed=resumed)
+
+    def new_game(self):
+        pass
+
+    def game_stats(self) -> dict:
+        # Extra game_end telemetry fields
+        level = getattr(self.game, "level", None)
+        return {} if level is None else {"level": level}
+
+    def finish(self):
+        # Runs once per round, however many frames of the fade call it
+        if self.finished or self.app.transition_state is not None:
+            return
+        self.finished = True
+        self.app.high_scores.update_score(self.entry.score_key, self.game.score)
+        telemetry.emit("game_end", game=self.entry.key, difficulty=self.app.difficulty, score=self.game.score,
+                       seconds=round(time.perf_counter() - self.started, 1),
+                       game_over=bool(getattr(self.game, "game_over", False)), **self.game_stats())
+        self.suspend()
+        self.app.fade_to(GameStates.MENU)
+
+    def suspend(self):
+        if not hasattr(self.game, "snapshot"):
+            return
+        if self.game.game_over:
+            discard_snapshot(self.entry.key)
+        else:
+            save_snapshot(self.entry.key, self.game.snapshot())
+
+    def resume(self) -> bool:
+        if not hasattr(self.game, "restore"):
+            return False
+        data = load_snapshot(self.entry.key)
+        if data is None:
+            return False
+        discard_snapshot(self.entry.key)
+        try:
+            self.game.restore(data)
+        except (SnapshotError, ValueError, IndexError) as e:
+            # The save is gone already; a bad one must not stop the game from starting
+            logger.warning("Could not resume %s, starting over: %s", self.entry.key, e)
+            self.game = self.create_game()
+            self.game.set_difficulty(self.app.difficulty)
+            return False
+        return True
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.finish()
+            elif event.key == pygame.K_p:
+                self.game.paused = not self.game.paused
+            else:
+                self.handle_key(event)
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            self.handle_click(event)
+        elif event.type == pygame.MOUSEMOTION:
+            self.handle_motion(event)
+
+    def handle_key(self, event):
+        pass
+
+    def handle_click(self, event):
+        pass
+
+    def handle_motion(self, event):
+        pass
+
+    def update(self):
+        self.game.particles.capacity = self.app.quality["particles"]
+        self.update_game()
+
+    def update_game(self):
+        pass
+
+    def capture(self):
+        # Immutable view with the attributes render reads from the game
+        raise NotImplementedError
+
+    def view(self):
+        return self.game if self.front is None else self.front
+
+    def draws_background(self) -> bool:
+        return self.app.animate_background
+
+    def render(self, draw_list: DrawList):
+        game = self.view()
+        if self.app.animate_background:
+            draw_list.flush()
+            game.draw_background(screen)
+        self.render_game(draw_list)
+
+        if game.paused:
+            draw_list.darken(150)
+            paused_text = render_text_with_gradient("PAUSED", Fonts.title, Colors.RED, Colors.NEON_PINK, persist=True)
+            draw_list.blit(paused_text, (WIDTH // 2 - paused_text.get_width() // 2, HEIGHT // 2))
+
+        esc_text = render_text_with_shadow("ESC to return to menu", Fonts.small, Colors.RED, Colors.BLACK)
+        draw_list.blit(esc_text, (WIDTH // 2 - esc_text.get_width() // 2, HEIGHT - 50))
+
+    def render_game(self, draw_list: DrawList):
+        pass
+
+    def draw_title(self, draw_list: DrawList, y: int):
+        title = render_text_with_gradient(self.entry.title, Fonts.title, Colors.NEON_BLUE, Colors.NEON_PINK, persist=True)
+        draw_list.blit(title, (WIDTH // 2 - title.get_width() // 2, y))
+
+    def draw_hud(self, draw_list: DrawList, first_line: str, second_line: str):
+        draw_list.blit(self.app.hud_surface, (20, 20))
+        first_text = render_text_with_shadow(first_line, Fonts.game, Colors.WHITE, Colors.BLACK)
+        draw_list.blit(first_text, (30, 30))
+        second_text = render_text_with_shadow(second_line, Fonts.game, Colors.WHITE, Colors.BLACK)
+        draw_list.blit(second_text, (30, 60))
+        score_animation = self.view().score_animation
+        if score_animation > 0:
+            anim_text = render_text_with_shadow(f"+{score_animation}", Fonts.small, Colors.YELLOW, Colors.BLACK)
+            draw_list.blit(anim_text, (150, 60))
+
+    def draw_banner(self, draw_list: DrawList, text: str, color1, color2, persist: bool = True):
+        banner = render_text_with_gradient(text, Fonts.title, color1, color2, persist)
+        if self.app.pulse_titles:
+            banner = pulsed(banner, 1.0 + 0.1 * math.sin(self.app.animation_timer * 0.05))
+        draw_list.blit(banner, (WIDTH // 2 - banner.get_width() // 2, HEIGHT // 2 - 50))
+
+    def draw_caption(self, draw_list: DrawList, text: str, font, color, y: int):
+        caption = render_text_with_shadow(text, font, color, Colors.BLACK)
+        draw_list.blit(caption, (WIDTH // 2 - caption.get_width() // 2, y))
+
+    def is_static(self) -> bool:
+        return self.game.is_static(self.app.enable_animations)
@@ -0,0 +1,128 @@
+import os
+import struct
+import sys
+from array import array
+from typing import Optional
+
+# Game snapshots are flat little-endian binary: a header naming the game and
+# its format version, then fixed struct fields and typed arrays in the order
+# the game wrote them. Each game owns its layout through snapshot() and
+# restore() and bumps its SNAPSHOT_VERSION whenever the layout changes.
+MAGIC = b"PPSV"
+HEADER = struct.Struct("<4s4sB")
+LENGTH16 = struct.Struct("<H")
+LENGTH32 = struct.Struct("<I")
+SAVE_DIR = "saves"
+
+class SnapshotError(ValueError):
+    pass
+
+class SnapshotWriter:
+    def __init__(self, kind: bytes, version: int):
+        self.parts = [HEADER.pack(MAGIC, kind, version)]
+
+    def write(self, fmt: struct.Struct, *values):
+        self.parts.append(fmt.pack(*values))
+
+    def write_str(self, text: str):
+        data = text.encode("utf-8")
+        self.parts.append(LENGTH16.pack(len(data)))
+        self.parts.append(data)
+
+    def write_array(self, values: array):
+        self.parts.append(LENGTH32.pack(len(values)))
+        if sys.byteorder == "big":
+            values = array(values.typecode, values)
+            values.byteswap()
+        self.parts.append(values.tobytes())
+
+    def write_records(self, fmt: struct.Struct, rows):
+        packed = [fmt.pack(*row) for row in rows]
+        self.parts.append(LENGTH32.pack(len(packed)))
+        self.parts.extend(packed)
+
+    def write_ndarray(self, values):
+        # NumPy arrays go in as raw little-endian items; read them back with read_items()
+        self.parts.append(LENGTH32.pack(len(values)))
+        self.parts.append(values.astype(values.dtype.newbyteorder("<"), copy=False).tobytes())
+
+    def getvalue(self) -> bytes:
+        return b"".join(self.parts)
+
+class SnapshotReader:
+    def __init__(self, data: bytes, kind: bytes, version: int):
+        self.data = memoryview(data)
+        self.offset = 0
+        magic, found_kind, found_version = self.read(HEADER)
+        if magic != MAGIC or found_kind != kind:
+            raise SnapshotError(f"Not a {kind.decode()} snapshot")
+        if found_version != version:
+            raise SnapshotError(f"{kind.decode()} snapshot version {found_version} is not supported (expected {version})")
+
+    def read(self, fmt: struct.Struct) -> tuple:
+        try:
+            values = fmt.unpack_from(self.data, self.offset)
+        except struct.error as e:
+            raise SnapshotError(f"Truncated snapshot: {e}") from None
+        self.offset += fmt.size
+        return values
+
+    def take(self, size: int) -> memoryview:
+        if self.offset + size > len(self.data):
+            raise SnapshotError("Truncated snapshot")
+        chunk = self.data[self.offset:self.offset + size]
+        self.offset += size
+        return chunk
+
+    def read_str(self) -> str:
+        length, = self.read(LENGTH16)
+        try:
+            return str(self.take(length), "utf-8")
+        except UnicodeDecodeError as e:
+            raise SnapshotError(f"Bad string in snapshot: {e}") from None
+
+    def read_array(self, typecode: str) -> array:
+        count, = self.read(LENGTH32)
+        values = array(typecode)
+        values.frombytes(self.take(count * values.itemsize))
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+
+    def read_records(self, fmt: struct.Struct):
+        count, = self.read(LENGTH32)
+        return fmt.iter_unpack(self.take(count * fmt.size))
+
+    def read_items(self, itemsize: int) -> memoryview:
+        count, = self.read(LENGTH32)
+        return self.take(count * itemsize)
+
+def lookup(table, index: int, what: str):
+    # Indices read from a snapshot are checked before the game uses them
+    if not 0 <= index < len(table):
+        raise SnapshotError(f"Bad {what} {index} in snapshot")
+    return table[index]
+
+def snapshot_path(key: str) -> str:
+    return os.path.join(SAVE_DIR, f"{key}.sav")
+
+def save_snapshot(key: str, data: bytes):
+    # Written beside and renamed over, so a crash never leaves half a save
+    os.makedirs(SAVE_DIR, exist_ok=True)
+    path = snapshot_path(key)
+    with open(path + ".tmp", "wb") as f:
+        f.write(data)
+    os.replace(path + ".tmp", path)
+
+def load_snapshot(key: str) -> Optional[bytes]:
+    try:
+        with open(snapshot_path(key), "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def discard_snapshot(key: str):
+    try:
+        os.remove(snapshot_path(key))
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,173 @@
+import os
+
+# Soak runs are headless: no window, no audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import logging
+import random
+import sys
+import time
+import tracemalloc
+
+import pygame
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from playpad.app import App
+from playpad.core import WIDTH, HEIGHT, GameStates, display
+
+logger = logging.getLogger("playpad")
+
+# Memory soak: plays each game headless with random input for a while and
+# measures, with tracemalloc, how much Python memory every frame allocates
+# (the frame's peak above where it started) and keeps. After the warm-up the
+# frames are steady state; the run fails if the 99th percentile steady frame
+# allocates more than the budget. Retained memory is reported by source line
+# by comparing snapshots taken after the warm-up and at the end. Surface pixels
+# are allocated by SDL where tracemalloc cannot see them, so growth of the
+# peak RSS over the same stretch is reported too (where the OS provides it).
+#
+#   python -m playpad.soak --minutes 2 --budget 8192
+SOAK_GAMES = ("scrambled_saga", "block_buster", "snake", "memory")
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+def key_event(key: int, unicode: str = "") -> pygame.event.Event:
+    return pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode, mod=0, scancode=0)
+
+def random_position() -> tuple:
+    # Window coordinates, as the events would carry them
+    viewport = display.viewport
+    return (viewport.x + random.randrange(WIDTH) * viewport.width // WIDTH,
+            viewport.y + random.randrange(HEIGHT) * viewport.height // HEIGHT)
+
+# What a player of each game might do in one frame
+def snake_input():
+    if random.random() < 0.2:
+        yield key_event(random.choice((pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE)))
+
+def block_buster_input():
+    if random.random() < 0.5:
+        yield pygame.event.Event(pygame.MOUSEMOTION, pos=random_position(), rel=(0, 0), buttons=(0, 0, 0))
+    if random.random() < 0.02:
+        yield key_event(pygame.K_SPACE)
+
+def memory_input():
+    if random.random() < 0.1:
+        yield pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=random_position(), button=1)
+    if random.random() < 0.02:
+        yield key_event(pygame.K_SPACE)
+
+def scrambled_saga_input():
+    roll = random.random()
+    if roll < 0.1:
+        letter = random.choice(LETTERS)
+        yield key_event(pygame.key.key_code(letter), letter)
+    elif roll < 0.11:
+        yield key_event(pygame.K_RETURN)
+    elif roll < 0.115:
+        yield key_event(pygame.K_h, "h")
+    elif roll < 0.13:
+        yield key_event(pygame.K_BACKSPACE)
+
+INPUTS = {
+    "snake": snake_input,
+    "block_buster": block_buster_input,
+    "memory": memory_input,
+    "scrambled_saga": scrambled_saga_input,
+}
+
+def percentile(values, q: float):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))] if ordered else 0
+
+def peak_rss_kib():
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+
+def soak_game(app: App, key: str, seconds: float, warmup: int, fps: int, top: int) -> dict:
+    clock = pygame.time.Clock()
+    app.start_game(key)
+    frames = []
+    retained_from = None
+    started = time.perf_counter()
+    frame = 0
+    while time.perf_counter() - started < seconds or frame <= warmup:
+        # Games that end on their own go back to the menu; start another round
+        if app.current_state == GameStates.MENU and app.transition_state is None:
+            app.start_game(key)
+        if app.current_state == key and app.transition_state is None:
+            for event in INPUTS[key]():
+                pygame.event.post(event)
+
+        if frame == warmup:
+            retained_from = tracemalloc.take_snapshot()
+            rss_from = peak_rss_kib()
+            steady_started = time.perf_counter()
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        app.frame()
+        current, peak = tracemalloc.get_traced_memory()
+        if frame >= warmup:
+            frames.append((peak - before, current - before))
+        if fps:
+            clock.tick(fps)
+        frame += 1
+
+    frame_ms = (time.perf_counter() - steady_started) * 1000 / len(frames)
+    rss_to = peak_rss_kib()
+    retained_to = tracemalloc.take_snapshot()
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__),
+              tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")]
+    growth = retained_to.filter_traces(ignore).compare_to(retained_from.filter_traces(ignore), "lineno")
+    allocated = [a for a, _ in frames]
+    return {
+        "frames": len(frames),
+        "frame_ms": frame_ms,
+        "rss_growth": None if rss_to is None else rss_to - rss_from,
+        "median": percentile(allocated, 0.5),
+        "p99": percentile(allocated, 0.99),
+        "max": max(allocated),
+        "retained": sum(r for _, r in frames),
+        "growth": [stat for stat in growth if stat.size_diff > 0][:top],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless memory soak of the PlayPad games")
+    parser.add_argument("--game", action="append", choices=SOAK_GAMES, help="repeatable; default all")
+    parser.add_argument("--minutes", type=float, default=1.0, help="per game")
+    parser.add_argument("--budget", type=int, default=8192, help="bytes a p99 steady-state frame may allocate")
+    parser.add_argument("--warmup", type=int, default=600, help="frames before steady state")
+    parser.add_argument("--fps", type=int, default=60, help="0 runs unthrottled")
+    parser.add_argument("--top", type=int, default=10, help="source lines to list")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    random.seed(args.seed)
+
+    tracemalloc.start(1)
+    app = App()
+    failed = []
+    for key in args.game or SOAK_GAMES:
+        result = soak_game(app, key, args.minutes * 60, args.warmup, args.fps, args.top)
+        verdict = "ok" if result["p99"] <= args.budget else "OVER BUDGET"
+        rss = "n/a" if result["rss_growth"] is None else f"{result['rss_growth'] / 1024:+.1f} MiB"
+        print(f"{key}: {result['frames']} frames at {result['frame_ms']:.2f} ms, allocated per frame "
+              f"median {result['median']} B, p99 {result['p99']} B, max {result['max']} B, "
+              f"retained {result['retained'] / 1024:+.1f} KiB, peak RSS {rss} [{verdict}]")
+        for stat in result["growth"]:
+            print(f"    {stat}")
+        if result["p99"] > args.budget:
+            failed.append(key)
+        app.fade_to(GameStates.MENU)
+        for _ in range(20):
+            app.frame()
+    tracemalloc.stop()
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
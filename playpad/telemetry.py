@@ -0,0 +1,208 @@
+import argparse
+import glob
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict, deque
+
+logger = logging.getLogger("playpad")
+
+# Session telemetry. emit() only appends a tuple to a bounded deque, so game
+# code can call it anywhere; a writer thread wakes once a second, turns what
+# has piled up into JSON lines and appends them with one write per file.
+# Files rotate at max_bytes and only the newest max_files are kept.
+# When the writer falls a whole buffer behind the oldest events are lost;
+# the sequence numbers show how many.
+#
+# Each line is {"seq", "t", "session", "event", ...fields}. Set
+# PLAYPAD_TELEMETRY=0 to keep events in memory only.
+class Telemetry:
+    def __init__(self, capacity: int = 65536, root: str = "telemetry", max_bytes: int = 1 << 20,
+                 max_files: int = 50, flush_interval: float = 1.0):
+        self.events = deque(maxlen=capacity)
+        self.sequence = itertools.count()
+        self.session = uuid.uuid4().hex[:12]
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.flush_interval = flush_interval
+        self.thread = None
+        self.file = None
+        self.part = 0
+        self.next_seq = 0
+        self.written = 0
+        self.dropped = 0
+
+    def emit(self, name: str, **fields):
+        self.events.append((next(self.sequence), time.time(), name, fields))
+
+    def start(self):
+        if self.thread is not None or os.environ.get("PLAYPAD_TELEMETRY", "1") == "0":
+            return
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="telemetry", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        if self.thread is None:
+            return
+        self.stopping.set()
+        self.thread.join()
+        self.thread = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        logger.info("Telemetry: %d events written, %d dropped", self.written, self.dropped)
+
+    def run(self):
+        while not self.stopping.wait(self.flush_interval):
+            self.flush()
+        self.flush()
+
+    def flush(self):
+        lines = []
+        session = self.session
+        while True:
+            try:
+                seq, t, name, fields = self.events.popleft()
+            except IndexError:
+                break
+            self.dropped += seq - self.next_seq
+            self.next_seq = seq + 1
+            record = {"seq": seq, "t": round(t, 3), "session": session, "event": name}
+            record.update(fields)
+            lines.append(json.dumps(record, separators=(",", ":"), default=str).encode("utf-8") + b"\n")
+        if not lines:
+            return
+        try:
+            # One write per file the batch touches
+            start = 0
+            size = self.file.tell() if self.file is not None else self.max_bytes
+            for i, line in enumerate(lines):
+                if size + len(line) > self.max_bytes and size:
+                    self.write(lines[start:i])
+                    self.rotate()
+                    start, size = i, 0
+                size += len(line)
+            self.write(lines[start:])
+        except OSError as e:
+            logger.warning("Telemetry write failed, %d events lost: %s", len(lines) - start, e)
+            self.dropped += len(lines) - start
+
+    def write(self, lines):
+        if lines:
+            self.file.write(b"".join(lines))
+            self.file.flush()
+            self.written += len(lines)
+
+    def rotate(self):
+        if self.file is not None:
+            self.file.close()
+        os.makedirs(self.root, exist_ok=True)
+        # Names sort oldest first: start time, session, part
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{self.session}-{self.part:03d}.jsonl"
+        self.file = open(os.path.join(self.root, name), "ab")
+        self.part += 1
+        for old in sorted(glob.glob(os.path.join(self.root, "*.jsonl")))[:-self.max_files]:
+            os.remove(old)
+
+telemetry = Telemetry()
+
+def mean(total: float, count: int):
+    return round(total / count, 1) if count else None
+
+# Offline summary of any number of telemetry files. Lines are read one at a
+# time into running totals, so memory does not grow with the data.
+class TelemetrySummary:
+    def __init__(self):
+        self.events = 0
+        self.bad_lines = 0
+        self.sessions = set()
+        self.app_seconds = [0.0, 0]
+        self.plays = Counter()
+        self.difficulty = defaultdict(Counter)
+        self.finished = Counter()
+        self.game_seconds = Counter()
+        self.score_total = Counter()
+        self.best_score = {}
+        self.lives_lost = Counter()
+        self.hints = Counter()
+        self.power_ups = Counter()
+        self.memory_moves = [0, 0]
+
+    def add_file(self, path: str):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    self.add(json.loads(line))
+                except (ValueError, KeyError, TypeError):
+                    self.bad_lines += 1
+
+    def add(self, record: dict):
+        event = record["event"]
+        self.events += 1
+        self.sessions.add(record["session"])
+        game = record.get("game")
+        if event == "app_exit":
+            self.app_seconds[0] += record["seconds"]
+            self.app_seconds[1] += 1
+        elif event == "game_start":
+            self.plays[game] += 1
+            self.difficulty[game][record["difficulty"]] += 1
+        elif event == "game_end":
+            score = record["score"]
+            self.finished[game] += 1
+            self.game_seconds[game] += record["seconds"]
+            self.score_total[game] += score
+            self.best_score[game] = max(score, self.best_score.get(game, score))
+            if "moves" in record:
+                self.memory_moves[0] += record["moves"]
+                self.memory_moves[1] += 1
+        elif event == "life_lost":
+            self.lives_lost[game] += 1
+        elif event == "hint":
+            self.hints[game] += 1
+        elif event == "power_up":
+            self.power_ups[record["type"]] += 1
+
+    def report(self) -> dict:
+        games = {}
+        for game in sorted(set(self.plays) | set(self.finished)):
+            finished = self.finished[game]
+            games[game] = {
+                "plays": self.plays[game],
+                "difficulty": dict(sorted(self.difficulty[game].items())),
+                "mean_seconds": mean(self.game_seconds[game], finished),
+                "mean_score": mean(self.score_total[game], finished),
+                "best_score": self.best_score.get(game),
+                "lives_lost": self.lives_lost[game],
+                "hints": self.hints[game],
+            }
+        return {
+            "events": self.events,
+            "bad_lines": self.bad_lines,
+            "sessions": len(self.sessions),
+            "mean_session_seconds": mean(*self.app_seconds),
+            "games": games,
+            "power_ups": dict(self.power_ups.most_common()),
+            "memory_mean_moves": mean(*self.memory_moves),
+        }
+
+# python -m playpad.telemetry telemetry/
+def main():
+    parser = argparse.ArgumentParser(description="Summarise PlayPad telemetry files")
+    parser.add_argument("paths", nargs="*", default=["telemetry"], help="JSONL files or directories")
+    args = parser.parse_args()
+    summary = TelemetrySummary()
+    for path in args.paths:
+        files = sorted(glob.glob(os.path.join(path, "*.jsonl"))) if os.path.isdir(path) else [path]
+        for name in files:
+            summary.add_file(name)
+    print(json.dumps(summary.report(), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass, field, fields, is_dataclass, replace
+
+from playpad.games import block_buster, memory, scrambled_saga, snake
+
+logger = logging.getLogger("playpad")
+
+# Gameplay tuning. Every tunable is a field of a frozen dataclass, so game
+# code reads plain attributes (tuning.current.snake.special_fruit_ms) and a
+# whole configuration is swapped in one assignment. The file is JSON with the
+# same shape as the defaults and may leave anything out:
+#
+#     {"block_buster": {"power_up_ms": 8000,
+#                       "difficulty": [{}, {"lives": 4}, {}]}}
+#
+# Difficulty tables list easy, medium and hard; their values are copied into
+# a game when it starts, everything else is read as the game plays. The
+# running app checks the file's mtime every CHECK_INTERVAL seconds and applies
+# a changed file live; a file that fails validation is logged and ignored.
+#
+#   python -m playpad.tuning --defaults > tuning.json
+#   python -m playpad.tuning tuning.json
+TUNING_FILE = os.environ.get("PLAYPAD_TUNING", "tuning.json")
+CHECK_INTERVAL = 1.0
+PROBABILITY = {"max": 1}
+
+class TuningError(ValueError):
+    pass
+
+def difficulty_table(cls, table: dict) -> tuple:
+    return tuple(cls(**table[level]) for level in sorted(table))
+
+@dataclass(frozen=True)
+class BlockBusterDifficulty:
+    ball_speed: int
+    lives: int
+
+@dataclass(frozen=True)
+class BlockBusterTuning:
+    difficulty: tuple = difficulty_table(BlockBusterDifficulty, block_buster.DIFFICULTY)
+    paddle_width: int = 100
+    paddle_speed: int = 8
+    serve_speed: int = 5
+    bounce_speed: int = 7
+    brick_points: int = 10
+    power_up_chance: float = field(default=0.2, metadata=PROBABILITY)
+    power_up_fall_speed: int = 3
+    power_up_ms: int = 5000
+    expanded_paddle_width: int = 150
+    slow_ball_step: int = 2
+    min_ball_speed: int = 3
+    multiball_copies: int = 2
+    brick_particles: int = 10
+    # Bricks per tick that throw debris; with hundreds of balls the rest break silently
+    debris_bricks: int = 4
+    paddle_particles: int = 5
+
+@dataclass(frozen=True)
+class SnakeDifficulty:
+    speed: int
+
+@dataclass(frozen=True)
+class SnakeTuning:
+    difficulty: tuple = difficulty_table(SnakeDifficulty, snake.DIFFICULTY)
+    # Milliseconds between steps: (speed * ms_per_speed - level * ms_per_level) / difficulty
+    step_ms_per_speed: int = 50
+    step_ms_per_level: int = 10
+    fruits_per_level: int = field(default=5, metadata={"min": 1})
+    fruit_points: int = 10
+    bonus_points: int = 50
+    special_fruit_chance: float = field(default=0.1, metadata=PROBABILITY)
+    special_fruit_ms: int = 5000
+    speed_fruit_step: int = 2
+    min_speed: int = 5
+    slow_fruit_step: int = 5
+    max_speed: int = 20
+    fruit_particles: int = 8
+
+@dataclass(frozen=True)
+class MemoryDifficulty:
+    time_limit: int
+
+@dataclass(frozen=True)
+class MemoryTuning:
+    difficulty: tuple = difficulty_table(MemoryDifficulty, memory.DIFFICULTY)
+    levels: int = field(default=5, metadata={"min": 1})
+    match_points: int = 10
+    match_particles: int = 10
+
+@dataclass(frozen=True)
+class ScrambledSagaDifficulty:
+    time_limit: int
+    lives: int
+
+@dataclass(frozen=True)
+class ScrambledSagaTuning:
+    difficulty: tuple = difficulty_table(ScrambledSagaDifficulty, scrambled_saga.DIFFICULTY)
+    no_hint_bonus: int = 5
+    answer_particles: int = 15
+
+@dataclass(frozen=True)
+class Tuning:
+    block_buster: BlockBusterTuning = BlockBusterTuning()
+    snake: SnakeTuning = SnakeTuning()
+    memory: MemoryTuning = MemoryTuning()
+    scrambled_saga: ScrambledSagaTuning = ScrambledSagaTuning()
+
+def merge(default, data, path: str):
+    # Returns default with data laid over it, checking data has the same shape
+    if is_dataclass(default):
+        if not isinstance(data, dict):
+            raise TuningError(f"{path}: expected an object")
+        known = {f.name: f for f in fields(default)}
+        unknown = sorted(set(data) - set(known))
+        if unknown:
+            raise TuningError(f"{path}: unknown setting {', '.join(unknown)}")
+        changes = {}
+        for name, value in data.items():
+            value = merge(getattr(default, name), value, f"{path}.{name}")
+            if isinstance(value, (int, float)):
+                low = known[name].metadata.get("min", 0)
+                high = known[name].metadata.get("max", float("inf"))
+                if not low <= value <= high:
+                    raise TuningError(f"{path}.{name}: {value} is outside [{low}, {high}]")
+            changes[name] = value
+        return replace(default, **changes)
+    if isinstance(default, tuple):
+        if not isinstance(data, list) or len(data) != len(default):
+            raise TuningError(f"{path}: expected a list of {len(default)}")
+        return tuple(merge(item, value, f"{path}[{i}]") for i, (item, value) in enumerate(zip(default, data)))
+    if isinstance(data, bool) or not isinstance(data, (int, float)):
+        raise TuningError(f"{path}: expected a number")
+    if isinstance(default, int):
+        if data != int(data):
+            raise TuningError(f"{path}: expected a whole number")
+        return int(data)
+    return float(data)
+
+def parse(text: str) -> Tuning:
+    try:
+        data = json.loads(text)
+    except ValueError as e:
+        raise TuningError(f"not valid JSON: {e}") from None
+    return merge(Tuning(), data, "tuning")
+
+# The live configuration. poll() is cheap enough to call every frame: it only
+# stats the file once per CHECK_INTERVAL.
+class TuningConfig:
+    def __init__(self, path: str = TUNING_FILE):
+        self.path = path
+        self.current = Tuning()
+        self.stamp = None
+        self.next_check = 0.0
+
+    def poll(self):
+        now = time.monotonic()
+        if now >= self.next_check:
+            self.next_check = now + CHECK_INTERVAL
+            self.reload()
+
+    def reload(self) -> bool:
+        try:
+            stat = os.stat(self.path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+        if stamp == self.stamp:
+            return False
+        self.stamp = stamp
+        if stamp is None:
+            # Removing the file goes back to the defaults
+            if self.current != Tuning():
+                logger.info("%s is gone, tuning back to the defaults", self.path)
+            self.current = Tuning()
+            return True
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.current = parse(f.read())
+        except (OSError, TuningError) as e:
+            logger.warning("Ignoring %s: %s", self.path, e)
+            return False
+        logger.info("Tuning loaded from %s", self.path)
+        return True
+
+tuning = TuningConfig()
+
+def main():
+    parser = argparse.ArgumentParser(description="Check a PlayPad tuning file or print the defaults")
+    parser.add_argument("path", nargs="?", default=TUNING_FILE)
+    parser.add_argument("--defaults", action="store_true", help="print the default tuning as JSON")
+    args = parser.parse_args()
+    if args.defaults:
+        print(json.dumps(asdict(Tuning()), indent=2))
+        return
+    try:
+        with open(args.path, encoding="utf-8") as f:
+            parse(f.read())
+    except (OSError, TuningError) as e:
+        print(f"{args.path}: {e}")
+        sys.exit(1)
+    print(f"{args.path}: ok")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from playpad.registry import load_object
+
+# Batched environments step num_envs games in lockstep and keep their results
+# in arrays: obs (num_envs, *observation_shape), rewards and dones (num_envs,).
+# A vector env takes an optional buffers dict so those arrays can live
+# somewhere else, which is how SharedVecEnv spreads one batch over worker
+# processes without copying observations between them.
+BUFFERS = ("obs", "rewards", "dones", "actions")
+
+def buffer_layout(probe, num_envs: int):
+    layout = {
+        "obs": ((num_envs, *probe.obs.shape[1:]), probe.obs.dtype),
+        "rewards": ((num_envs,), np.float32),
+        "dones": ((num_envs,), np.bool_),
+        "actions": ((num_envs,), np.int64),
+    }
+    offsets = {}
+    size = 0
+    for name in BUFFERS:
+        shape, dtype = layout[name]
+        offsets[name] = size
+        # Keep every array 64-byte aligned
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        size += -(-nbytes // 64) * 64
+    return layout, offsets, size
+
+def map_buffers(shm, layout, offsets, start: int = 0, stop: int = None):
+    return {name: np.ndarray(layout[name][0], dtype=layout[name][1], buffer=shm.buf, offset=offsets[name])[start:stop]
+            for name in BUFFERS}
+
+def run_worker(env_class: str, options: dict, seed: int, start: int, stop: int, shm_name: str, layout, offsets, conn):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    buffers = map_buffers(shm, layout, offsets, start, stop)
+    env = load_object(env_class)(stop - start, seed=seed, buffers=buffers, **options)
+    while True:
+        command = conn.recv()
+        if command == "step":
+            env.step(buffers["actions"])
+        elif command == "reset":
+            env.reset()
+        else:
+            break
+        conn.send(None)
+    del env, buffers
+    shm.close()
+
+class SharedVecEnv:
+    def __init__(self, env_class: str, num_envs: int, workers: int = None, seed: int = 0, **options):
+        # env_class is "module:Class", e.g. "playpad.games.snake.env:SnakeVecEnv"
+        workers = max(1, min(workers or multiprocessing.cpu_count(), num_envs))
+        probe = load_object(env_class)(1, **options)
+        layout, offsets, size = buffer_layout(probe, num_envs)
+        self.num_envs = num_envs
+        self.num_actions = probe.num_actions
+        self.shm = shared_memory.SharedMemory(create=True, size=size)
+        buffers = map_buffers(self.shm, layout, offsets)
+        self.obs = buffers["obs"]
+        self.rewards = buffers["rewards"]
+        self.dones = buffers["dones"]
+        self.actions = buffers["actions"]
+
+        context = multiprocessing.get_context("spawn")
+        self.conns = []
+        self.processes = []
+        bounds = np.linspace(0, num_envs, workers + 1).astype(int)
+        for i in range(workers):
+            parent, child = context.Pipe()
+            process = context.Process(target=run_worker, daemon=True,
+                                      args=(env_class, options, seed + i, int(bounds[i]), int(bounds[i + 1]),
+                                            self.shm.name, layout, offsets, child))
+            process.start()
+            self.conns.append(parent)
+            self.processes.append(process)
+
+    def broadcast(self, command: str):
+        for conn in self.conns:
+            conn.send(command)
+        for conn in self.conns:
+            conn.recv()
+
+    def reset(self) -> np.ndarray:
+        self.broadcast("reset")
+        return self.obs
+
+    def step(self, actions):
+        self.actions[:] = actions
+        self.broadcast("step")
+        return self.obs, self.rewards, self.dones
+
+    def close(self):
+        for conn in self.conns:
+            conn.send("close")
+        for process in self.processes:
+            process.join()
+        del self.obs, self.rewards, self.dones, self.actions
+        self.shm.close()
+        self.shm.unlink()
@@ -0,0 +1,16 @@
+import os
+
+# Tests run headless, keep telemetry in memory and build sprites in process
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ["PLAYPAD_TELEMETRY"] = "0"
+os.environ["PLAYPAD_AUDIO"] = "0"
+os.environ["PLAYPAD_ASSET_CACHE"] = "0"
+
+import pytest
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    # High scores, saves and compiled level packs land in the working directory
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
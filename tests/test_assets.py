@@ -0,0 +1,21 @@
+import pytest
+
+from playpad.core import Colors, Fonts, asset_cache, load_asset, render_text_with_gradient
+
+@pytest.fixture
+def disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(asset_cache, "enabled", True)
+    monkeypatch.setattr(asset_cache, "root", str(tmp_path / "assets"))
+    monkeypatch.setattr(asset_cache, "used", {})
+    monkeypatch.setattr(asset_cache, "stored", 0)
+    return asset_cache
+
+def test_only_fixed_captions_reach_the_disk(disk_cache):
+    render_text_with_gradient("SCRAMBLE", Fonts.title, Colors.CYAN, Colors.NEON_BLUE)
+    load_asset(("particle", (255, 0, 0, 128), "circle", 4))
+    assert disk_cache.stored == 0
+    assert not disk_cache.used
+
+    render_text_with_gradient("CAPTION", Fonts.title, Colors.RED, Colors.NEON_PINK, persist=True)
+    assert list(disk_cache.used) == [("title", "CAPTION", Colors.RED, Colors.NEON_PINK)]
+    assert disk_cache.load(("title", "CAPTION", Colors.RED, Colors.NEON_PINK)) is not None
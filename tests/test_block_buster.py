@@ -0,0 +1,99 @@
+import numpy as np
+
+from playpad.core import HEIGHT, Colors
+from playpad.games.block_buster.scene import BallSet, BlockBusterBonanza
+from playpad.tuning import tuning
+
+def game_with(bricks, balls) -> BlockBusterBonanza:
+    game = BlockBusterBonanza(levels=None)
+    game.blocks.clear()
+    game.block_bounds = None
+    for brick in bricks:
+        game.blocks.spawn(*brick)
+    game.balls.clear()
+    for ball in balls:
+        game.balls.add(*ball)
+    return game
+
+def balls(game: BlockBusterBonanza) -> list:
+    n = game.balls.count
+    return list(zip(game.balls.x[:n].tolist(), game.balls.y[:n].tolist(),
+                    game.balls.dx[:n].tolist(), game.balls.dy[:n].tolist()))
+
+def test_ball_breaks_brick_from_below_and_bounces():
+    game = game_with([(100, 100, 50, 20, Colors.RED, 1)], [(125, 130, 0, -5, 10)])
+    game.update()
+    assert len(game.blocks) == 0
+    assert balls(game) == [(125, 125, 0, 5)]
+    assert game.score == tuning.current.block_buster.brick_points
+
+def test_side_hit_flips_horizontal_direction():
+    game = game_with([(100, 100, 50, 20, Colors.RED, 2)], [(88, 110, 5, 0, 10)])
+    game.update()
+    assert game.blocks[0].hits == 1
+    assert balls(game) == [(93, 110, -5, 0)]
+    assert game.score == 0
+
+def test_brick_breaks_once_when_several_balls_hit_it():
+    game = game_with([(100, 100, 50, 20, Colors.RED, 1)], [(115, 130, 0, -5, 10), (135, 130, 0, -5, 10)])
+    game.update()
+    assert len(game.blocks) == 0
+    assert game.score == tuning.current.block_buster.brick_points
+
+def test_only_balls_in_the_brick_band_are_tested():
+    game = game_with([(100, 100, 50, 20, Colors.RED, 1)], [(125, 400, 0, -5, 10), (700, 130, 0, -5, 10)])
+    game.update()
+    assert len(game.blocks) == 1
+    assert [dy for _, _, _, dy in balls(game)] == [-5, -5]
+
+def test_walls_reflect_balls():
+    game = game_with([(100, 100, 50, 20, Colors.RED, 1)], [(14, 300, -5, 0, 10), (400, 14, 0, -5, 10)])
+    game.update()
+    assert [(dx, dy) for _, _, dx, dy in balls(game)] == [(5, 0), (0, 5)]
+
+def test_lost_balls_are_dropped_without_costing_a_life():
+    game = game_with([(100, 100, 50, 20, Colors.RED, 1)], [(300, HEIGHT - 2, 0, 5, 10), (300, 300, 0, -5, 10)])
+    game.update()
+    assert balls(game) == [(300, 295, 0, -5)]
+    assert game.lives == 3
+
+def test_losing_the_last_ball_costs_a_life_and_serves_again():
+    game = game_with([(100, 100, 50, 20, Colors.RED, 1)], [(300, HEIGHT - 2, 0, 5, 10)])
+    game.update()
+    assert game.lives == 2
+    assert game.balls.count == 1
+
+def test_split_fans_out_copies_at_the_same_speed():
+    ball_set = BallSet(10)
+    ball_set.add(100, 100, 0, -5, 10)
+    ball_set.split(2)
+    assert ball_set.count == 3
+    speeds = np.hypot(ball_set.dx[:3], ball_set.dy[:3])
+    assert np.allclose(speeds, 5)
+    assert len(set(np.round(ball_set.dx[:3], 6).tolist())) == 3
+
+def test_split_stops_at_capacity():
+    ball_set = BallSet(4)
+    ball_set.add(100, 100, 0, -5, 10)
+    ball_set.add(200, 100, 3, -4, 10)
+    ball_set.split(2)
+    assert ball_set.count == 4
+
+def test_arcade_serve_holds_many_balls():
+    game = BlockBusterBonanza(arcade=True, levels=None)
+    assert game.balls.count == BlockBusterBonanza.ARCADE_START_BALLS
+    while game.balls.add(400, 300, 0, -5, 10):
+        pass
+    assert game.balls.count == BlockBusterBonanza.ARCADE_MAX_BALLS
+    game.update()
+    assert game.balls.count <= BlockBusterBonanza.ARCADE_MAX_BALLS
+
+def test_debris_is_limited_per_tick():
+    settings = tuning.current.block_buster
+    bricks = [(5 + i * 60, 100, 50, 20, Colors.RED, 1) for i in range(10)]
+    game = game_with(bricks, [(30 + i * 60, 130, 0, -5, 10) for i in range(10)])
+    game.particles.clear()
+    game.update()
+    assert len(game.blocks) == 0
+    assert game.score == 10 * settings.brick_points
+    assert len(game.particles) == settings.debris_bricks * settings.brick_particles
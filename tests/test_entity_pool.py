@@ -0,0 +1,46 @@
+from playpad.core import EntityPool, PoolRecord
+
+class Thing(PoolRecord):
+    __slots__ = ('name',)
+
+    def setup(self, name):
+        self.name = name
+
+def test_despawned_slot_is_reused_with_a_new_generation():
+    pool = EntityPool(Thing)
+    first = pool.spawn("a")
+    handle = pool.handle(first)
+    pool.despawn(first)
+    second = pool.spawn("b")
+    assert second is first
+    assert second.generation == 2
+    assert pool.get(handle) is None
+    assert pool.get(pool.handle(second)).name == "b"
+
+def test_handles_resolve_until_despawned():
+    pool = EntityPool(Thing)
+    things = [pool.spawn(name) for name in "abc"]
+    handles = [pool.handle(thing) for thing in things]
+    pool.despawn(things[0])
+    assert pool.get(handles[0]) is None
+    assert [pool.get(handle).name for handle in handles[1:]] == ["b", "c"]
+    assert pool.get(pool.handle(things[2]) + 1000) is None
+
+def test_despawn_keeps_live_indices_consistent():
+    pool = EntityPool(Thing)
+    things = [pool.spawn(name) for name in "abcd"]
+    pool.despawn(things[1])
+    assert sorted(thing.name for thing in pool) == ["a", "c", "d"]
+    assert all(pool[thing.index] is thing for thing in pool)
+    assert things[1].index == -1
+
+def test_capacity_and_clear():
+    pool = EntityPool(Thing, capacity=2)
+    assert pool.spawn("a") is not None
+    assert pool.spawn("b") is not None
+    assert pool.spawn("c") is None
+    records = list(pool)
+    pool.clear()
+    assert len(pool) == 0
+    assert all(record.index == -1 for record in records)
+    assert {pool.spawn("d"), pool.spawn("e")} == set(records)
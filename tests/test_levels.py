@@ -0,0 +1,86 @@
+import json
+import os
+
+import pytest
+
+from playpad.games.block_buster.levels import (LEVEL_SOURCE, PACK_HEADER, LevelError, LevelPack, parse_source,
+                                               write_pack)
+
+SOURCE = {
+    "legend": {"R": {"color": "RED"}, "2": {"color": [120, 120, 140], "hits": 2}},
+    "levels": [
+        {"name": "One", "rows": ["RR.R", ".22."]},
+        {"name": "Two", "rows": ["R"], "power_ups": {"multiball": 3, "expand": 1}, "power_up_chance": 0.5},
+        {"name": "Three", "rows": ["..2", "R.R"], "legend": {"R": {"color": "GREEN", "hits": 3}}},
+    ],
+}
+
+def write_source(path, data=SOURCE):
+    path.write_text(json.dumps(data))
+    return str(path)
+
+def test_compiled_levels_match_the_source(workdir):
+    source = write_source(workdir / "levels.json")
+    pack = LevelPack(str(workdir / "levels.pack"), source)
+    expected = parse_source(json.dumps(SOURCE))
+    assert len(pack) == 3
+    assert [pack.level(n) for n in (1, 2, 3)] == expected
+    assert pack.level(0) is None and pack.level(4) is None
+
+    one, two, three = expected
+    assert one.cols == 4
+    assert one.bricks == ((0, 0, (255, 0, 0), 1), (1, 0, (255, 0, 0), 1), (3, 0, (255, 0, 0), 1),
+                          (1, 1, (120, 120, 140), 2), (2, 1, (120, 120, 140), 2))
+    assert two.power_ups == (("multiball", 3), ("expand", 1)) and two.power_up_chance == 0.5
+    assert one.power_up_chance is None
+    assert (0, 1, (0, 255, 0), 3) in three.bricks
+
+def test_pack_is_rebuilt_when_the_source_changes(workdir):
+    source = write_source(workdir / "levels.json")
+    path = str(workdir / "levels.pack")
+    assert len(LevelPack(path, source)) == 3
+    write_source(workdir / "levels.json", {**SOURCE, "levels": SOURCE["levels"][:1]})
+    assert len(LevelPack(path, source)) == 1
+
+def test_prebuilt_pack_loads_without_a_source(workdir):
+    path = str(workdir / "levels.pack")
+    write_pack(parse_source(json.dumps(SOURCE)), path)
+    pack = LevelPack(path, cache_size=2)
+    assert pack.level(2).name == "Two"
+    for n in (1, 2, 3):
+        pack.level(n)
+    assert list(pack.cache) == [2, 3]
+
+def test_damaged_packs_fall_back_to_generated_levels(workdir):
+    path = workdir / "levels.pack"
+    write_pack(parse_source(json.dumps(SOURCE)), str(path))
+    data = path.read_bytes()
+    path.write_bytes(b"JUNK" + data[4:])
+    assert len(LevelPack(str(path))) == 0
+    path.write_bytes(data[:PACK_HEADER.size - 1])
+    assert len(LevelPack(str(path))) == 0
+
+    # The last level's grid, which ends just before its empty weight table, points past its palette
+    path.write_bytes(data[:-6] + b"\x09" + data[-5:])
+    pack = LevelPack(str(path))
+    assert len(pack) == 3
+    assert pack.level(3) is None
+    assert pack.level(1).name == "One"
+
+@pytest.mark.parametrize("data, message", [
+    ({"levels": [{"rows": ["X"]}]}, "not in the legend"),
+    ({"levels": [{"rows": ["..."]}]}, "no bricks"),
+    ({"levels": [{"rows": ["R" * 17]}], "legend": {"R": {"color": "RED"}}}, "at most"),
+    ({"levels": [{"rows": ["R"], "power_ups": {"laser": 1}}], "legend": {"R": {"color": "RED"}}}, "unknown power-up"),
+    ({"levels": [{"rows": ["R"]}], "legend": {"R": {"color": "MAUVE"}}}, "unknown color"),
+    ({"levels": [{"rows": ["R"], "speed": 2}], "legend": {"R": {"color": "RED"}}}, "unknown field"),
+])
+def test_invalid_sources_are_rejected(data, message):
+    with pytest.raises(LevelError, match=message):
+        parse_source(json.dumps(data))
+
+def test_shipped_levels_compile(workdir):
+    pack = LevelPack(str(workdir / "levels.pack"), LEVEL_SOURCE)
+    assert len(pack) > 0
+    assert all(pack.level(n).bricks for n in range(1, len(pack) + 1))
+    assert os.path.exists(workdir / "levels.pack")
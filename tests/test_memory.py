@@ -0,0 +1,30 @@
+from playpad.games.memory.scene import MemoryGame
+
+def mismatched_pair(game: MemoryGame) -> tuple:
+    first = game.cards[0]
+    second = next(i for i, card in enumerate(game.cards) if card.symbol != first.symbol)
+    return 0, second
+
+def test_flip_grows_the_card_then_settles():
+    game = MemoryGame()
+    game.flip_card(0)
+    progress = []
+    for _ in range(10):
+        game.update()
+        progress.append(round(game.cards[0].flip_progress, 1))
+    assert progress == [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
+    assert not game.animating
+
+def test_pending_hide_keeps_the_game_live():
+    game = MemoryGame()
+    for index in mismatched_pair(game):
+        game.flip_card(index)
+    for _ in range(10):
+        game.update()
+    game.particles.clear()
+    game.paused = True
+    assert game.hide_pending()
+    assert not game.is_static(True)
+    game.hide_selected()
+    assert not game.hide_pending()
+    assert game.is_static(True)
@@ -0,0 +1,61 @@
+import math
+
+import pygame
+import pytest
+
+from playpad.app import App
+from playpad.core import GameStates, pulsed
+from playpad.telemetry import telemetry
+
+@pytest.fixture
+def app():
+    app = App()
+    app.idle_wait = False
+    telemetry.events.clear()
+    return app
+
+def emitted(name: str) -> list:
+    return [fields for _, _, event, fields in telemetry.events if event == name]
+
+def test_scrambled_saga_timeout_ends_the_round_once(app):
+    app.launch("scrambled_saga")
+    game = app.scene("scrambled_saga").game
+    app.frame()
+    game.lives = 1
+    game.start_time -= 10 * game.time_limit
+    for _ in range(30):
+        app.frame()
+    assert len(emitted("game_end")) == 1
+    assert len(emitted("life_lost")) == 1
+    assert game.lives == 0
+    assert app.current_state == GameStates.MENU
+
+def test_escape_during_the_fade_out_does_not_end_the_round_again(app):
+    app.launch("block_buster")
+    app.frame()
+    for _ in range(3):
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, unicode="", mod=0, scancode=0))
+        app.frame()
+    assert len(emitted("game_end")) == 1
+
+def test_each_round_ends_once(app):
+    for _ in range(2):
+        app.launch("memory")
+        app.scene("memory").finish()
+        app.scene("memory").finish()
+        while app.transition_state is not None:
+            app.frame()
+    assert len(emitted("game_end")) == 2
+
+def test_menu_keys_follow_registry_order(app):
+    keys = {button["state"]: button.get("key") for button in app.scene(GameStates.MENU).buttons}
+    assert keys["memory"] == pygame.K_4
+    assert keys["snake_online"] == pygame.K_5
+
+def test_pulsed_titles_reuse_a_few_scaled_surfaces(app):
+    title = pygame.Surface((200, 40))
+    assert pulsed(title, 1.0) is title
+    assert pulsed(title, 1.004) is title
+    sizes = {pulsed(title, 1.0 + 0.1 * math.sin(i * 0.05)) for i in range(200)}
+    assert len(sizes) <= 11
+    assert pulsed(title, 1.1).get_size() == (220, 44)
@@ -0,0 +1,50 @@
+import asyncio
+import struct
+
+import pytest
+
+from playpad.games.snake.net import (HELLO, MSG_TURN, ProtocolError, SnakeServer, check_snapshot,
+                                     pack_frame, read_frame)
+
+def read(data, max_size=0xFFFF):
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return await read_frame(reader, max_size)
+    return asyncio.run(run())
+
+def test_read_frame_checks_the_length_prefix():
+    assert read(pack_frame(b"abc")) == b"abc"
+    with pytest.raises(ProtocolError):
+        read(struct.pack("!H", 0))
+    with pytest.raises(ProtocolError):
+        read(pack_frame(b"abcde"), max_size=2)
+
+def test_check_snapshot_rejects_truncated_payloads():
+    with pytest.raises(ProtocolError):
+        check_snapshot(b"")
+    with pytest.raises(ProtocolError):
+        check_snapshot(b"\x02")
+
+@pytest.mark.parametrize("frame", [struct.pack("!H", 0), pack_frame(b"\x02"), pack_frame(bytes([MSG_TURN, 1, 0]))])
+def test_server_drops_clients_sending_malformed_frames(frame):
+    async def run():
+        server = SnakeServer(port=0, min_players=8)
+        await server.start()
+        try:
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            await reader.readexactly(2 + HELLO.size)
+            writer.write(frame)
+            # The server hangs up on us instead of crashing the handler, read() returns at EOF
+            await asyncio.wait_for(reader.read(), 2)
+            assert reader.at_eof()
+            writer.close()
+            for _ in range(50):
+                if not server.writers:
+                    break
+                await asyncio.sleep(0.01)
+            assert not server.writers
+        finally:
+            await server.stop()
+    asyncio.run(run())
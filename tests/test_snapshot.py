@@ -0,0 +1,104 @@
+import struct
+from array import array
+
+import numpy as np
+import pytest
+
+from playpad.games.block_buster.scene import BlockBusterBonanza
+from playpad.games.memory.scene import MemoryGame
+from playpad.snapshot import (SnapshotError, SnapshotReader, SnapshotWriter, discard_snapshot, load_snapshot, lookup,
+                              save_snapshot)
+
+STATE = struct.Struct("<ihd?")
+
+def test_fields_round_trip():
+    writer = SnapshotWriter(b"TEST", 3)
+    writer.write(STATE, -7, 12, 0.25, True)
+    writer.write_str("héllo")
+    writer.write_array(array("h", [1, -2, 3]))
+    writer.write_records(STATE, [(1, 2, 3.0, False), (4, 5, 6.0, True)])
+    writer.write_ndarray(np.array([1.5, -2.5]))
+
+    reader = SnapshotReader(writer.getvalue(), b"TEST", 3)
+    assert reader.read(STATE) == (-7, 12, 0.25, True)
+    assert reader.read_str() == "héllo"
+    assert reader.read_array("h") == array("h", [1, -2, 3])
+    assert list(reader.read_records(STATE)) == [(1, 2, 3.0, False), (4, 5, 6.0, True)]
+    assert np.frombuffer(reader.read_items(8), dtype="<f8").tolist() == [1.5, -2.5]
+
+def test_other_versions_and_kinds_are_rejected():
+    data = SnapshotWriter(b"TEST", 3).getvalue()
+    with pytest.raises(SnapshotError, match="version 3"):
+        SnapshotReader(data, b"TEST", 4)
+    with pytest.raises(SnapshotError):
+        SnapshotReader(data, b"OTHR", 3)
+    with pytest.raises(SnapshotError):
+        SnapshotReader(b"JUNK" + data[4:], b"TEST", 3)
+
+def test_truncated_and_garbled_data_is_rejected():
+    writer = SnapshotWriter(b"TEST", 1)
+    writer.write(STATE, 1, 2, 3.0, False)
+    data = writer.getvalue()
+    with pytest.raises(SnapshotError):
+        SnapshotReader(data[:-1], b"TEST", 1).read(STATE)
+    with pytest.raises(SnapshotError):
+        SnapshotReader(data[:5], b"TEST", 1)
+
+    writer = SnapshotWriter(b"TEST", 1)
+    writer.parts.append(struct.pack("<H", 2) + b"\xff\xfe")
+    with pytest.raises(SnapshotError):
+        SnapshotReader(writer.getvalue(), b"TEST", 1).read_str()
+
+def test_lookup_checks_indices():
+    assert lookup(("a", "b"), 1, "thing") == "b"
+    with pytest.raises(SnapshotError):
+        lookup(("a", "b"), 2, "thing")
+
+def test_saves_are_written_and_discarded():
+    assert load_snapshot("game") is None
+    save_snapshot("game", b"data")
+    assert load_snapshot("game") == b"data"
+    discard_snapshot("game")
+    discard_snapshot("game")
+    assert load_snapshot("game") is None
+
+def test_block_buster_round_trip():
+    game = BlockBusterBonanza(arcade=True, levels=None)
+    game.score = 120
+    game.level = 2
+    game.create_blocks()
+    game.blocks.despawn(game.blocks[3])
+    game.power_ups.spawn(100, 200, "multiball")
+    for _ in range(5):
+        game.update()
+
+    restored = BlockBusterBonanza(levels=None)
+    restored.restore(game.snapshot())
+    n = game.balls.count
+    assert (restored.arcade, restored.level, restored.score, restored.lives) == (True, 2, 120, game.lives)
+    assert restored.balls.count == n
+    assert np.array_equal(restored.balls.x[:n], game.balls.x[:n])
+    assert np.array_equal(restored.balls.dy[:n], game.balls.dy[:n])
+    assert ([(b.x, b.y, b.color, b.hits) for b in restored.blocks] ==
+            [(b.x, b.y, b.color[:3], b.hits) for b in game.blocks])
+    assert [(p.x, p.y, p.type) for p in restored.power_ups] == [(p.x, p.y, p.type) for p in game.power_ups]
+
+def test_bad_power_up_kind_is_a_snapshot_error():
+    game = BlockBusterBonanza(levels=None)
+    game.power_ups.spawn(100, 200, "expand")
+    data = bytearray(game.snapshot())
+    # The power-up record is the last thing written: x, y, kind
+    data[-1] = 200
+    with pytest.raises(SnapshotError):
+        BlockBusterBonanza(levels=None).restore(bytes(data))
+
+def test_memory_round_trip():
+    game = MemoryGame()
+    game.set_difficulty(2)
+    game.flip_card(0)
+    restored = MemoryGame()
+    restored.restore(game.snapshot())
+    assert [card.symbol for card in restored.cards] == [card.symbol for card in game.cards]
+    assert restored.selected == [0]
+    assert restored.cards[0].face_up
+    assert (restored.difficulty, restored.level, restored.score) == (2, game.level, game.score)
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from playpad.tuning import Tuning, TuningConfig, TuningError, parse
+
+def test_empty_file_is_the_defaults():
+    assert parse("{}") == Tuning()
+
+def test_values_are_laid_over_the_defaults():
+    tuning = parse(json.dumps({"block_buster": {"power_up_ms": 8000, "difficulty": [{}, {"lives": 4}, {}]},
+                               "memory": {"levels": 3.0}}))
+    defaults = Tuning()
+    assert tuning.block_buster.power_up_ms == 8000
+    assert tuning.block_buster.difficulty[1].lives == 4
+    assert tuning.block_buster.difficulty[1].ball_speed == defaults.block_buster.difficulty[1].ball_speed
+    assert tuning.block_buster.difficulty[0] == defaults.block_buster.difficulty[0]
+    assert tuning.memory.levels == 3 and isinstance(tuning.memory.levels, int)
+    assert tuning.snake == defaults.snake
+
+@pytest.mark.parametrize("data, message", [
+    ({"pong": {}}, "unknown setting pong"),
+    ({"snake": {"speed": 3}}, "unknown setting speed"),
+    ({"snake": {"special_fruit_chance": 1.5}}, "outside"),
+    ({"snake": {"fruits_per_level": 0}}, "outside"),
+    ({"snake": {"fruit_points": -1}}, "outside"),
+    ({"snake": {"fruit_points": 2.5}}, "whole number"),
+    ({"snake": {"fruit_points": True}}, "expected a number"),
+    ({"snake": {"fruit_points": "10"}}, "expected a number"),
+    ({"snake": {"difficulty": [{}, {}]}}, "list of 3"),
+    ({"snake": []}, "expected an object"),
+])
+def test_invalid_values_are_rejected(data, message):
+    with pytest.raises(TuningError, match=message):
+        parse(json.dumps(data))
+
+def test_invalid_json_is_rejected():
+    with pytest.raises(TuningError, match="not valid JSON"):
+        parse("{")
+
+def test_reload_applies_valid_files_and_keeps_the_last_good_one(workdir):
+    path = workdir / "tuning.json"
+    config = TuningConfig(str(path))
+    path.write_text(json.dumps({"snake": {"fruit_points": 20}}))
+    assert config.reload()
+    assert config.current.snake.fruit_points == 20
+
+    path.write_text(json.dumps({"snake": {"fruit_points": -20, "padding": 0}}))
+    assert not config.reload()
+    assert config.current.snake.fruit_points == 20
+
+    path.unlink()
+    assert config.reload()
+    assert config.current == Tuning()